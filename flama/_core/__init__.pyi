@@ -1,3 +1,3 @@
-__all__ = ["compression", "cookies", "http", "json_encoder", "multipart", "route_table", "url"]
+__all__ = ["compression", "cookies", "http", "json_decoder", "json_encoder", "multipart", "route_table", "url"]
 
-from flama._core import compression, cookies, http, json_encoder, multipart, route_table, url
+from flama._core import compression, cookies, http, json_decoder, json_encoder, multipart, route_table, url
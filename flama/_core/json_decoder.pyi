@@ -0,0 +1,4 @@
+import typing as t
+
+def decode_json(content: bytes | str) -> t.Any: ...
+def raw_decode_json(content: str, pos: int = 0) -> tuple[t.Any, int]: ...
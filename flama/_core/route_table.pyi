@@ -11,7 +11,7 @@ class Resolution(enum.IntEnum):
     MethodNotAllowed = 2
 
 class RouteTable:
-    def __init__(self) -> None: ...
+    def __init__(self, cache_size: int = 256) -> None: ...
     def add_entry(
         self,
         matcher: PathMatcher,
@@ -21,4 +21,8 @@ class RouteTable:
     ) -> None: ...
     def resolve(
         self, path: str, scope_type: int, method: str
-    ) -> tuple[Resolution, int, tuple[str, ...], str | None, str | None] | tuple[Resolution, int, list[str]] | None: ...
+    ) -> (
+        tuple[Resolution, int, tuple[str, ...], str | None, str | None] | tuple[Resolution, int, tuple[str, ...]] | None
+    ): ...
+    def cache_info(self) -> tuple[int, int, int, int]: ...
+    def cache_clear(self) -> None: ...
@@ -27,8 +27,10 @@ except exceptions.DependencyNotInstalled:  # pragma: no cover
     FlamaWorker = None  # ty: ignore[invalid-assignment]
 
 if t.TYPE_CHECKING:
+    from flama.http import ResponseCache, ResponseETag
     from flama.middleware import Middleware
     from flama.modules import Module
+    from flama.schemas.validation import OutputValidation
 
 __all__ = ["Flama"]
 
@@ -63,6 +65,11 @@ class Flama(types.App):
         docs: str | None = "/docs/",
         schema_library: str | None = None,
         parent: "Flama | None" = None,
+        compiled_mounts: bool = False,
+        route_cache_size: int | None = None,
+        concurrent_injection: bool = False,
+        output_validation: "OutputValidation | None" = None,
+        etag: "ResponseETag | None" = None,
     ) -> None:
         """Flama application.
 
@@ -78,17 +85,23 @@ class Flama(types.App):
         :param docs: Docs endpoint path.
         :param schema_library: Schema library to use.
         :param parent: Parent app.
+        :param compiled_mounts: Resolve the routes of nested Flama apps from a single route table once ready.
+        :param route_cache_size: Maximum number of path resolutions cached by the router, 0 disables the cache.
+        :param concurrent_injection: Resolve independent async components of a handler concurrently.
+        :param output_validation: Policy for validating the output of the HTTP routes that don't define their own.
+        :param etag: Entity tags for the responses of the HTTP routes that don't define their own.
         """
         self._debug = debug
         self._status = types.AppStatus.NOT_STARTED
         self._shutdown = False
 
+        # Create Dependency Injector
+        self._injector = injection.Injector(Context, concurrent=concurrent_injection)
+        self._injector_version = -1
+
         # Sets parent app
         self.parent = parent
 
-        # Create Dependency Injector
-        self._injector = injection.Injector(Context)
-
         # Initialise components
         default_components = []
 
@@ -107,7 +120,12 @@ class Flama(types.App):
 
         # Initialize router
         self.app = self.router = routing.Router(
-            routes=routes, components=[*default_components, *(components or [])], lifespan=lifespan, app=self
+            routes=routes,
+            components=[*default_components, *(components or [])],
+            lifespan=lifespan,
+            app=self,
+            compiled_mounts=compiled_mounts,
+            route_cache_size=route_cache_size,
         )
 
         # Build middleware stack
@@ -128,6 +146,12 @@ class Flama(types.App):
         # Reference to paginator from within app
         self.paginator = paginator
 
+        # Output validation policy for the routes that don't define their own
+        self.output_validation = output_validation
+
+        # Entity tags for the responses of the routes that don't define their own
+        self.etag = etag
+
     def __getattr__(self, item: str) -> t.Any:
         """Retrieve a module by its name.
 
@@ -168,6 +192,20 @@ class Flama(types.App):
         with threading.Lock():
             self._status = s
 
+    @property
+    def parent(self) -> "Flama | None":
+        """Parent app, whose components are available for this application too.
+
+        :return: Parent app.
+        """
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent: "Flama | None") -> None:
+        # The components of this app and its children change along with the parent.
+        routing.Router._components_version += 1
+        self._parent = parent
+
     @property
     def components(self) -> injection.Components:
         """List of available components for this application.
@@ -202,6 +240,9 @@ class Flama(types.App):
         route: routing.Route | None = None,
         pagination: types.Pagination | None = None,
         tags: dict[str, t.Any] | None = None,
+        cache: "ResponseCache | None" = None,
+        output_validation: "OutputValidation | None" = None,
+        etag: "ResponseETag | None" = None,
     ) -> routing.Route:
         """Register a new HTTP route or endpoint under given path.
 
@@ -213,6 +254,9 @@ class Flama(types.App):
         :param route: HTTP route.
         :param pagination: Apply a pagination technique.
         :param tags: Tags to add to the route.
+        :param cache: Cache for the responses of the route.
+        :param output_validation: Policy for validating the output of the route.
+        :param etag: Entity tags for the responses of the route.
         """
         return self.router.add_route(
             path,
@@ -223,6 +267,9 @@ class Flama(types.App):
             route=route,
             pagination=pagination,
             tags=tags,
+            cache=cache,
+            output_validation=output_validation,
+            etag=etag,
         )
 
     def route(
@@ -234,6 +281,9 @@ class Flama(types.App):
         include_in_schema: bool = True,
         pagination: types.Pagination | None = None,
         tags: dict[str, t.Any] | None = None,
+        cache: "ResponseCache | None" = None,
+        output_validation: "OutputValidation | None" = None,
+        etag: "ResponseETag | None" = None,
     ) -> t.Callable[[types.HTTPHandler], types.HTTPHandler]:
         """Decorator version for registering a new HTTP route in this router under given path.
 
@@ -243,10 +293,21 @@ class Flama(types.App):
         :param include_in_schema: True if this route or endpoint should be declared as part of the API schema.
         :param pagination: Apply a pagination technique.
         :param tags: Tags to add to the route.
+        :param cache: Cache for the responses of the route.
+        :param output_validation: Policy for validating the output of the route.
+        :param etag: Entity tags for the responses of the route.
         :return: Decorated route.
         """
         return self.router.route(
-            path, methods=methods, name=name, include_in_schema=include_in_schema, pagination=pagination, tags=tags
+            path,
+            methods=methods,
+            name=name,
+            include_in_schema=include_in_schema,
+            pagination=pagination,
+            tags=tags,
+            cache=cache,
+            output_validation=output_validation,
+            etag=etag,
         )
 
     def add_websocket_route(
@@ -312,13 +373,18 @@ class Flama(types.App):
     def injector(self) -> injection.Injector:
         """Components dependency injector.
 
+        Its components are only gathered again when the components of any router or the parent of any app change.
+
         :return: Injector instance.
         """
-        components = injection.Components(
-            self.components + HTTP_COMPONENTS + VALIDATION_COMPONENTS + JSONRPC_COMPONENTS + MCP_COMPONENTS
-        )
-        if self._injector.components != components:
-            self._injector.components = components
+        if self._injector_version != (version := routing.Router._components_version):
+            components = injection.Components(
+                self.components + HTTP_COMPONENTS + VALIDATION_COMPONENTS + JSONRPC_COMPONENTS + MCP_COMPONENTS
+            )
+            if self._injector.components != components:
+                self._injector.components = components
+            self._injector_version = version
+
         return self._injector
 
     def add_event_handler(self, event: str, func: t.Callable) -> None:
@@ -21,9 +21,7 @@ class BrotliCodec(CompressionCodec):
     def spawn(self) -> "BrotliCodec":
         return BrotliCodec(quality=self._quality, lgwin=self._lgwin)
 
-    async def decode(self, item: tuple[bytes, bool], **options) -> bytes:
-        body, finish = item
-
+    def compress(self, body: bytes, finish: bool) -> bytes:
         if self._compressor is None:
             self._compressor = Compressor("brotli", quality=self._quality, lgwin=self._lgwin)
 
@@ -17,3 +17,18 @@ class CompressionCodec(Codec[tuple[bytes, bool], bytes]):
         concurrent streams. The negotiator calls this per request to hand out isolated state.
         """
         ...
+
+    @abc.abstractmethod
+    def compress(self, body: bytes, finish: bool) -> bytes:
+        """Compress the next chunk of a body.
+
+        Compression does not wait on anything, so it can be run as is from a worker thread.
+
+        :param body: Chunk of the body.
+        :param finish: Whether this is the last chunk, flushing the compressor.
+        :return: Compressed chunk.
+        """
+        ...
+
+    async def decode(self, item: tuple[bytes, bool], **options) -> bytes:
+        return self.compress(*item)
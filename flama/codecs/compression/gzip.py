@@ -19,9 +19,7 @@ class GzipCodec(CompressionCodec):
     def spawn(self) -> "GzipCodec":
         return GzipCodec(level=self._level)
 
-    async def decode(self, item: tuple[bytes, bool], **options) -> bytes:
-        body, finish = item
-
+    def compress(self, body: bytes, finish: bool) -> bytes:
         if self._compressor is None:
             self._compressor = Compressor("gzip", level=self._level)
 
@@ -1,5 +1,6 @@
 from flama.codecs.http.codec import *  # noqa
 from flama.codecs.http.jsondata import *  # noqa
 from flama.codecs.http.multipart import *  # noqa
+from flama.codecs.http.ndjsondata import *  # noqa
 from flama.codecs.http.negotiator import *  # noqa
 from flama.codecs.http.urlencoded import *  # noqa
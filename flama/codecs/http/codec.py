@@ -8,3 +8,4 @@ __all__ = ["HTTPCodec"]
 
 class HTTPCodec(Codec[Request, dict[str, t.Any] | None]):
     media_type: str | None = None
+    media_type_aliases: t.ClassVar[frozenset[str]] = frozenset()
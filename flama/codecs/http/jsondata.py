@@ -1,6 +1,7 @@
 import typing as t
 
 from flama import exceptions
+from flama._core.json_decoder import decode_json
 from flama.codecs.http.codec import HTTPCodec
 
 if t.TYPE_CHECKING:
@@ -21,3 +22,17 @@ class JSONDataCodec(HTTPCodec):
             return await item.json()
         except ValueError as exc:
             raise exceptions.DecodeError(f"Malformed JSON. {exc}") from None
+
+    def loads(self, body: bytes) -> dict[str, t.Any] | None:
+        """Decode a raw JSON body.
+
+        :param body: Raw body.
+        :return: Decoded body.
+        """
+        try:
+            if body == b"":
+                return None
+
+            return decode_json(body)
+        except ValueError as exc:
+            raise exceptions.DecodeError(f"Malformed JSON. {exc}") from None
@@ -0,0 +1,41 @@
+import typing as t
+
+from flama import exceptions
+from flama.codecs.http.codec import HTTPCodec
+
+if t.TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from flama.http import Request
+
+__all__ = ["NDJSONDataCodec"]
+
+
+class NDJSONDataCodec(HTTPCodec):
+    media_type = "application/x-ndjson"
+    media_type_aliases = frozenset({"application/ndjson"})
+    format = "ndjson"
+
+    async def decode(self, item: "Request", **options) -> list[t.Any] | None:  # type: ignore[override]
+        """Decode the whole body into the list of its lines.
+
+        Every line is kept in the list, so memory grows with the body. Use :meth:`items`, or
+        :meth:`flama.http.Request.json_items` along with :meth:`flama.schemas.Schema.validate_stream`, to ingest large
+        bodies in bounded memory.
+
+        :param item: Request.
+        :return: Decoded lines.
+        """
+        return [x async for x in self.items(item)] or None
+
+    async def items(self, item: "Request") -> "AsyncIterator[t.Any]":
+        """Decode the body line by line as it arrives.
+
+        :param item: Request.
+        :return: Decoded lines.
+        """
+        try:
+            async for value in item.json_items():
+                yield value
+        except ValueError as exc:
+            raise exceptions.DecodeError(f"Malformed JSON. {exc}") from None
@@ -26,7 +26,7 @@ class HTTPContentTypeNegotiator(Negotiator[HTTPCodec]):
         wildcard_type = "*/*"
 
         for codec in self.codecs:
-            if codec.media_type in (value, main_type, wildcard_type):
+            if codec.media_type in (value, main_type, wildcard_type) or value in codec.media_type_aliases:
                 return codec
 
         raise exceptions.NoCodecAvailable(f"Unsupported media in Content-Type header '{value}'")
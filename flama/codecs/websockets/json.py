@@ -1,6 +1,7 @@
 import json
 
 from flama import exceptions, types
+from flama._core.json_decoder import decode_json
 from flama.codecs.websockets.codec import WebsocketsCodec
 
 __all__ = ["JSONCodec"]
@@ -16,6 +17,6 @@ class JSONCodec(WebsocketsCodec):
             text = item["bytes"].decode("utf-8")
 
         try:
-            return json.loads(text)
+            return decode_json(text)
         except json.decoder.JSONDecodeError:
             raise exceptions.DecodeError("Malformed JSON data received")
@@ -15,6 +15,7 @@ __all__ = [
     "iterate",
     "is_async",
     "run",
+    "run_io",
     "run_in_executor",
     "run_task_group",
     "AsyncProcess",
@@ -27,52 +28,97 @@ T = t.TypeVar("T")
 P = t.ParamSpec("P")
 
 
+@functools.cache
+def _io_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Thread pool of :func:`run_io`, so disk reads never queue behind the work sent to :func:`run`."""
+    return concurrent.futures.ThreadPoolExecutor(thread_name_prefix="flama-io")
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no cover
+    # Worker threads do not survive a fork, so a child process starts a pool of its own.
+    os.register_at_fork(after_in_child=_io_executor.cache_clear)
+
+
+def _open_file(path: "str | os.PathLike[str]", offset: int) -> t.BinaryIO:
+    """Open a file unbuffered, so every read is a single system call straight into the returned bytes.
+
+    :param path: File path.
+    :param offset: Byte offset to position the file at.
+    :return: File object.
+    """
+    f = t.cast(t.BinaryIO, open(path, "rb", buffering=0))
+    if offset:
+        f.seek(offset)
+    return f
+
+
 class FileReader:
     """Async iterator that streams file content in chunks via a background producer task.
 
-    A bounded :class:`asyncio.Queue` bridges the producer (reading via :func:`asyncio.to_thread`)
+    An :class:`asyncio.Queue` bridges the producer (reading on a thread pool dedicated to file I/O)
     with the async consumer, allowing disk reads to overlap with ASGI sends.  While the consumer
-    is forwarding chunk *N* to the client, the producer can already be reading chunk *N+1*.
+    is forwarding chunk *N* to the client, the producer can already be reading ahead, up to ``read_ahead`` bytes
+    queued or one chunk if it is larger, so a slow client holds a bounded amount of memory whatever the chunk size.
+
+    Chunks are ``chunk_size`` bytes long unless ``max_chunk_size`` is given, in which case every chunk doubles the
+    size of the previous one up to it. Small files and ranges are then served by a single small read, whereas large
+    ones take few thread round trips and few sends.
 
     A ``None`` sentinel signals end-of-stream.  Call :meth:`aclose` to cancel the producer early;
     ``async for`` does **not** call it automatically on plain async iterators, so callers must
     wrap usage in ``try/finally``.
 
     :param path: File path to read.
-    :param chunk_size: Maximum bytes per chunk.
+    :param chunk_size: Maximum bytes per chunk, or bytes of the first chunk if ``max_chunk_size`` is given.
     :param start: Byte offset to start reading from.
     :param end: Byte offset to stop reading at (exclusive). ``None`` reads to EOF.
+    :param max_chunk_size: Maximum bytes per chunk as chunks grow.
     """
 
+    read_ahead = 256 * 1024
+
     def __init__(
-        self, path: "str | os.PathLike[str]", chunk_size: int, start: int | None = None, end: int | None = None
+        self,
+        path: "str | os.PathLike[str]",
+        chunk_size: int,
+        start: int | None = None,
+        end: int | None = None,
+        *,
+        max_chunk_size: int | None = None,
     ) -> None:
         self._path = path
         self._chunk_size = chunk_size
+        self._max_chunk_size = max(max_chunk_size or chunk_size, chunk_size)
         self._start = start if start is not None else 0
         self._end = end
-        self._queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=1)
+        self._queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+        self._queued = 0
+        self._consumed = asyncio.Event()
         self._task: asyncio.Task[None] | None = None
 
     async def _reader(self) -> None:
-        f = t.cast(t.BinaryIO, await asyncio.to_thread(open, self._path, "rb"))
+        f = await run_io(_open_file, self._path, self._start)
         try:
-            if self._start:
-                await asyncio.to_thread(f.seek, self._start)
             remaining = self._end - self._start if self._end is not None else None
+            size = self._chunk_size
             while True:
-                read_size = min(self._chunk_size, remaining) if remaining is not None else self._chunk_size
-                chunk = await asyncio.to_thread(f.read, read_size)
+                read_size = min(size, remaining) if remaining is not None else size
+                while self._queued and self._queued + read_size > self.read_ahead:
+                    self._consumed.clear()
+                    await self._consumed.wait()
+                chunk = await run_io(f.read, read_size)
                 if not chunk:
                     break
-                await self._queue.put(chunk)
+                self._queued += len(chunk)
+                self._queue.put_nowait(chunk)
                 if remaining is not None:
                     remaining -= len(chunk)
                     if remaining <= 0:
                         break
+                size = min(size * 2, self._max_chunk_size)
         finally:
-            await asyncio.to_thread(f.close)
-            await self._queue.put(None)
+            await run_io(f.close)
+            self._queue.put_nowait(None)
 
     def __aiter__(self) -> "FileReader":
         self._task = asyncio.create_task(self._reader())
@@ -82,6 +128,8 @@ class FileReader:
         if (chunk := await self._queue.get()) is None:
             raise StopAsyncIteration
 
+        self._queued -= len(chunk)
+        self._consumed.set()
         return chunk
 
     async def aclose(self) -> None:
@@ -230,6 +278,25 @@ async def run(
     return await run_in_executor(None, func, *args, **kwargs)
 
 
+async def run_io(
+    func: t.Callable[P, R] | t.Callable[P, t.Awaitable[R]],
+    /,
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> R:
+    """Run *func* on the thread pool dedicated to file I/O, awaiting its result.
+
+    Same as :func:`run`, but disk reads and lookups do not queue behind the CPU-bound or long-running work sent to the
+    default thread pool.
+
+    :param func: Function to run.
+    :param args: Positional arguments.
+    :param kwargs: Keyword arguments.
+    :return: Function returned value.
+    """
+    return await run_in_executor(_io_executor(), func, *args, **kwargs)
+
+
 async def run_in_executor(
     executor: concurrent.futures.Executor | None,
     func: t.Callable[P, R] | t.Callable[P, t.Awaitable[R]],
@@ -1,3 +1,5 @@
+from flama.http.cache import *  # noqa
 from flama.http.data_structures import *  # noqa
 from flama.http.requests import *  # noqa
 from flama.http.responses import *  # noqa
+from flama.http.static import *  # noqa
@@ -0,0 +1,328 @@
+import asyncio
+import collections
+import dataclasses
+import hashlib
+import logging
+import time
+import typing as t
+
+from flama import types
+from flama.http.data_structures import Headers, QueryParams
+from flama.http.responses.response import BufferedResponse, Response
+
+__all__ = ["ResponseCache", "ResponseETag", "etag_matches", "generate_etag"]
+
+logger = logging.getLogger(__name__)
+
+
+def generate_etag(body: bytes, *, weak: bool = False) -> str:
+    """Generate an entity tag for given response body.
+
+    :param body: Response body.
+    :param weak: Generate a weak entity tag.
+    :return: Quoted entity tag.
+    """
+    etag = f'"{hashlib.sha1(body, usedforsecurity=False).hexdigest()}"'
+    return f"W/{etag}" if weak else etag
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check if an entity tag fulfils an ``If-None-Match`` header, using the weak comparison of RFC 9110.
+
+    :param if_none_match: Value of the ``If-None-Match`` header.
+    :param etag: Entity tag of the current representation.
+    :return: True if the client representation is still valid.
+    """
+    if if_none_match.strip() == "*":
+        return True
+
+    etag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+class _NotModifiedResponse(Response):
+    """A ``304 Not Modified`` response replacing a buffered one, keeping its headers but not its body."""
+
+    def __init__(self, response: Response) -> None:
+        super().__init__(status_code=304, background=response.background)
+        self.raw_headers = [(k, v) for k, v in response.raw_headers if k not in (b"content-length", b"content-type")]
+
+    async def _send_response(self, scope: types.Scope, receive: types.Receive, send: types.Send) -> None:
+        await send(types.Message({"type": "http.response.start", "status": 304, "headers": self.raw_headers}))
+        await send(types.Message({"type": "http.response.body", "body": b""}))
+
+
+class ResponseETag:
+    methods: t.ClassVar[frozenset[str]] = frozenset({"GET", "HEAD"})
+
+    def __init__(self, *, weak: bool = False) -> None:
+        """Entity tags for the responses of an HTTP route.
+
+        The rendered body of every buffered response with a 200 status code to a ``GET`` or ``HEAD`` request is hashed
+        into an ``ETag`` header, unless the response already has one. Requests whose ``If-None-Match`` header still
+        matches the tag, either generated or set by the endpoint, are answered with ``304 Not Modified`` and no body, so
+        clients polling a resource that did not change are not sent the same body again. The endpoint is still called to
+        render the body.
+
+        :param weak: Generate weak entity tags.
+        """
+        self.weak = weak
+
+    def __call__(self, response: Response, scope: types.Scope) -> Response:
+        """Tag a response, or replace it with a ``304 Not Modified`` one if the client representation is still valid.
+
+        :param response: Response.
+        :param scope: ASGI scope.
+        :return: The tagged response, or a ``304 Not Modified`` one.
+        """
+        if (
+            scope["method"] not in self.methods
+            or not isinstance(response, BufferedResponse)
+            or response.status_code != 200
+        ):
+            return response
+
+        if (etag := response.headers.get("etag")) is None:
+            etag = response.headers["etag"] = generate_etag(response.body, weak=self.weak)
+
+        if (if_none_match := Headers(scope=scope).get("if-none-match")) and etag_matches(if_none_match, etag):
+            return _NotModifiedResponse(response)
+
+        return response
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _CachedResponse:
+    """A rendered response stored in the cache.
+
+    :param status_code: Status code.
+    :param headers: Raw headers, including the entity tag.
+    :param body: Rendered body.
+    :param etag: Entity tag.
+    :param expires: Monotonic time when the response stops being fresh.
+    :param stale_until: Monotonic time when the response cannot be served even while revalidating it.
+    """
+
+    status_code: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+    etag: str
+    expires: float
+    stale_until: float
+
+    async def send(self, scope: types.Scope, send: types.Send) -> None:
+        """Send this response, or a ``304 Not Modified`` one if the client representation is still valid.
+
+        :param scope: ASGI scope.
+        :param send: ASGI send.
+        """
+        if (if_none_match := Headers(scope=scope).get("if-none-match")) and etag_matches(if_none_match, self.etag):
+            headers = [(k, v) for k, v in self.headers if k not in (b"content-length", b"content-type")]
+            await send(types.Message({"type": "http.response.start", "status": 304, "headers": headers}))
+            await send(types.Message({"type": "http.response.body", "body": b""}))
+            return
+
+        await send(types.Message({"type": "http.response.start", "status": self.status_code, "headers": self.headers}))
+        await send(types.Message({"type": "http.response.body", "body": self.body}))
+
+
+class ResponseCache:
+    methods: t.ClassVar[frozenset[str]] = frozenset({"GET", "HEAD"})
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        *,
+        vary: t.Sequence[str] = (),
+        max_size: int = 1024,
+        stale_while_revalidate: float = 0.0,
+    ) -> None:
+        """An in-process cache for the responses of an HTTP route.
+
+        Rendered bodies of buffered responses to ``GET`` and ``HEAD`` requests are stored in a LRU cache, keyed by the
+        path, the sorted query params and the values of the ``vary`` headers. While a response is fresh, requests are
+        served from the cache without running the route endpoint, so neither injection nor the handler are executed.
+        Cached responses carry an ``ETag`` header, and requests whose ``If-None-Match`` header still matches it are
+        answered with ``304 Not Modified``.
+
+        Once a response expires, it can still be served for ``stale_while_revalidate`` seconds, while the endpoint is
+        called again in a background task to refresh the cache, so the request is not held until it finishes.
+
+        Only complete responses with a 200 status code and without cookies are stored.
+
+        :param ttl: Seconds a response is fresh.
+        :param vary: Request headers that select different responses.
+        :param max_size: Maximum number of responses stored.
+        :param stale_while_revalidate: Seconds an expired response can be served while revalidating it.
+        """
+        self.ttl = ttl
+        self.vary = tuple(sorted({x.lower() for x in vary}))
+        self.max_size = max_size
+        self.stale_while_revalidate = stale_while_revalidate
+        self._responses: collections.OrderedDict[t.Hashable, _CachedResponse] = collections.OrderedDict()
+        self._revalidating: set[t.Hashable] = set()
+        self._tasks: set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def key(self, scope: types.Scope) -> t.Hashable:
+        """Build the cache key of a request.
+
+        :param scope: ASGI scope.
+        :return: Cache key.
+        """
+        headers = Headers(scope=scope) if self.vary else None
+        return (
+            scope.get("root_path", "").rstrip("/") + scope["path"],
+            tuple(sorted(QueryParams(scope.get("query_string", b"")).multi_items())),
+            tuple(",".join(headers.get_values(x)) for x in self.vary) if headers is not None else (),
+        )
+
+    def get(self, key: t.Hashable) -> _CachedResponse | None:
+        """Look for a stored response, discarding it if it cannot be served anymore.
+
+        :param key: Cache key.
+        :return: Stored response.
+        """
+        if (response := self._responses.get(key)) is None:
+            return None
+
+        if response.stale_until <= time.monotonic():
+            del self._responses[key]
+            return None
+
+        self._responses.move_to_end(key)
+        return response
+
+    def set(self, key: t.Hashable, response: _CachedResponse) -> None:
+        """Store a response, evicting the least recently used one if the cache is full.
+
+        :param key: Cache key.
+        :param response: Response.
+        """
+        self._responses[key] = response
+        self._responses.move_to_end(key)
+
+        while len(self._responses) > self.max_size:
+            self._responses.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all stored responses."""
+        self._responses.clear()
+
+    async def __call__(self, app: types.ASGIApp, scope: types.Scope, receive: types.Receive, send: types.Send) -> None:
+        """Performs a request through the cache.
+
+        :param app: ASGI app producing the responses.
+        :param scope: ASGI scope.
+        :param receive: ASGI receive.
+        :param send: ASGI send.
+        """
+        if scope["method"] not in self.methods:
+            await app(scope, receive, send)
+            return
+
+        key = self.key(scope)
+
+        if (cached := self.get(key)) is None:
+            await app(scope, receive, self._store(key, scope, send))
+            return
+
+        await cached.send(scope, send)
+
+        if cached.expires <= time.monotonic() and key not in self._revalidating:
+            self._revalidating.add(key)
+            # Keep a reference to the task, so it is not garbage collected before it finishes.
+            task = asyncio.create_task(self._revalidate(app, types.Scope({**scope}), key))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _revalidate(self, app: types.ASGIApp, scope: types.Scope, key: t.Hashable) -> None:
+        """Call the endpoint again to refresh a stale response, storing the new response without sending it.
+
+        The request is already finished, so the endpoint receives an empty body.
+
+        :param app: ASGI app producing the responses.
+        :param scope: ASGI scope.
+        :param key: Cache key.
+        """
+        messages = iter([types.Message({"type": "http.request", "body": b"", "more_body": False})])
+
+        async def receive() -> types.Message:
+            return next(messages, types.Message({"type": "http.disconnect"}))
+
+        logger.debug("Revalidating stale response for '%s'", scope["path"])
+        try:
+            await app(scope, receive, self._store(key, scope, None))
+        except Exception:
+            logger.exception("Cannot revalidate stale response for '%s'", scope["path"])
+        finally:
+            self._revalidating.discard(key)
+
+    def _store(self, key: t.Hashable, scope: types.Scope, send: types.Send | None) -> types.Send:
+        """Build an ASGI send that stores the response being sent and serves it through the cache.
+
+        The start of the response is held until the body is known. Complete responses are cached, if possible, and
+        sent along with their entity tag, while streamed ones are forwarded as they are.
+
+        :param key: Cache key.
+        :param scope: ASGI scope.
+        :param send: ASGI send, or None to just store the response.
+        :return: ASGI send.
+        """
+        start: types.Message | None = None
+
+        async def _send(message: types.Message) -> None:
+            nonlocal start
+
+            if message["type"] == "http.response.start":
+                start = message
+                return
+
+            if start is not None and message["type"] == "http.response.body" and not message.get("more_body", False):
+                if (response := self._build(start, message.get("body", b""))) is not None:
+                    start = None
+                    self.set(key, response)
+                    if send is not None:
+                        await response.send(scope, send)
+                    return
+
+            if send is None:
+                return
+
+            if start is not None:
+                await send(start)
+                start = None
+
+            await send(message)
+
+        return _send
+
+    def _build(self, start: types.Message, body: bytes) -> _CachedResponse | None:
+        """Build the cached version of a complete response.
+
+        :param start: Response start message.
+        :param body: Response body.
+        :return: The cached response, or None if it cannot be cached.
+        """
+        headers = list(start.get("headers", []))
+        if start["status"] != 200 or any(k.lower() == b"set-cookie" for k, _ in headers):
+            return None
+
+        if (etag := next((v.decode("latin-1") for k, v in headers if k.lower() == b"etag"), None)) is None:
+            etag = generate_etag(body)
+            headers.append((b"etag", etag.encode("latin-1")))
+
+        if self.vary:
+            headers.append((b"vary", ", ".join(self.vary).encode("latin-1")))
+
+        now = time.monotonic()
+        return _CachedResponse(
+            status_code=start["status"],
+            headers=headers,
+            body=body,
+            etag=etag,
+            expires=now + self.ttl,
+            stale_until=now + self.ttl + self.stale_while_revalidate,
+        )
@@ -67,6 +67,10 @@ class PathComponent(Component):
 
 class PathParamsComponent(Component):
     def resolve(self, scope: types.Scope, route: routing.BaseRoute) -> types.PathParams:
+        resolved: routing.ResolvedRoute | None = scope.get(routing.ResolvedRoute.SCOPE_KEY)
+        if resolved is not None and resolved.route is route and resolved.key == routing.ResolvedRoute.scope_key(scope):
+            return types.PathParams(resolved.path_params)
+
         return types.PathParams(route.path.match(scope["path"]).parameters or {})
 
 
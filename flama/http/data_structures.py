@@ -1,13 +1,17 @@
+import codecs
 import contextlib
 import enum
 import io
+import json
 import os
+import re
 import typing as t
 import warnings
 from collections.abc import Mapping
 from urllib.parse import urlencode
 
 from flama import exceptions
+from flama._core.json_decoder import decode_json, raw_decode_json
 from flama._core.multipart import parse_multipart, parse_urlencoded
 
 __all__ = [
@@ -18,6 +22,7 @@ __all__ = [
     "QueryParams",
     "UploadFile",
     "FormData",
+    "JSONItemsDecoder",
     "WebSocketStatus",
     "JSONRPC_VERSION",
     "JSONRPCStatus",
@@ -486,6 +491,162 @@ class FormData(_MultiDict[str, "str | UploadFile"]):
         )
 
 
+class JSONItemsDecoder:
+    """Incremental decoder of the items of a UTF-8 JSON document received in chunks.
+
+    The items of a JSON array are its elements, and those of newline-delimited JSON are its non-blank lines. Any other
+    JSON document is a single item. Every item is decoded as soon as it is complete, so only the one being received is
+    held in memory.
+
+    Every item is decoded by the native JSON decoder. An item cut by the end of a chunk is not decoded again until the
+    data received since it started has doubled, so an item split across many chunks is decoded a logarithmic number of
+    times instead of once per chunk.
+
+    :param lines: Whether the document is newline-delimited JSON.
+    """
+
+    _whitespace = re.compile(rb"[ \t\n\r]*")
+    # Ends of a document that more data could still complete: a number or a literal being received.
+    _partial = re.compile(
+        rb"[-+.0-9eE]*|t(?:r(?:ue?)?)?|f(?:a(?:l(?:se?)?)?)?|n(?:u(?:ll?)?)?|N(?:aN?)?"
+        rb"|-?I(?:n(?:f(?:i(?:n(?:i(?:ty?)?)?)?)?)?)?"
+    )
+
+    def __init__(self, *, lines: bool = False) -> None:
+        self.lines = lines
+        self._buffer = bytearray()
+        self._array: bool | None = None
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._text: list[str] = []
+        self._size = 0
+        self._retry_size = 0
+        self._offset = 0
+        self._state: t.Literal["open", "first", "value", "separator", "closed"] = "open"
+
+    def feed(self, chunk: bytes) -> list[t.Any]:
+        """Feed the next chunk of the document.
+
+        :param chunk: Chunk of the document.
+        :return: Items completed by the chunk.
+        :raises ValueError: If the document is not valid JSON.
+        """
+        if self.lines:
+            self._buffer += chunk
+            end = chunk.rfind(b"\n")
+            return self._decode_lines(len(self._buffer) - len(chunk) + end + 1) if end >= 0 else []
+
+        if self._array is None:
+            self._buffer += chunk
+            if not (document := self._buffer.lstrip()):
+                return []
+
+            # Anything but an array is a single item, decoded as a whole once the document ends.
+            self._array = document[:1] == b"["
+            chunk, self._buffer = bytes(self._buffer), bytearray()
+
+        if not self._array:
+            self._buffer += chunk
+            return []
+
+        self._append(self._decoder.decode(chunk))
+        if self._size < self._retry_size:
+            return []
+
+        return self._decode_array()
+
+    def close(self) -> list[t.Any]:
+        """Signal the end of the document.
+
+        :return: Items completed by the end of the document.
+        :raises ValueError: If the document is not valid JSON.
+        """
+        if self.lines:
+            return self._decode_lines(len(self._buffer))
+
+        if self._array is None:
+            return []
+
+        if not self._array:
+            return [decode_json(bytes(self._buffer))]
+
+        self._append(self._decoder.decode(b"", final=True))
+        items = self._decode_array(final=True)
+
+        if self._state != "closed":
+            raise ValueError(f"Unterminated JSON array (char {self._offset + self._size})")
+
+        return items
+
+    def _decode_lines(self, end: int) -> list[t.Any]:
+        lines = self._buffer[:end].split(b"\n")
+        del self._buffer[:end]
+        return [decode_json(bytes(line)) for line in lines if line.strip()]
+
+    def _append(self, text: str) -> None:
+        if text:
+            self._text.append(text)
+            self._size += len(text)
+
+    def _decode_array(self, *, final: bool = False) -> list[t.Any]:
+        # The native decoder takes offsets into the UTF-8 view of the text, so the text is scanned as UTF-8 too.
+        text = "".join(self._text)
+        data, pos = text.encode(), 0
+        items: list[t.Any] = []
+
+        while (pos := self._whitespace.match(data, pos).end()) < len(data):
+            if self._state == "closed":
+                raise ValueError(f"Extra data (char {self._char(data, pos)})")
+
+            if self._state == "open":
+                self._state = "first"
+                pos += 1
+            elif self._state == "separator":
+                if data[pos] not in b",]":
+                    raise ValueError(f"Expecting ',' delimiter (char {self._char(data, pos)})")
+
+                self._state = "value" if data[pos] == ord(",") else "closed"
+                pos += 1
+            elif self._state == "first" and data[pos] == ord("]"):
+                self._state = "closed"
+                pos += 1
+            else:
+                try:
+                    item, end = raw_decode_json(text, pos)
+                except json.JSONDecodeError as exc:
+                    if not final and self._truncated(text, exc):
+                        break
+
+                    raise ValueError(f"{exc.msg} (char {self._offset + exc.pos})") from None
+
+                # A number can go on in the next chunk.
+                if not final and self._partial.fullmatch(data, end):
+                    break
+
+                items.append(item)
+                self._state = "separator"
+                pos = end
+
+        # Anything left is the beginning of an item, so it is not decoded again until it doubles.
+        rest = data[pos:].decode()
+        self._text = [rest] if rest else []
+        self._size = len(rest)
+        self._retry_size = 2 * self._size
+        self._offset += len(text) - len(rest)
+        return items
+
+    def _char(self, data: bytes, pos: int) -> int:
+        """Position in the document of the character at a given byte of the text being decoded."""
+        return self._offset + len(data[:pos].decode())
+
+    def _truncated(self, text: str, exc: json.JSONDecodeError) -> bool:
+        """Whether a decoding error is due to the document ending before the item does."""
+        return (
+            exc.msg.startswith("Unterminated string")
+            or (exc.msg == "Invalid \\uXXXX escape" and exc.pos + 5 >= len(text))
+            or self._partial.fullmatch(text[exc.pos :].encode()) is not None
+        )
+
+
 class WebSocketStatus(enum.Enum):
     """WebSocket connection state."""
 
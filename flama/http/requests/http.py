@@ -1,11 +1,11 @@
 import asyncio
-import json
 import typing as t
 from collections.abc import AsyncGenerator
 
 from flama import types
 from flama._core.http import parse_content_type as _parse_content_type
-from flama.http.data_structures import FormData
+from flama._core.json_decoder import decode_json
+from flama.http.data_structures import FormData, JSONItemsDecoder
 from flama.http.requests.connection import HTTPConnection
 
 __all__ = ["Request"]
@@ -32,6 +32,7 @@ class Request(HTTPConnection):
     :param send: ASGI send callable.
     """
 
+    ndjson_media_types: t.ClassVar[frozenset[str]] = frozenset({"application/x-ndjson", "application/ndjson"})
     _form: FormData | None
 
     def __init__(
@@ -99,9 +100,30 @@ class Request(HTTPConnection):
         The result is cached after the first call.
         """
         if not hasattr(self, "_json"):
-            self._json = json.loads(await self.body())
+            self._json = decode_json(await self.body())
         return self._json
 
+    async def json_items(self) -> AsyncGenerator[t.Any, None]:
+        """Decode the request body as JSON incrementally, yielding its items as they arrive.
+
+        The items of a JSON array are its elements, and those of an ``application/x-ndjson`` or ``application/ndjson``
+        body are its lines. Any other JSON document is yielded as a single item. Only the item being received is held in
+        memory, so large bulk bodies are ingested in bounded memory as long as the items are consumed as they are
+        yielded, as :meth:`flama.schemas.Schema.validate_stream` does. Decoding the body into request data collects
+        all of them instead. An empty body yields no items.
+
+        :raises ValueError: If the body is not valid JSON.
+        """
+        content_type, _ = _parse_content_type(self.headers.get("content-type", ""))
+        decoder = JSONItemsDecoder(lines=content_type in self.ndjson_media_types)
+
+        async for chunk in self.stream():
+            for item in decoder.feed(chunk):
+                yield item
+
+        for item in decoder.close():
+            yield item
+
     async def form(
         self,
         *,
@@ -1,7 +1,7 @@
-import json
 import typing as t
 
 from flama import exceptions, types
+from flama._core.json_decoder import decode_json
 from flama._core.json_encoder import encode_json
 from flama.http.data_structures import WebSocketStatus
 from flama.http.requests.connection import HTTPConnection
@@ -77,7 +77,7 @@ class WebSocket(HTTPConnection):
                 result = t.cast(str, message["text"])
             case "json":
                 result = t.cast(
-                    types.JSONSchema, json.loads(message.get("bytes", message.get("text", "").encode("utf-8")))
+                    types.JSONSchema, decode_json(message.get("bytes", message.get("text", "").encode("utf-8")))
                 )
             case None:
                 result = message
@@ -4,20 +4,28 @@ from flama import exceptions, schemas, types
 from flama.http.responses.json import JSONResponse
 from flama.schemas.data_structures import Schema
 
+if t.TYPE_CHECKING:
+    from flama.schemas.validation import OutputValidation
+
 __all__ = ["APIResponse", "APIErrorResponse"]
 
 
 class APIResponse(JSONResponse):
     media_type = "application/json"
 
-    def __init__(self, *args, schema: t.Any = None, **kwargs):
+    def __init__(self, *args, schema: t.Any = None, output_validation: "OutputValidation | None" = None, **kwargs):
         self.schema = schema
+        self.output_validation = output_validation
         super().__init__(*args, **kwargs)
 
     def render(self, content: types.JSONSchema) -> bytes:
         if self.schema is not None:
+            schema = Schema.from_type(self.schema)
             try:
-                content = Schema.from_type(self.schema).dump(content)
+                if self.output_validation is not None:
+                    return self.output_validation.dump_json(schema, content)
+
+                return schema.dump_json(content)
             except schemas.SchemaValidationError as e:
                 raise exceptions.SerializationError(status_code=500, detail=e.errors)
 
@@ -40,6 +40,10 @@ class _FileStat:
         if not stat.S_ISREG(result.st_mode):
             raise exceptions.HTTPException(status_code=404, detail=f"File at path {path} is not a file.")
 
+        return cls.from_stat(result)
+
+    @classmethod
+    def from_stat(cls, result: os.stat_result) -> "_FileStat":
         last_modified = datetime.datetime.fromtimestamp(result.st_mtime, datetime.timezone.utc).strftime(
             "%a, %d %b %Y %H:%M:%S GMT"
         )
@@ -138,6 +142,7 @@ class _RangeRequest:
 
 class FileResponse(Response):
     chunk_size = 64 * 1024
+    max_chunk_size = 1024 * 1024
 
     def __init__(
         self,
@@ -223,7 +228,9 @@ class FileResponse(Response):
             await self._send_file(send, start, end)
 
     async def _send_file(self, send: types.Send, start: int = 0, end: int | None = None) -> None:
-        async with concurrency.FileReader(self.path, self.chunk_size, start, end) as reader:
+        async with concurrency.FileReader(
+            self.path, self.chunk_size, start, end, max_chunk_size=self.max_chunk_size
+        ) as reader:
             async for chunk in reader:
                 await send(types.Message({"type": "http.response.body", "body": chunk, "more_body": True}))
         await send(types.Message({"type": "http.response.body", "body": b"", "more_body": False}))
@@ -237,7 +244,9 @@ class FileResponse(Response):
             await send(
                 types.Message({"type": "http.response.body", "body": header.encode("latin-1"), "more_body": True})
             )
-            async with concurrency.FileReader(self.path, self.chunk_size, start, end) as reader:
+            async with concurrency.FileReader(
+                self.path, self.chunk_size, start, end, max_chunk_size=self.max_chunk_size
+            ) as reader:
                 async for chunk in reader:
                     await send(types.Message({"type": "http.response.body", "body": chunk, "more_body": True}))
             await send(types.Message({"type": "http.response.body", "body": b"\n", "more_body": True}))
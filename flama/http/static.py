@@ -0,0 +1,373 @@
+import collections
+import dataclasses
+import email.utils
+import os
+import re
+import stat
+import time
+import typing as t
+from mimetypes import guess_type
+
+from flama import concurrency, exceptions, types
+from flama.http.cache import etag_matches
+from flama.http.data_structures import Headers
+from flama.http.requests.websocket import WebSocketClose
+from flama.http.responses.file import FileResponse, _FileStat
+from flama.http.responses.response import BufferedResponse, Response
+
+__all__ = ["StaticFiles"]
+
+
+class _StaticResponse(BufferedResponse[bytes, bytes]):
+    """Response for a file body already held in memory."""
+
+    def render(self, content: bytes) -> bytes:
+        return content
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Representation:
+    """A file on disk serving one representation of a static file, either the file itself or a precompressed sibling.
+
+    :param path: File path.
+    :param stat: File metadata.
+    :param body: File content, if it is small enough to be kept in memory.
+    """
+
+    path: str
+    stat: _FileStat
+    body: bytes | None = None
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _StaticFile:
+    """A static file along with its precompressed variants.
+
+    :param media_type: Media type of the file.
+    :param cache_control: Value of the ``Cache-Control`` header.
+    :param identity: The file itself.
+    :param encoded: Precompressed variants of the file by content encoding, in order of preference.
+    :param checked: Monotonic time when the files were looked up on disk.
+    """
+
+    media_type: str
+    cache_control: str
+    identity: _Representation
+    encoded: dict[str, _Representation]
+    checked: float
+
+    @property
+    def memory(self) -> int:
+        """Bytes held in memory by this file and its variants."""
+        return sum(len(x.body) for x in (self.identity, *self.encoded.values()) if x.body is not None)
+
+    def representation(self, headers: Headers) -> tuple[str | None, _Representation]:
+        """Select the representation to send for a request.
+
+        The first precompressed variant accepted by the client is preferred, except for range requests that are always
+        served from the file itself.
+
+        :param headers: Request headers.
+        :return: Content encoding and representation.
+        """
+        if self.encoded and "range" not in headers:
+            accepted = _accepted_encodings(headers.get("accept-encoding"))
+            for encoding, representation in self.encoded.items():
+                if encoding in accepted:
+                    return encoding, representation
+
+        return None, self.identity
+
+    def response(self, scope: types.Scope) -> Response:
+        """Build a response for this file, or a ``304 Not Modified`` one if the client copy is still valid.
+
+        :param scope: ASGI scope.
+        :return: Response.
+        """
+        request_headers = Headers(scope=scope)
+        encoding, representation = self.representation(request_headers)
+
+        headers = {
+            "etag": representation.stat.etag,
+            "last-modified": representation.stat.last_modified,
+            "cache-control": self.cache_control,
+        }
+        if self.encoded:
+            headers["vary"] = "Accept-Encoding"
+
+        if _not_modified(request_headers, representation.stat):
+            return _StaticResponse(b"", status_code=304, headers=headers)
+
+        if encoding is not None:
+            headers["content-encoding"] = encoding
+
+        if representation.body is None or "range" in request_headers:
+            return FileResponse(representation.path, headers=headers, media_type=self.media_type)
+
+        return _StaticResponse(representation.body, headers=headers, media_type=self.media_type)
+
+
+def _accepted_encodings(value: str | None) -> set[str]:
+    """Parse an ``Accept-Encoding`` header, leaving out the encodings refused with a zero quality value.
+
+    :param value: Raw ``Accept-Encoding`` header value.
+    :return: Accepted encodings.
+    """
+    accepted = set()
+    for item in (value or "").split(","):
+        encoding, *params = item.split(";")
+        quality = 1.0
+        for param in params:
+            name, _, param_value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(param_value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(encoding.strip().lower())
+
+    return accepted
+
+
+def _not_modified(headers: Headers, file_stat: _FileStat) -> bool:
+    """Check the conditional headers of a request, giving ``If-None-Match`` precedence over ``If-Modified-Since``.
+
+    :param headers: Request headers.
+    :param file_stat: Metadata of the representation being sent.
+    :return: True if the client copy is still valid.
+    """
+    if (if_none_match := headers.get("if-none-match")) is not None:
+        return etag_matches(if_none_match, file_stat.etag)
+
+    if (if_modified_since := headers.get("if-modified-since")) is not None:
+        try:
+            return email.utils.parsedate_to_datetime(if_modified_since) >= email.utils.parsedate_to_datetime(
+                file_stat.last_modified
+            )
+        except (TypeError, ValueError):
+            return False
+
+    return False
+
+
+def _stat(path: str) -> os.stat_result | None:
+    """Get the metadata of a file, if it can be accessed.
+
+    :param path: File path.
+    :return: File metadata.
+    """
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+class StaticFiles:
+    methods: t.ClassVar[frozenset[str]] = frozenset({"GET", "HEAD"})
+    extensions: t.ClassVar[dict[str, str]] = {"br": ".br", "zstd": ".zst", "gzip": ".gz"}
+    cache_control = "no-cache"
+    immutable_cache_control = "public, max-age=31536000, immutable"
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        index: str | None = "index.html",
+        encodings: t.Sequence[str] = ("br", "zstd", "gzip"),
+        immutable: str | re.Pattern | None = r"[.-][0-9a-f]{8,}\.[^.]+$",
+        max_size: int = 1024,
+        max_memory: int = 32 * 1024 * 1024,
+        max_file_size: int = 256 * 1024,
+        check_interval: float = 1.0,
+    ) -> None:
+        """An ASGI app serving the files of a directory, meant to be mounted in an application.
+
+        Requested paths are looked up inside the directory, and any path escaping from it, even through a symlink, is
+        not found. Files are served along with their ``ETag`` and ``Last-Modified`` headers, and requests whose
+        ``If-None-Match`` or ``If-Modified-Since`` headers still match them are answered with ``304 Not Modified``.
+
+        Precompressed siblings of a file, such as ``app.js.br``, ``app.js.zst`` or ``app.js.gz``, are served instead of
+        it to the clients accepting their encoding, in the order given by ``encodings``.
+
+        Files whose name matches the ``immutable`` pattern are expected to carry a content hash, as in
+        ``app.3f2a9c1d.js``, so they are sent with a far-future, immutable ``Cache-Control`` header. Any other file must
+        be revalidated by the client.
+
+        Files looked up are kept in a LRU cache, along with the content of the ones up to ``max_file_size`` bytes, so
+        hot files are served without touching the disk. A cached file is looked up again on disk after
+        ``check_interval`` seconds, to pick up changes. Disk lookups run on the thread pool dedicated to file I/O.
+
+        WebSocket connections are closed straight away, as there is nothing to serve through them.
+
+        :param directory: Directory to serve.
+        :param index: File served for a directory path.
+        :param encodings: Content encodings of the precompressed siblings, in order of preference.
+        :param immutable: Pattern of the names of files whose content never changes.
+        :param max_size: Maximum number of files cached.
+        :param max_memory: Maximum bytes of content cached.
+        :param max_file_size: Maximum size in bytes of a file to cache its content.
+        :param check_interval: Seconds a cached file is served before looking it up again on disk.
+        """
+        if unknown := set(encodings) - self.extensions.keys():
+            raise exceptions.ApplicationError(f"Unsupported static files encodings: {', '.join(sorted(unknown))}")
+
+        self.directory = os.path.realpath(directory)
+        self.index = index
+        self.encodings = tuple(encodings)
+        self.immutable = re.compile(immutable) if isinstance(immutable, str) else immutable
+        self.max_size = max_size
+        self.max_memory = max_memory
+        self.max_file_size = max_file_size
+        self.check_interval = check_interval
+        self._files: collections.OrderedDict[str, _StaticFile] = collections.OrderedDict()
+        self._memory = 0
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    @property
+    def memory(self) -> int:
+        """Bytes of content held in the cache."""
+        return self._memory
+
+    async def __call__(self, scope: types.Scope, receive: types.Receive, send: types.Send) -> None:
+        if scope["type"] == "websocket":
+            await WebSocketClose()(scope, receive, send)
+            return
+
+        if scope["type"] != "http":
+            raise ValueError(f"Wrong scope type ({scope['type']})")
+
+        if scope["method"] not in self.methods:
+            raise exceptions.MethodNotAllowedException(
+                path=scope.get("root_path", "").rstrip("/") + scope["path"],
+                method=scope["method"],
+                allowed=self.methods,
+            )
+
+        if (file := await self.lookup(scope["path"])) is None:
+            raise exceptions.HTTPException(status_code=404)
+
+        await file.response(scope)(scope, receive, send)
+
+    async def lookup(self, path: str) -> _StaticFile | None:
+        """Look for the file of a request path, from the cache while it is fresh and from disk otherwise.
+
+        :param path: Request path, relative to the served directory.
+        :return: Static file, or None if it does not exist.
+        """
+        if (cached := self._files.get(path)) is not None and time.monotonic() - cached.checked < self.check_interval:
+            self._files.move_to_end(path)
+            return cached
+
+        file = await concurrency.run_io(self._load, path, cached)
+
+        if file is None:
+            self._discard(path)
+        else:
+            self._store(path, file)
+
+        return file
+
+    def clear(self) -> None:
+        """Remove all cached files."""
+        self._files.clear()
+        self._memory = 0
+
+    def resolve(self, path: str) -> str | None:
+        """Resolve a request path into a file path, as long as it points inside the served directory.
+
+        :param path: Request path, relative to the served directory.
+        :return: File path, or None if the path escapes from the served directory.
+        """
+        parts = [x for x in path.split("/") if x and x != "."]
+        if any(x == ".." or "\x00" in x or os.sep in x or (os.altsep and os.altsep in x) for x in parts):
+            return None
+
+        filename = os.path.realpath(os.path.join(self.directory, *parts))
+        if os.path.commonpath((self.directory, filename)) != self.directory:
+            return None
+
+        return filename
+
+    def _load(self, path: str, cached: _StaticFile | None) -> _StaticFile | None:
+        """Look for the file of a request path and its precompressed variants on disk.
+
+        The content of the files that did not change since they were cached is reused instead of read again.
+
+        :param path: Request path, relative to the served directory.
+        :param cached: Cached version of the file.
+        :return: Static file, or None if it does not exist.
+        """
+        if (filename := self.resolve(path)) is None:
+            return None
+
+        if (result := _stat(filename)) is not None and stat.S_ISDIR(result.st_mode) and self.index:
+            filename = os.path.join(filename, self.index)
+            result = _stat(filename)
+
+        if result is None or not stat.S_ISREG(result.st_mode):
+            return None
+
+        previous = {} if cached is None else {x.path: x for x in (cached.identity, *cached.encoded.values())}
+        identity = self._representation(filename, result, previous.get(filename))
+        encoded = {}
+        for encoding in self.encodings:
+            variant = filename + self.extensions[encoding]
+            if (variant_result := _stat(variant)) is not None and stat.S_ISREG(variant_result.st_mode):
+                encoded[encoding] = self._representation(variant, variant_result, previous.get(variant))
+
+        return _StaticFile(
+            media_type=guess_type(filename)[0] or "text/plain",
+            cache_control=(
+                self.immutable_cache_control
+                if self.immutable is not None and self.immutable.search(os.path.basename(filename))
+                else self.cache_control
+            ),
+            identity=identity,
+            encoded=encoded,
+            checked=time.monotonic(),
+        )
+
+    def _representation(self, path: str, result: os.stat_result, previous: _Representation | None) -> _Representation:
+        """Build a representation from a file on disk, reading its content if it is small enough to be cached.
+
+        :param path: File path.
+        :param result: File metadata.
+        :param previous: Cached representation of the same file.
+        :return: Representation.
+        """
+        file_stat = _FileStat.from_stat(result)
+
+        if previous is not None and previous.stat == file_stat:
+            return previous
+
+        body = None
+        if file_stat.size <= self.max_file_size:
+            with open(path, "rb") as f:
+                body = f.read()
+
+        return _Representation(path=path, stat=file_stat, body=body)
+
+    def _store(self, path: str, file: _StaticFile) -> None:
+        """Cache a file, evicting the least recently used ones while the cache is over its limits.
+
+        :param path: Request path.
+        :param file: Static file.
+        """
+        self._discard(path)
+        self._files[path] = file
+        self._memory += file.memory
+
+        while len(self._files) > self.max_size or (self._memory > self.max_memory and len(self._files) > 1):
+            _, evicted = self._files.popitem(last=False)
+            self._memory -= evicted.memory
+
+    def _discard(self, path: str) -> None:
+        """Remove a file from the cache.
+
+        :param path: Request path.
+        """
+        if (file := self._files.pop(path, None)) is not None:
+            self._memory -= file.memory
@@ -8,9 +8,9 @@ __all__ = ["LRUCache"]
 
 
 class LRUCache(t.MutableMapping[K, V]):
-    """A cache for keeping the N last recent used items."""
+    """A cache for keeping the N last recent used items. It grows unbounded if no max size is given."""
 
-    def __init__(self, *, max_size: int = 2**8):
+    def __init__(self, *, max_size: int | None = 2**8):
         self._data = collections.OrderedDict[K, V]({})
         self.max_size = max_size
 
@@ -18,13 +18,17 @@ class LRUCache(t.MutableMapping[K, V]):
         if not self._is_cacheable(value):
             raise ValueError(f"Value '{value}' cannot be cached")
 
-        if len(self._data) == self.max_size:
-            self._data.popitem()
+        if key in self._data:
+            self._data.move_to_end(key)
+        elif self.max_size is not None and len(self._data) >= self.max_size:
+            self._data.popitem(last=False)
 
         self._data.__setitem__(key, value)
 
     def __getitem__(self, key: K) -> V:
-        return self._data.__getitem__(key)
+        value = self._data.__getitem__(key)
+        self._data.move_to_end(key)
+        return value
 
     def __delitem__(self, key: K) -> None:
         return self._data.__delitem__(key)
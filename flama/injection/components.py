@@ -1,15 +1,42 @@
 import abc
+import enum
 import inspect
 import typing as t
 
 from flama.injection.exceptions import ComponentError, ComponentNotFound
 from flama.injection.resolver import Parameter
 
-__all__ = ["Component", "Components"]
+__all__ = ["Component", "Components", "Lifetime"]
+
+
+class Lifetime(enum.Enum):
+    """How long a value resolved by a component is reused.
+
+    * ``SINGLETON``: Resolved once and shared by every parameter handled by the component.
+    * ``APP``: Resolved once per parameter and kept by the injector until its components change.
+    * ``REQUEST``: Resolved once per parameter and injection context, and dropped along with the context.
+    * ``TRANSIENT``: Resolved every time it is injected.
+    """
+
+    SINGLETON = enum.auto()
+    APP = enum.auto()
+    REQUEST = enum.auto()
+    TRANSIENT = enum.auto()
 
 
 class Component(metaclass=abc.ABCMeta):
     cacheable: t.ClassVar[bool] = True
+    concurrent: t.ClassVar[bool] = False
+    lifetime: t.ClassVar[Lifetime] = Lifetime.REQUEST
+
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # Keep both flags consistent, non cacheable components are transient unless told otherwise, and vice versa.
+        if "lifetime" in cls.__dict__:
+            cls.cacheable = cls.lifetime is not Lifetime.TRANSIENT
+        elif "cacheable" in cls.__dict__:
+            cls.lifetime = Lifetime.REQUEST if cls.cacheable else Lifetime.TRANSIENT
 
     @abc.abstractmethod
     def resolve(self, *args, **kwargs) -> t.Any: ...
@@ -82,19 +82,22 @@ class Context(metaclass=ContextType):
     """Base injection context.
 
     A context is a typed bag of values consumed by the dependency injection machinery. Fields are declared as
-    :class:`Field` descriptors and their values are stored in an internal mapping.
+    :class:`Field` descriptors and their values are stored in an internal mapping. Request scoped component values
+    are stored in the context too, so they are dropped along with it.
     """
 
     __fields__: t.ClassVar[dict[str, "Field"]]
     __types__: t.ClassVar[dict[str, type]]
 
     _data: dict[str, t.Any]
+    _cache: dict[t.Hashable, t.Any]
 
     def __init__(self, **values: t.Any) -> None:
         if unknown := (values.keys() - self.__fields__.keys()):
             raise ContextError(f"Unknown context field(s): {', '.join(map(repr, sorted(unknown)))}")
 
         self._data = {}
+        self._cache = {}
         for key, value in values.items():
             setattr(self, key, value)
 
@@ -1,12 +1,14 @@
+import contextlib
 import functools
 import inspect
 import typing as t
+import weakref
 
 from flama.injection.cache import LRUCache
 from flama.injection.components import Component, Components
-from flama.injection.context import C, Context
+from flama.injection.context import C
 from flama.injection.exceptions import ComponentNotFound
-from flama.injection.resolver import Parameter, Resolver
+from flama.injection.resolver import ExecutionPlan, Parameter, Resolver
 
 if t.TYPE_CHECKING:
     from flama.injection.resolver import ResolutionTree
@@ -15,38 +17,60 @@ if t.TYPE_CHECKING:
 ROOT_NAME = "_root"
 
 
-class InjectionCache(LRUCache[tuple[Parameter, Context], t.Any]):
-    """A cache for injected component values."""
+class InjectionCache(LRUCache[t.Hashable, t.Any]):
+    """A cache for injected component values that outlive a single injection context, such as app scoped values and
+    singletons.
+
+    It is unbounded, as evicting a value would silently resolve it again, and it only grows with the parameters handled
+    by app scoped components and the singleton components registered.
+    """
 
     ...
 
 
-class FunctionCache(LRUCache[int, tuple[t.Callable, dict[str, "ResolutionTree"]]]):
+class FunctionCache(weakref.WeakKeyDictionary[t.Callable, dict[str, "ResolutionTree"]]):
     """A cache for resolved function signatures.
 
-    Entries are keyed by the id of a stable callable target and store a strong reference to that target alongside the
-    resolved signature, so its id cannot be recycled while the entry lives (see :meth:`Injector.resolve_function`).
+    Entries are keyed by a stable callable target held through a weak reference (see
+    :meth:`Injector.resolve_function`), so an entry lives as long as its function does and functions created at
+    runtime are not leaked. Callables that cannot be weakly referenced are not cached.
     """
 
     ...
 
 
+class PlanCache(weakref.WeakKeyDictionary[t.Callable, ExecutionPlan]):
+    """A cache for the execution plans of functions, keyed the same way as :class:`FunctionCache`."""
+
+    ...
+
+
 class Injector(t.Generic[C]):
     """Functions dependency injector. It uses a resolver to generate dependencies trees and evaluate them."""
 
-    def __init__(self, context_cls: type[C], /, components: t.Sequence[Component] | Components | None = None):
+    def __init__(
+        self,
+        context_cls: type[C],
+        /,
+        components: t.Sequence[Component] | Components | None = None,
+        *,
+        concurrent: bool = False,
+    ):
         """Functions dependency injector.
 
         It uses a resolver to generate dependencies trees and evaluate them.
 
         :param context_cls: The context class used for injection.
         :param components: List of components.
+        :param concurrent: Resolve independent async components concurrently, even if they are not flagged as such.
         """
         self._context_cls = context_cls
+        self.concurrent = concurrent
         self._resolver: Resolver[C] | None = None
         self._function_cache: FunctionCache = FunctionCache()
+        self._plan_cache: PlanCache = PlanCache()
+        self.cache = InjectionCache(max_size=None)
         self.components = Components(components or [])
-        self.cache = InjectionCache()
 
     @property
     def components(self) -> Components:
@@ -72,7 +96,9 @@ class Injector(t.Generic[C]):
     @resolver.deleter
     def resolver(self):
         self._resolver = None
-        self._function_cache.reset()
+        self._function_cache.clear()
+        self._plan_cache.clear()
+        self.cache.reset()
 
     @t.overload
     def resolve(self, annotation: type) -> "ResolutionTree[C]": ...
@@ -101,16 +127,13 @@ class Injector(t.Generic[C]):
         :param func: Function to be resolved.
         :return: Mapping of parameter names and dependencies trees.
         """
-        # Bound methods (and other transient callables) are recreated on each access, so caching by ``id(func)`` is
-        # unsafe: once such an object is garbage collected its address can be reused by an unrelated callable, yielding
-        # false cache hits and injecting the wrong dependencies. Normalise bound methods to their underlying function
-        # (stable, kept alive by its class and shared across instances) and keep a strong reference to the keyed target
-        # so its id cannot be recycled while the entry lives.
+        # Bound methods are recreated on each access, so an entry keyed by one of them would go away along with it.
+        # Normalise them to their underlying function, that is stable, kept alive by its class and shared across
+        # instances.
         target = getattr(func, "__func__", func)
-        func_id = id(target)
         try:
-            return self._function_cache[func_id][1]
-        except KeyError:
+            return self._function_cache[target]
+        except (KeyError, TypeError):
             pass
 
         parameters = {}
@@ -124,9 +147,43 @@ class Injector(t.Generic[C]):
             except ComponentNotFound as e:
                 raise ComponentNotFound(e.parameter, component=e.component, function=func) from None
 
-        self._function_cache[func_id] = (target, parameters)
+        with contextlib.suppress(TypeError):
+            self._function_cache[target] = parameters
+
         return parameters
 
+    def resolve_plan(self, func: t.Callable) -> ExecutionPlan[C]:
+        """Generate the execution plan for a given function.
+
+        The dependencies trees of all the function parameters are flattened into a single plan, sorted topologically,
+        that evaluates every shared dependency only once.
+
+        :param func: Function to be resolved.
+        :return: Execution plan.
+        """
+        target = getattr(func, "__func__", func)
+        try:
+            return self._plan_cache[target]
+        except (KeyError, TypeError):
+            pass
+
+        plan = ExecutionPlan.build(self.resolve_function(func), concurrent=self.concurrent)
+        with contextlib.suppress(TypeError):
+            self._plan_cache[target] = plan
+
+        return plan
+
+    async def warm_up(self, *funcs: t.Callable) -> None:
+        """Generate the execution plans for given functions upfront, and resolve the app scoped values and singletons
+        they need that do not depend on any injection context value.
+
+        Any function that cannot be resolved raises an error here instead of when it is injected for the first time.
+
+        :param funcs: Functions to be resolved.
+        """
+        for func in funcs:
+            await self.resolve_plan(func).warm_up(self.cache)
+
     async def inject(self, func: t.Callable, context: C) -> t.Callable:
         """Inject dependencies into a given function.
 
@@ -138,13 +195,7 @@ class Injector(t.Generic[C]):
         :param context: Context instance used to gather injection values.
         :return: Partialised function with all dependencies injected.
         """
-        return functools.partial(
-            func,
-            **{
-                name: await resolution.value(context, cache=self.cache)
-                for name, resolution in self.resolve_function(func).items()
-            },
-        )
+        return functools.partial(func, **await self.resolve_plan(func).value(context, cache=self.cache))
 
     @t.overload
     async def value(self, annotation: type, context: C) -> t.Any: ...
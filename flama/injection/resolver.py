@@ -1,5 +1,7 @@
 import abc
+import asyncio
 import dataclasses
+import functools
 import inspect
 import typing as t
 
@@ -11,7 +13,7 @@ from flama.injection.types import BUILTIN_TYPES
 if t.TYPE_CHECKING:
     from flama.injection.components import Component, Components
 
-__all__ = ["Empty", "Return", "Parameter", "Resolver"]
+__all__ = ["Empty", "Return", "Parameter", "ExecutionPlan", "Resolver"]
 
 
 class Empty: ...
@@ -59,9 +61,6 @@ class ResolutionNode(abc.ABC, t.Generic[C]):
     parameter: Parameter
     nodes: list["ResolutionNode[C]"]
 
-    @abc.abstractmethod
-    async def value(self, context: C, *, cache: LRUCache | None = None) -> t.Any: ...
-
     def components(self) -> list[tuple[str, "Component"]]:
         return []
 
@@ -78,18 +77,6 @@ class ComponentNode(ResolutionNode[C]):
 
     component: "Component"
 
-    async def value(self, context: C, *, cache: LRUCache | None = None) -> t.Any:
-        try:
-            value = (cache or {})[self.parameter, context]
-        except KeyError:
-            kwargs = {node.name: await node.value(context, cache=cache) for node in self.nodes}
-            value = await self.component(**kwargs)
-
-        if self.component.cacheable and cache is not None:
-            cache[self.parameter, context] = value
-
-        return value
-
     def components(self) -> list[tuple[str, "Component"]]:
         return [(self.name, self.component), *[x for node in self.nodes for x in node.components()]]
 
@@ -104,9 +91,6 @@ class ComponentNode(ResolutionNode[C]):
 class ContextNode(ResolutionNode[C]):
     """A node that represents a parameter that is resolved by context."""
 
-    async def value(self, context: C, *, cache: LRUCache | None = None) -> t.Any:
-        return context[self.parameter.name]
-
     def context(self) -> list[tuple[str, Parameter]]:
         return [(self.name, self.parameter)]
 
@@ -115,14 +99,11 @@ class ContextNode(ResolutionNode[C]):
 class ParameterNode(ResolutionNode[C]):
     """A node that represents a parameter that is resolved by another parameter."""
 
-    async def value(self, context: C, *, cache: LRUCache | None = None) -> t.Any:
-        return self.parameter
-
     def parameters(self) -> list[Parameter]:
         return [self.parameter]
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Step(abc.ABC, t.Generic[C]):
     """A single pre-compiled step in a flat execution plan."""
 
@@ -142,11 +123,8 @@ class Step(abc.ABC, t.Generic[C]):
     @abc.abstractmethod
     def _build(node: ResolutionNode, steps: list["Step"]) -> list["Step"]: ...
 
-    @abc.abstractmethod
-    async def execute(self, results: list, context: C, cache: LRUCache | None) -> t.Any: ...
-
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ContextStep(Step):
     """A step that reads a value from the injection context."""
 
@@ -158,11 +136,8 @@ class ContextStep(Step):
         steps.append(ContextStep(context_key=node.parameter.name))
         return steps
 
-    async def execute(self, results: list, context: C, cache: LRUCache | None) -> t.Any:
-        return context[self.context_key]
-
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ParameterStep(Step):
     """A step that returns a stored Parameter value."""
 
@@ -174,17 +149,42 @@ class ParameterStep(Step):
         steps.append(ParameterStep(parameter=node.parameter))
         return steps
 
-    async def execute(self, results: list, context: C, cache: LRUCache | None) -> t.Any:
-        return self.parameter
 
+_REQUEST, _SHARED = range(2)
 
-@dataclasses.dataclass(frozen=True)
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class ComponentStep(Step):
-    """A step that calls a component's resolve method with pre-computed dependencies."""
+    """A step that calls a component with the values of the steps it depends on.
+
+    How the component is called and where its value is stored are worked out once, when the step is built.
+    """
 
     component: "Component"
     parameter: Parameter
     deps: tuple[tuple[str, int], ...]
+    parallel: bool = False
+    call: t.Callable = dataclasses.field(init=False, repr=False, compare=False)
+    is_async: bool = dataclasses.field(init=False, repr=False, compare=False)
+    store: int | None = dataclasses.field(init=False, repr=False, compare=False)
+    key: t.Hashable = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        from flama.injection.components import Component, Lifetime
+
+        # Components customising how they are called cannot be called through their resolve method.
+        if type(self.component).__call__ is Component.__call__:
+            object.__setattr__(self, "call", self.component.resolve)
+            object.__setattr__(self, "is_async", self.component._is_resolve_async)
+        else:
+            object.__setattr__(self, "call", self.component)
+            object.__setattr__(self, "is_async", True)
+
+        store = {Lifetime.REQUEST: _REQUEST, Lifetime.TRANSIENT: None}.get(self.component.lifetime, _SHARED)
+        object.__setattr__(self, "store", store)
+        object.__setattr__(
+            self, "key", self.component if self.component.lifetime is Lifetime.SINGLETON else self.parameter
+        )
 
     @staticmethod
     def _build(node: ResolutionNode, steps: list[Step]) -> list[Step]:
@@ -196,20 +196,6 @@ class ComponentStep(Step):
         steps.append(ComponentStep(component=node.component, parameter=node.parameter, deps=tuple(deps)))
         return steps
 
-    async def execute(self, results: list, context: C, cache: LRUCache | None) -> t.Any:
-        if self.component.cacheable and cache is not None:
-            try:
-                return cache[(self.parameter, context)]
-            except KeyError:
-                pass
-
-        value = await self.component(**{name: results[idx] for name, idx in self.deps})
-
-        if self.component.cacheable and cache is not None:
-            cache[(self.parameter, context)] = value
-
-        return value
-
 
 @dataclasses.dataclass(frozen=True)
 class ResolutionTree(t.Generic[C]):
@@ -277,11 +263,233 @@ class ResolutionTree(t.Generic[C]):
 
                 raise  # pragma: no cover
 
+    @functools.cached_property
+    def plan(self) -> "ExecutionPlan[C]":
+        return ExecutionPlan.build({self.root.name: self})
+
     async def value(self, context: C, *, cache: LRUCache | None = None) -> t.Any:
-        results = []
-        for step in self._steps:
-            results.append(await step.execute(results, context, cache))
-        return results[-1]
+        return (await self.plan.results(context, cache=cache))[-1]
+
+
+@dataclasses.dataclass(frozen=True)
+class ExecutionPlan(t.Generic[C]):
+    """Flat execution plan that resolves all the parameters of a function in a single loop.
+
+    The steps of every resolution tree are merged in topological order, so each dependency is evaluated before the
+    components using it. Context values, parameters and cacheable components shared by several trees are evaluated
+    only once. Sync components are called directly, without wrapping them in a coroutine.
+
+    Component values are stored according to the component lifetime: request scoped values live in the context, app
+    scoped values and singletons live in the given cache, and transient values are never stored.
+
+    Async components that can run concurrently are grouped in stages by their depth in the dependencies graph, and
+    the ones in the same stage are awaited together, so independent I/O bound components overlap their latencies.
+    """
+
+    steps: tuple[Step, ...]
+    outputs: tuple[tuple[str, int], ...]
+    stages: tuple[tuple[int, ...], ...] | None = None
+
+    @classmethod
+    def build(cls, trees: dict[str, ResolutionTree[C]], *, concurrent: bool = False) -> "ExecutionPlan[C]":
+        """Compile the resolution trees of a function into a plan.
+
+        :param trees: Mapping of parameter names and dependencies trees.
+        :param concurrent: Run all async sibling components concurrently, not only the ones flagged as concurrent.
+        :return: Execution plan.
+        """
+        steps: list[Step] = []
+        positions: dict[t.Hashable, int] = {}
+        outputs: list[tuple[str, int]] = []
+        levels: list[int] = []
+
+        for name, tree in trees.items():
+            indexes: list[int] = []
+            for step in tree._steps:
+                level = 0
+                key: t.Hashable = step
+                if isinstance(step, ComponentStep):
+                    # Point the dependencies to the steps of the plan instead of the ones of the tree.
+                    deps = tuple((dep_name, indexes[index]) for dep_name, index in step.deps)
+                    step = dataclasses.replace(
+                        step, deps=deps, parallel=step.is_async and (concurrent or step.component.concurrent)
+                    )
+                    key = (id(step.component), step.parameter, deps) if step.store is not None else object()
+                    level = 1 + max((levels[index] for _, index in deps), default=0)
+
+                if key not in positions:
+                    positions[key] = len(steps)
+                    steps.append(step)
+                    levels.append(level)
+
+                indexes.append(positions[key])
+
+            outputs.append((name, indexes[-1]))
+
+        stages: dict[int, list[int]] = {}
+        for index, level in enumerate(levels):
+            stages.setdefault(level, []).append(index)
+
+        # Stages are only worth it when at least two components can be awaited together.
+        staged = any(
+            sum(1 for index in stage if isinstance(steps[index], ComponentStep) and steps[index].parallel) > 1
+            for stage in stages.values()
+        )
+
+        return cls(
+            steps=tuple(steps),
+            outputs=tuple(outputs),
+            stages=tuple(tuple(stages[level]) for level in sorted(stages)) if staged else None,
+        )
+
+    async def warm_up(self, cache: LRUCache) -> None:
+        """Resolve the app scoped values and singletons of the plan that do not depend on any injection context value,
+        so they are already stored in the given cache when the plan is evaluated.
+
+        :param cache: Cache for app scoped values and singletons.
+        """
+        results: dict[int, t.Any] = {}
+        for index, step in enumerate(self.steps):
+            if isinstance(step, ParameterStep):
+                results[index] = step.parameter
+            elif isinstance(step, ComponentStep) and step.store is _SHARED and all(i in results for _, i in step.deps):
+                try:
+                    results[index] = cache[step.key]
+                except KeyError:
+                    value = step.call(**{name: results[i] for name, i in step.deps})
+                    if step.is_async:
+                        value = await value
+
+                    results[index] = cache[step.key] = value
+
+    async def results(self, context: C, *, cache: LRUCache | None = None) -> list[t.Any]:
+        """Evaluate every step of the plan.
+
+        :param context: Context instance used to gather injection values.
+        :param cache: Cache for app scoped values and singletons.
+        :return: Value of every step.
+        """
+        if self.stages is not None:
+            return await self._staged_results(context, cache)
+
+        results: list[t.Any] = []
+        for step in self.steps:
+            if isinstance(step, ContextStep):
+                results.append(context[step.context_key])
+            elif isinstance(step, ParameterStep):
+                results.append(step.parameter)
+            else:
+                assert isinstance(step, ComponentStep)
+                if step.store is not None:
+                    values = self._values(step.store, context, cache)
+                    try:
+                        results.append(values[step.key])
+                        continue
+                    except KeyError:
+                        pass
+
+                value = step.call(**{name: results[index] for name, index in step.deps})
+                if step.is_async:
+                    value = await value
+
+                if step.store is not None:
+                    values[step.key] = value
+
+                results.append(value)
+
+        return results
+
+    async def _staged_results(self, context: C, cache: LRUCache | None) -> list[t.Any]:  # noqa: C901
+        """Evaluate every step of the plan stage by stage, awaiting together the concurrent components of each stage.
+
+        :param context: Context instance used to gather injection values.
+        :param cache: Cache for app scoped values and singletons.
+        :return: Value of every step.
+        """
+        assert self.stages is not None
+
+        results: list[t.Any] = [None] * len(self.steps)
+        for stage in self.stages:
+            pending: dict[int, t.Coroutine] = {}
+            for index in stage:
+                step = self.steps[index]
+                if isinstance(step, ContextStep):
+                    results[index] = context[step.context_key]
+                    continue
+
+                if isinstance(step, ParameterStep):
+                    results[index] = step.parameter
+                    continue
+
+                assert isinstance(step, ComponentStep)
+                if step.store is not None:
+                    values = self._values(step.store, context, cache)
+                    try:
+                        results[index] = values[step.key]
+                        continue
+                    except KeyError:
+                        pass
+
+                value = step.call(**{name: results[i] for name, i in step.deps})
+                if step.parallel:
+                    pending[index] = value
+                    continue
+
+                if step.is_async:
+                    value = await value
+
+                if step.store is not None:
+                    values[step.key] = value
+
+                results[index] = value
+
+            for index, value in zip(pending, await self._gather(*pending.values())):
+                step = t.cast(ComponentStep, self.steps[index])
+                if step.store is not None:
+                    self._values(step.store, context, cache)[step.key] = value
+
+                results[index] = value
+
+        return results
+
+    @staticmethod
+    def _values(store: int, context: C, cache: LRUCache | None) -> t.MutableMapping[t.Hashable, t.Any]:
+        """Select where the values of a component are stored.
+
+        :param store: Kind of store.
+        :param context: Context instance used to gather injection values.
+        :param cache: Cache for app scoped values and singletons.
+        :return: Store, falling back to the context one if there is no cache.
+        """
+        return cache if store is _SHARED and cache is not None else context._cache
+
+    @staticmethod
+    async def _gather(*coroutines: t.Coroutine) -> list[t.Any]:
+        """Await a group of coroutines concurrently, cancelling the remaining ones if any of them fails.
+
+        :param coroutines: Coroutines to await.
+        :return: Results in the same order.
+        """
+        if not coroutines:
+            return []
+
+        tasks = [asyncio.ensure_future(x) for x in coroutines]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def value(self, context: C, *, cache: LRUCache | None = None) -> dict[str, t.Any]:
+        """Evaluate the plan and gather the value of each parameter.
+
+        :param context: Context instance used to gather injection values.
+        :param cache: Cache for app scoped values and singletons.
+        :return: Mapping of parameter names and values.
+        """
+        results = await self.results(context, cache=cache)
+        return {name: results[index] for name, index in self.outputs}
 
 
 class ResolutionCache(LRUCache[t.Hashable, ResolutionTree]):
@@ -1,4 +1,5 @@
 import asyncio
+import inspect
 import logging
 import typing as t
 
@@ -83,6 +84,19 @@ class Lifespan(types.ASGIAppClass):
         await app.modules.on_startup()
         await app.middleware.on_startup()
 
+        # Resolve the injection plan of every handler upfront, along with the singletons and app scoped values it
+        # needs, so the first request to each endpoint costs the same as any other one, and a dependency that cannot be
+        # resolved fails the startup instead of that first request. Endpoint classes are not injected themselves, only
+        # their methods are.
+        await app.injector.warm_up(
+            *(
+                handler
+                for route in app.routes
+                for handler in route.endpoint_handlers().values()
+                if not inspect.isclass(handler)
+            )
+        )
+
         if app.events.startup:
             await concurrency.run_task_group(*(f() for f in app.events.startup))
 
@@ -2,7 +2,7 @@ import os
 import pathlib
 import typing as t
 
-from flama.injection import Component
+from flama.injection import Component, Lifetime
 from flama.models._base import BaseModel, LLMModel, MLModel
 from flama.models.engine.llm.decoder.decoder import Decoder
 from flama.serialize.serializer import Serializer
@@ -22,6 +22,8 @@ class ModelComponent(Component, t.Generic[M]):
     ``app.events.startup`` so heavy work runs after uvicorn binds the port.
     """
 
+    lifetime = Lifetime.SINGLETON
+
     def __init__(self, model: M, /) -> None:
         """Bind the component to *model*.
 
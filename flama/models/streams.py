@@ -201,7 +201,11 @@ class FileStreamsBackend(StreamsBackend):
 
         data = bytearray()
         async with concurrency.FileReader(
-            self._file_path(model, key), chunk_size=1 << 16, start=offsets[start], end=offsets[end]
+            self._file_path(model, key),
+            chunk_size=1 << 16,
+            start=offsets[start],
+            end=offsets[end],
+            max_chunk_size=1 << 20,
         ) as reader:
             async for chunk in reader:
                 data += chunk
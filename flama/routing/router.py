@@ -1,16 +1,27 @@
+import dataclasses
 import logging
 import typing as t
 
-from flama import exceptions, types, url
+from flama import exceptions, http, types, url
 from flama._core.route_table import Resolution, RouteTable
 from flama.injection import Component, Components
 from flama.lifespan import Lifespan
-from flama.routing.routes import BaseRoute, ResolveResult, ResolveType, ScopeType
+from flama.routing.routes import (
+    BaseRoute,
+    ResolvedRoute,
+    ResolveResult,
+    ResolveType,
+    RouteTableParams,
+    ScopeType,
+)
 from flama.routing.routes.http import Route
 from flama.routing.routes.mount import Mount
 from flama.routing.routes.websocket import WebSocketRoute
 from flama.types.http import Method
 
+if t.TYPE_CHECKING:
+    from flama.schemas.validation import OutputValidation
+
 __all__ = ["Router"]
 
 logger = logging.getLogger(__name__)
@@ -30,7 +41,147 @@ def _parse_resolve_result(raw: t.Any) -> ResolveResult | None:
     )
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class _URLTemplate:
+    """Reverse URL of a named route compiled into a single template, flattened across the mounts leading to it.
+
+    :param template: Path template of the route prefixed with the templates of its mount points.
+    :param parameters: Serializers of all path parameters in the template.
+    :param strict: True if building the URL must fail when given unused parameters.
+    """
+
+    template: str
+    parameters: dict[str, t.Any]
+    strict: bool
+
+    @classmethod
+    def from_path(cls, path: url.Path, *, strict: bool) -> "_URLTemplate":
+        return cls(
+            template=path._template,
+            parameters={name: parameter.serializer for name, parameter in path._parameters.items()},
+            strict=strict,
+        )
+
+    def prefix(self, path: url.Path) -> "_URLTemplate | None":
+        """Prefix this template with the path of a mount point.
+
+        :param path: Mount point path.
+        :return: Prefixed template, or None if it can never be built because the mount point consumes some of the
+        parameters of this template.
+        """
+        if path._parameters.keys() & self.parameters.keys():
+            return None
+
+        return _URLTemplate(
+            template=f"{path._template.rstrip('/')}/{self.template.lstrip('/')}",
+            parameters={**{name: p.serializer for name, p in path._parameters.items()}, **self.parameters},
+            strict=self.strict,
+        )
+
+    def build(self, params: dict[str, t.Any]) -> url.URL | None:
+        """Build the URL with given path params.
+
+        :param params: Path params.
+        :return: URL, or None if given params do not fit the template.
+        """
+        if not self.parameters.keys() <= params.keys() or (self.strict and not params.keys() <= self.parameters.keys()):
+            return None
+
+        try:
+            path = self.template.format(**{name: s.dump(params[name]) for name, s in self.parameters.items()})
+        except ValueError:
+            return None
+
+        return url.URL(path=path, scheme="http")
+
+
+def _url_templates(route: BaseRoute) -> list[tuple[str, _URLTemplate]] | None:
+    """Compile the reverse URLs reachable through given route.
+
+    :param route: Route.
+    :return: Names and templates in resolution order, or None if the route defines its own URL resolution.
+    """
+    resolve_url = getattr(type(route), "resolve_url", None)
+
+    if resolve_url is BaseRoute.resolve_url:
+        return [(route.name, _URLTemplate.from_path(route.path, strict=True))] if route.name is not None else []
+
+    if resolve_url is not Mount.resolve_url:
+        return None
+
+    if route.name is None or ":" in route.name:
+        return []
+
+    templates = [(route.name, _URLTemplate.from_path(route.path, strict=False))]
+    for nested_route in t.cast(Mount, route).routes:
+        if (nested_templates := _url_templates(nested_route)) is None:
+            return None
+
+        templates += [
+            (f"{route.name}:{name}", prefixed)
+            for name, template in nested_templates
+            if (prefixed := template.prefix(route.path)) is not None
+        ]
+
+    return templates
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _CompiledEntry:
+    """Route reachable from a router once the mount points of nested Flama apps are flattened.
+
+    :param route: Route, owned by the router of the innermost Flama app.
+    :param router: Router of the innermost Flama app.
+    :param mounts: Flama mount points traversed to reach the route.
+    :param prefix: Path of the traversed mount points, concatenated.
+    """
+
+    route: BaseRoute
+    router: "Router"
+    mounts: tuple[BaseRoute, ...] = ()
+    prefix: url.Path | None = None
+
+
+def _is_flama_mount(route: BaseRoute) -> bool:
+    """Check if a route is a plain mount point of a Flama app.
+
+    :param route: Route.
+    :return: True if the route is a Flama mount point.
+    """
+    return (
+        isinstance(route, Mount)
+        and type(route).route_scope is Mount.route_scope
+        and types.is_flama_instance(route.app)
+        and isinstance(route.app.router, Router)
+    )
+
+
+def _nested_parameters(router: "Router") -> set[str] | None:
+    """Collect the path parameters of all routes reachable through the Flama mount points of given router.
+
+    :param router: Router.
+    :return: Parameter names, or None if some of them are declared twice along the same path.
+    """
+    names: set[str] = set()
+    for route in router.routes:
+        parameters = set(route.path._parameters)
+        if _is_flama_mount(route):
+            if (nested := _nested_parameters(route.app.router)) is None or parameters & nested:
+                return None
+            parameters |= nested
+        names |= parameters
+
+    return names
+
+
 class Router:
+    # Incremented every time any router changes its routes, so URL indexes flattened across mount points notice changes
+    # in nested routers.
+    _version: t.ClassVar[int] = 0
+    # Incremented every time any router changes its components, so applications notice they have to rebuild the
+    # components of their injector, that include the ones of their parents.
+    _components_version: t.ClassVar[int] = 0
+
     def __init__(
         self,
         routes: t.Sequence[BaseRoute] | None = None,
@@ -38,24 +189,46 @@ class Router:
         app: types.App,
         components: t.Sequence["Component"] | set["Component"] | None = None,
         lifespan: t.Callable[[types.App | None], t.AsyncContextManager] | None = None,
+        compiled_mounts: bool = False,
+        route_cache_size: int | None = None,
     ):
         """A router for containing all routes and mount points.
 
+        When compiled mounts are enabled, once the application is ready the routes of all nested Flama apps are merged
+        into a single route table, so a path is resolved in one step no matter how deeply nested its route is.
+
         :param routes: Routes part of this router.
         :param components: Components registered in this router.
         :param lifespan: Lifespan function.
         :param root: Flama application.
+        :param compiled_mounts: Flatten nested Flama apps into a single route table once the application is ready.
+        :param route_cache_size: Maximum number of resolutions cached by the route tables, 0 disables the cache. If not
+        given, the default size of the route table is used.
         """
         self.app = app
+        self.compiled_mounts = compiled_mounts
+        self.route_cache_size = route_cache_size
         self.routes: list[BaseRoute] = [] if routes is None else list(routes)
         self.components = Components(components if components else set())
         self.lifespan = Lifespan(lifespan)
-        self._route_table = RouteTable()
+        self._route_table = self._build_route_table()
+        self._url_index: tuple[int, dict[str, list[tuple[int, _URLTemplate | BaseRoute]]], list[tuple[int, BaseRoute]]]
+        self._url_index = (-1, {}, [])
+        self._compiled: tuple[int, RouteTable, list[_CompiledEntry]] | None = None
 
         for route in self.routes:
             route._build(self.app)
             self._register_route_entry(route)
 
+    @property
+    def components(self) -> Components:
+        return self._components
+
+    @components.setter
+    def components(self, components: Components) -> None:
+        Router._components_version += 1
+        self._components = components
+
     def __hash__(self) -> int:
         return hash(tuple(self.routes))
 
@@ -77,7 +250,19 @@ class Router:
         route, route_scope = self.resolve_route(scope)
         await route(route_scope, receive, send)
 
+    def _build_route_table(self) -> RouteTable:
+        """Create an empty route table, caching as many resolutions as configured for this router.
+
+        :return: Route table.
+        """
+        if self.route_cache_size is None:
+            return RouteTable()
+
+        return RouteTable(cache_size=self.route_cache_size)
+
     def _register_route_entry(self, route: BaseRoute) -> None:
+        Router._version += 1
+
         try:
             params = route._route_table_params
             self._route_table.add_entry(
@@ -104,6 +289,9 @@ class Router:
         route: Route | None = None,
         pagination: types.Pagination | None = None,
         tags: dict[str, t.Any] | None = None,
+        cache: http.ResponseCache | None = None,
+        output_validation: "OutputValidation | None" = None,
+        etag: http.ResponseETag | None = None,
     ) -> Route:
         """Register a new HTTP route in this router under given path.
 
@@ -115,6 +303,9 @@ class Router:
         :param route: HTTP route.
         :param pagination: Apply a pagination technique.
         :param tags: Tags to add to the route or endpoint.
+        :param cache: Cache for the responses of the route.
+        :param output_validation: Policy for validating the output of the route.
+        :param etag: Entity tags for the responses of the route.
         :return: Route.
         """
         if path is not None and endpoint is not None:
@@ -126,6 +317,9 @@ class Router:
                 include_in_schema=include_in_schema,
                 pagination=pagination,
                 tags=tags,
+                cache=cache,
+                output_validation=output_validation,
+                etag=etag,
             )
 
         if route is None:
@@ -145,6 +339,9 @@ class Router:
         include_in_schema: bool = True,
         pagination: types.Pagination | None = None,
         tags: dict[str, t.Any] | None = None,
+        cache: http.ResponseCache | None = None,
+        output_validation: "OutputValidation | None" = None,
+        etag: http.ResponseETag | None = None,
     ) -> t.Callable[[types.HTTPHandler], types.HTTPHandler]:
         """Decorator version for registering a new HTTP route in this router under given path.
 
@@ -154,6 +351,9 @@ class Router:
         :param include_in_schema: True if this route or endpoint should be declared as part of the API schema.
         :param pagination: Apply a pagination technique.
         :param tags: Tags to add to the endpoint.
+        :param cache: Cache for the responses of the route.
+        :param output_validation: Policy for validating the output of the route.
+        :param etag: Entity tags for the responses of the route.
         :return: Decorated route.
         """
 
@@ -166,6 +366,9 @@ class Router:
                 include_in_schema=include_in_schema,
                 pagination=pagination,
                 tags=tags,
+                cache=cache,
+                output_validation=output_validation,
+                etag=etag,
             )
             return func
 
@@ -262,15 +465,43 @@ class Router:
         :raise NotFoundException: If route cannot be resolved.
         :return: Route and its scope.
         """
-        scope_type = ScopeType.__members__.get(scope["type"], ScopeType(0))
+        resolved = self.resolve(scope)
+        return resolved.route, resolved.scope
+
+    def resolve(self, scope: types.Scope) -> ResolvedRoute:
+        """Resolve the route that matches given ASGI scope.
+
+        The resolution is stored in the scope and the route scope, so any later resolution of the same request made by
+        this router, or by the routers of the mounted apps, is served from it without matching the path again.
+
+        :param scope: ASGI scope.
+        :raise MethodNotAllowedException: If route is resolved but http method is not valid.
+        :raise NotFoundException: If route cannot be resolved.
+        :return: Resolved route.
+        """
+        if (resolved := ResolvedRoute.from_scope(scope, self)) is not None:
+            return resolved
+
+        if (compiled := self._compiled_table()) is not None:
+            resolved = self._resolve_compiled(scope, *compiled)
+        else:
+            result = self._match(scope, self._route_table)
+            resolved = self._resolve_result(scope, self.routes[result.index], result)
+
+        scope[ResolvedRoute.SCOPE_KEY] = resolved
+        return resolved
+
+    def _match(self, scope: types.Scope, route_table: RouteTable) -> ResolveResult:
         path = scope.get("path", "")
-        result = _parse_resolve_result(self._route_table.resolve(path, scope_type, scope.get("method", "")))
+        scope_type = ScopeType.__members__.get(scope["type"], ScopeType(0))
+        result = _parse_resolve_result(route_table.resolve(path, scope_type, scope.get("method", "")))
 
         if result is None:
             raise exceptions.NotFoundException(path=scope.get("root_path", "") + path, params=scope.get("path_params"))
 
-        route = self.routes[result.index]
+        return result
 
+    def _resolve_result(self, scope: types.Scope, route: BaseRoute, result: ResolveResult) -> ResolvedRoute:
         if result.type == ResolveType.method_not_allowed:
             route_scope = types.Scope({**scope, **route.route_scope(scope)})
             raise exceptions.MethodNotAllowedException(
@@ -280,21 +511,158 @@ class Router:
             )
 
         if result.type == ResolveType.mount:
-            is_flama = types.is_flama_instance(route.app)
-            mount_scope = {"app": route.app if is_flama else scope["app"]}
-            if "path" in scope:
-                mount_scope["root_path"] = (
-                    "" if is_flama else str(url.Path(scope.get("root_path", "")) / (result.matched or ""))
-                )
-                mount_scope["path"] = str(url.Path("/") / (result.unmatched or ""))
-            route_scope = types.Scope({**scope, **mount_scope})
+            return self._resolve_mount(route, scope, result)
+
+        resolved = ResolvedRoute(
+            router=self,
+            key=ResolvedRoute.scope_key(scope),
+            route=route,
+            scope=types.Scope({**scope, **route.route_scope(scope)}),
+            path_params=route.path.load_parameters(result.params),
+            matched=result.matched,
+            unmatched=result.unmatched,
+        )
+        resolved.scope[ResolvedRoute.SCOPE_KEY] = resolved
+        return resolved
+
+    def _resolve_compiled(
+        self, scope: types.Scope, route_table: RouteTable, entries: list[_CompiledEntry]
+    ) -> ResolvedRoute:
+        result = self._match(scope, route_table)
+        entry = entries[result.index]
+
+        if entry.prefix is None:
+            return self._resolve_result(scope, entry.route, result)
+
+        # Rebuild the scope the innermost Flama app would receive through its mount points
+        prefix = entry.prefix.match(scope["path"])
+        nested_scope = types.Scope(
+            {**scope, "app": entry.router.app, "root_path": "", "path": str(url.Path("/") / (prefix.unmatched or ""))}
+        )
+
+        if result.type == ResolveType.full:
+            route = entry.route
+            params = result.params[len(result.params) - len(route.path._param_order) :]
+            nested = ResolvedRoute(
+                router=entry.router,
+                key=ResolvedRoute.scope_key(nested_scope),
+                route=route,
+                scope=types.Scope({**nested_scope, **route.route_scope(nested_scope)}),
+                path_params=route.path.load_parameters(params),
+                matched=nested_scope["path"],
+                unmatched="",
+            )
+            nested.scope[ResolvedRoute.SCOPE_KEY] = nested
+        else:
+            nested = entry.router.resolve(nested_scope)
+
+        return ResolvedRoute(
+            router=self,
+            key=ResolvedRoute.scope_key(scope),
+            route=nested.route,
+            scope=nested.scope,
+            path_params=nested.path_params,
+            matched=prefix.matched,
+            unmatched=prefix.unmatched,
+            mounts=(*entry.mounts, *nested.mounts),
+        )
+
+    def _compiled_table(self) -> tuple[RouteTable, list[_CompiledEntry]] | None:
+        """Route table merging the routes of all nested Flama apps, if compiled mounts are enabled.
+
+        It is built once the application is ready, and rebuilt only when a route is added to this router or to any
+        other one.
+
+        :return: Route table and the route of each one of its entries, or None if not available.
+        """
+        if not self.compiled_mounts or self.app.status != types.AppStatus.READY:
+            return None
+
+        if self._compiled is None or self._compiled[0] != Router._version:
+            route_table, entries = self._build_route_table(), []
+            for path, params, entry in self._compile_entries():
+                route_table.add_entry(path._matcher, params.scope_type, params.accept_partial_path, params.methods)
+                entries.append(entry)
+
+            self._compiled = (Router._version, route_table, entries)
+
+        return self._compiled[1], self._compiled[2]
+
+    def _compile_entries(
+        self, mounts: tuple[BaseRoute, ...] = (), prefix: url.Path | None = None
+    ) -> t.Iterator[tuple[url.Path, RouteTableParams, _CompiledEntry]]:
+        """Flatten the routes of this router, replacing Flama mount points by their routes with prefixed paths.
+
+        :param mounts: Flama mount points traversed to reach this router.
+        :param prefix: Path of the traversed mount points, concatenated.
+        :return: Path, route table parameters and route of each entry, in resolution order.
+        """
+        for route in self.routes:
+            try:
+                params = route._route_table_params
+            except (AttributeError, TypeError, ValueError):
+                continue
+
+            path = route.path if prefix is None else prefix / route.path
+
+            # Mount points are flattened only if no path parameter is declared twice along any of the resulting paths
+            if (
+                _is_flama_mount(route)
+                and (nested := _nested_parameters(route.app.router)) is not None
+                and not nested & path._parameters.keys()
+            ):
+                yield from t.cast(Router, route.app.router)._compile_entries((*mounts, route), path)
+                continue
+
+            entry = _CompiledEntry(route=route, router=self, mounts=mounts, prefix=prefix)
+            yield path, params, entry
+
+            # The root route of a mounted app is also reached through the mount point path without trailing slash
+            if prefix is not None and route.path.path in ("", "/") and not params.accept_partial_path:
+                if (root := prefix.path.rstrip("/")) and root != path.path:
+                    yield url.Path(root), params, entry
+
+    def _resolve_mount(self, mount: BaseRoute, scope: types.Scope, result: ResolveResult) -> ResolvedRoute:
+        is_flama = types.is_flama_instance(mount.app)
+        mount_scope = {"app": mount.app if is_flama else scope["app"], Mount.SCOPE_KEY: mount}
+        if "path" in scope:
+            mount_scope["root_path"] = (
+                "" if is_flama else str(url.Path(scope.get("root_path", "")) / (result.matched or ""))
+            )
+            mount_scope["path"] = str(url.Path("/") / (result.unmatched or ""))
+        mount_scope = types.Scope({**scope, **mount_scope})
+
+        resolved = ResolvedRoute(
+            router=self,
+            key=ResolvedRoute.scope_key(scope),
+            route=mount,
+            scope=mount_scope,
+            path_params=mount.path.load_parameters(result.params),
+            matched=result.matched,
+            unmatched=result.unmatched,
+            mounts=(mount,),
+        )
+
+        nested_router = mount.app.router if is_flama else mount.app
+        if isinstance(nested_router, Router):
+            nested = nested_router.resolve(mount_scope)
+        else:
             try:
-                return route.app.resolve_route(route_scope)
+                route, route_scope = mount.app.resolve_route(mount_scope)
             except AttributeError:
-                return route, route_scope
+                return resolved
 
-        route_scope = types.Scope({**scope, **route.route_scope(scope)})
-        return route, route_scope
+            nested = ResolvedRoute(
+                router=nested_router, key=ResolvedRoute.scope_key(mount_scope), route=route, scope=route_scope
+            )
+
+        return dataclasses.replace(
+            resolved,
+            route=nested.route,
+            scope=nested.scope,
+            path_params=nested.path_params,
+            mounts=(mount, *nested.mounts),
+        )
 
     def resolve_url(self, name: str, **path_params: t.Any) -> url.URL:
         """Look for a route URL given the route name and path params.
@@ -303,9 +671,45 @@ class Router:
         :param path_params: Path params.
         :return: Route URL.
         """
-        for route in self.routes:
-            try:
-                return route.resolve_url(name, **path_params)
-            except exceptions.NotFoundException:
-                pass
+        index, dynamic = self._build_url_index()
+
+        candidates = index.get(name, [])
+        if dynamic:
+            candidates = sorted([*candidates, *dynamic], key=lambda x: x[0])
+
+        for _, candidate in candidates:
+            if isinstance(candidate, _URLTemplate):
+                if (result := candidate.build(path_params)) is not None:
+                    return result
+            else:
+                try:
+                    return candidate.resolve_url(name, **path_params)
+                except exceptions.NotFoundException:
+                    pass
+
         raise exceptions.NotFoundException(params=path_params, name=name)
+
+    def _build_url_index(
+        self,
+    ) -> tuple[dict[str, list[tuple[int, _URLTemplate | BaseRoute]]], list[tuple[int, BaseRoute]]]:
+        """Index the reverse URLs of all named routes, including the ones in mounted apps, by their full name.
+
+        Routes that define their own URL resolution are kept apart as candidates for any name. The index is rebuilt
+        only when a route is added to this router or to any other one.
+
+        :return: Compiled templates by name and routes with custom resolution, both along with their route position.
+        """
+        version, index, dynamic = self._url_index
+        if version == Router._version:
+            return index, dynamic
+
+        index, dynamic = {}, []
+        for position, route in enumerate(self.routes):
+            if (templates := _url_templates(route)) is None:
+                dynamic.append((position, route))
+            else:
+                for name, template in templates:
+                    index.setdefault(name, []).append((position, template))
+
+        self._url_index = (Router._version, index, dynamic)
+        return index, dynamic
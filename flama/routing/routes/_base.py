@@ -11,7 +11,15 @@ from flama.pagination import paginator
 from flama.schemas.routing import ParametersDescriptor
 from flama.types.http import Method
 
-__all__ = ["BaseEndpointWrapper", "BaseRoute", "ResolveResult", "ResolveType", "RouteTableParams", "ScopeType"]
+__all__ = [
+    "BaseEndpointWrapper",
+    "BaseRoute",
+    "ResolveResult",
+    "ResolveType",
+    "ResolvedRoute",
+    "RouteTableParams",
+    "ScopeType",
+]
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +53,69 @@ class ResolveResult:
     allowed_methods: tuple[Method, ...] | None = None
 
 
+@dataclasses.dataclass(frozen=True, slots=True, eq=False)
+class ResolvedRoute:
+    """Route resolved by a router for a given scope.
+
+    It is stored in the scope under the :attr:`SCOPE_KEY` key, so every consumer of the same request (middleware,
+    router, endpoint wrappers, components) reuses it instead of resolving the route again.
+
+    :param router: Router that resolved the route.
+    :param key: Scope values the resolution depends on (type, root path, path and method).
+    :param route: Resolved route, the innermost one when resolved through mount points.
+    :param scope: Scope for the resolved route.
+    :param path_params: Path parameters of the resolved route.
+    :param matched: Part of the path matched at the router level.
+    :param unmatched: Part of the path not matched at the router level.
+    :param mounts: Mount points traversed from the router to the resolved route.
+    """
+
+    SCOPE_KEY: t.ClassVar[str] = "resolved_route"
+
+    router: t.Any
+    key: tuple[str, str, str, str]
+    route: "BaseRoute"
+    scope: types.Scope
+    path_params: dict[str, t.Any] = dataclasses.field(default_factory=dict)
+    matched: str | None = None
+    unmatched: str | None = None
+    mounts: tuple["BaseRoute", ...] = ()
+
+    def __hash__(self) -> int:
+        return hash((id(self.router), self.key, self.route))
+
+    def __eq__(self, other: t.Any) -> bool:
+        return (
+            isinstance(other, ResolvedRoute)
+            and self.router is other.router
+            and self.key == other.key
+            and self.route == other.route
+        )
+
+    @staticmethod
+    def scope_key(scope: types.Scope) -> tuple[str, str, str, str]:
+        """Build the values that identify a resolution for given scope.
+
+        :param scope: ASGI scope.
+        :return: Resolution key.
+        """
+        return (scope["type"], scope.get("root_path", ""), scope.get("path", ""), scope.get("method", ""))
+
+    @classmethod
+    def from_scope(cls, scope: types.Scope, router: t.Any) -> "ResolvedRoute | None":
+        """Look for a resolution made by given router for the current values of the scope.
+
+        :param scope: ASGI scope.
+        :param router: Router.
+        :return: The resolution if it is still valid for the scope, None otherwise.
+        """
+        resolved = scope.get(cls.SCOPE_KEY)
+        if resolved is None or resolved.router is not router or resolved.key != cls.scope_key(scope):
+            return None
+
+        return resolved
+
+
 class BaseEndpointWrapper(abc.ABC):
     def __init__(
         self,
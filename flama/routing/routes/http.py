@@ -9,6 +9,9 @@ from flama.routing.routes._base import BaseEndpointWrapper, BaseRoute, RouteTabl
 from flama.schemas.data_structures import Schema
 from flama.types.http import Method
 
+if t.TYPE_CHECKING:
+    from flama.schemas.validation import OutputValidation
+
 __all__ = ["Route"]
 
 logger = logging.getLogger(__name__)
@@ -22,30 +25,42 @@ class BaseHTTPEndpointWrapper(BaseEndpointWrapper):
         *,
         signature: inspect.Signature | None = None,
         pagination: types.Pagination | None = None,
+        output_validation: "OutputValidation | None" = None,
+        etag: http.ResponseETag | None = None,
     ):
         """Wraps an HTTP function or endpoint into ASGI application.
 
         :param handler: Function or endpoint.
         :param signature: Handler signature.
         :param pagination: Apply a pagination technique.
+        :param output_validation: Policy for validating the output, the application one if not given.
+        :param etag: Entity tags for the responses, the application ones if not given.
         """
         super().__init__(handler, signature=signature, pagination=pagination)
 
+        self.output_validation = output_validation
+        self.etag = etag
+
         try:
             self.schema = Schema.from_type(signature.return_annotation).unique_schema if signature else None
         except Exception:
             self.schema = None
 
-    def _build_api_response(self, response: http.Response | None) -> http.Response:
+    def _build_api_response(self, response: http.Response | None, app: types.App) -> http.Response:
         """Build an API response given a handler and the current response.
 
         It infers the output schema from the handler signature or just wraps the response in a APIResponse object.
 
         :param response: The current response.
+        :param app: The application handling the request.
         :return: An API response.
         """
         if isinstance(response, dict | list):
-            response = APIResponse(response, schema=self.schema)
+            response = APIResponse(
+                response,
+                schema=self.schema,
+                output_validation=self.output_validation or getattr(app, "output_validation", None),
+            )
         elif isinstance(response, str | bytes):
             response = APIResponse(response)
         elif response is None:
@@ -53,6 +68,19 @@ class BaseHTTPEndpointWrapper(BaseEndpointWrapper):
 
         return response
 
+    def _tag_response(self, response: http.Response, app: types.App, scope: types.Scope) -> http.Response:
+        """Tag a response with an entity tag, if enabled for this endpoint or the application handling the request.
+
+        :param response: The current response.
+        :param app: The application handling the request.
+        :param scope: ASGI scope.
+        :return: The tagged response, or a ``304 Not Modified`` one if the client representation is still valid.
+        """
+        if (etag := self.etag or getattr(app, "etag", None)) is None:
+            return response
+
+        return etag(response, scope)
+
 
 class HTTPFunctionWrapper(BaseHTTPEndpointWrapper):
     async def __call__(self, scope: types.Scope, receive: types.Receive, send: types.Send) -> None:
@@ -79,7 +107,7 @@ class HTTPFunctionWrapper(BaseHTTPEndpointWrapper):
         try:
             injected_func = await app.injector.inject(self.handler, context)
             response = await concurrency.run(injected_func)
-            response = self._build_api_response(response)
+            response = self._tag_response(self._build_api_response(response, app), app, route_scope)
 
             await response(route_scope, receive, send)
         finally:
@@ -99,7 +127,7 @@ class HTTPEndpointWrapper(BaseHTTPEndpointWrapper):
         endpoint = self.handler(scope, receive, send)
 
         try:
-            response = self._build_api_response(await endpoint)
+            response = self._tag_response(self._build_api_response(await endpoint, scope["app"]), scope["app"], scope)
 
             await response(scope, receive, send)
         finally:
@@ -117,6 +145,9 @@ class Route(BaseRoute):
         include_in_schema: bool = True,
         pagination: types.Pagination | None = None,
         tags: dict[str, t.Any] | None = None,
+        cache: http.ResponseCache | None = None,
+        output_validation: "OutputValidation | None" = None,
+        etag: http.ResponseETag | None = None,
     ) -> None:
         """A route definition of a http endpoint.
 
@@ -127,6 +158,9 @@ class Route(BaseRoute):
         :param include_in_schema: True if this route must be listed as part of the App schema.
         :param pagination: Apply a pagination technique.
         :param tags: Route tags.
+        :param cache: Cache for the responses of this route.
+        :param output_validation: Policy for validating the output of this route, the application one if not given.
+        :param etag: Entity tags for the responses of this route, the application ones if not given.
         """
         if not (self.is_endpoint(endpoint) or (not inspect.isclass(endpoint) and callable(endpoint))):
             raise exceptions.ApplicationError("Endpoint must be a callable or an HTTPEndpoint subclass")
@@ -143,19 +177,44 @@ class Route(BaseRoute):
         wrapped_endpoint = (
             endpoint
             if isinstance(endpoint, BaseHTTPEndpointWrapper)
-            else HTTPEndpointWrapper(endpoint, signature=inspect.signature(endpoint), pagination=pagination)
+            else HTTPEndpointWrapper(
+                endpoint,
+                signature=inspect.signature(endpoint),
+                pagination=pagination,
+                output_validation=output_validation,
+                etag=etag,
+            )
             if inspect.isclass(endpoint)
-            else HTTPFunctionWrapper(endpoint, signature=inspect.signature(endpoint), pagination=pagination)
+            else HTTPFunctionWrapper(
+                endpoint,
+                signature=inspect.signature(endpoint),
+                pagination=pagination,
+                output_validation=output_validation,
+                etag=etag,
+            )
         )
 
         super().__init__(path, wrapped_endpoint, name=name, include_in_schema=include_in_schema, tags=tags)
 
         self.app: BaseHTTPEndpointWrapper
+        self.cache = cache
 
     async def __call__(self, scope: types.Scope, receive: types.Receive, send: types.Send) -> None:
         if scope["type"] == "http":
             await self.handle(types.Scope({**scope, **self.route_scope(scope)}), receive, send)
 
+    async def handle(self, scope: types.Scope, receive: types.Receive, send: types.Send) -> None:
+        """Performs a request by calling the app of this route, through the response cache if any.
+
+        :param scope: ASGI scope.
+        :param receive: ASGI receive event.
+        :param send: ASGI send event.
+        """
+        if self.cache is None:
+            await super().handle(scope, receive, send)
+        else:
+            await self.cache(self.app, scope, receive, send)
+
     def __hash__(self) -> int:
         return hash((self.app, self.path, self.name, tuple(self.methods)))
 
@@ -10,6 +10,8 @@ logger = logging.getLogger(__name__)
 
 
 class Mount(BaseRoute):
+    SCOPE_KEY: t.ClassVar[str] = "mount"
+
     def __init__(
         self,
         path: str | url.Path,
@@ -31,7 +33,10 @@ class Mount(BaseRoute):
         if scope["type"] in ("http", "websocket") or (
             scope["type"] == "lifespan" and types.is_flama_instance(self.app)
         ):
-            await self.handle(types.Scope({**scope, **self.route_scope(scope)}), receive, send)
+            if scope.get(self.SCOPE_KEY) is not self:
+                scope = types.Scope({**scope, **self.route_scope(scope)})
+
+            await self.handle(scope, receive, send)
 
     def _build(self, app: types.App) -> None:
         """Build step for routes.
@@ -82,12 +87,13 @@ class Mount(BaseRoute):
         * endpoint: The endpoint of this mount point
         * root_path: The root path of this mount point (if it's mounting a Flama app, it will be empty)
         * path: The remaining path to be matched
+        * mount: This mount point, so an already built scope is not built again when calling it
 
         :param scope: ASGI scope.
         :return: Route scope.
         """
         is_flama = types.is_flama_instance(self.app)
-        result = {"app": self.app if is_flama else scope["app"]}
+        result = {"app": self.app if is_flama else scope["app"], self.SCOPE_KEY: self}
 
         if "path" in scope:
             path = scope["path"]
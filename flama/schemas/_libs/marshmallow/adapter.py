@@ -1,4 +1,5 @@
 import enum
+import functools
 import inspect
 import itertools
 import typing as t
@@ -79,19 +80,47 @@ class MarshmallowAdapter(Adapter[Schema, Field]):
         except marshmallow.ValidationError as exc:
             raise SchemaValidationError(errors=exc.normalized_messages())
 
+    def validate_many(
+        self, schema: type[Schema] | Schema, values: t.Sequence[dict[str, t.Any]], *, partial: bool = False
+    ) -> list[dict[str, t.Any]]:
+        try:
+            return t.cast(
+                list[dict[str, t.Any]],
+                self._schema_instance(schema).load(values, many=True, unknown=marshmallow.EXCLUDE, partial=partial),
+            )
+        except marshmallow.ValidationError:
+            # Validate values one by one to report the errors exactly as a single value validation does.
+            return super().validate_many(schema, values, partial=partial)
+
     def load(self, schema: type[Schema] | Schema, value: dict[str, t.Any]) -> Schema:
         return t.cast(Schema, self._schema_instance(schema).load(value))
 
-    def dump(self, schema: type[Schema] | Schema, value: dict[str, t.Any]) -> dict[str, t.Any]:
+    def dump(
+        self, schema: type[Schema] | Schema, value: dict[str, t.Any], *, validate: bool = True
+    ) -> dict[str, t.Any]:
         try:
             dump_value = t.cast(dict[str, t.Any], self._schema_instance(schema).dump(value))
         except Exception as exc:
             raise SchemaValidationError(errors=str(exc))
 
-        self.validate(schema, dump_value)
+        if validate:
+            self.validate(schema, dump_value)
 
         return dump_value
 
+    def dump_many(
+        self, schema: type[Schema] | Schema, values: t.Sequence[dict[str, t.Any]], *, validate: bool = True
+    ) -> list[dict[str, t.Any]]:
+        try:
+            dump_values = t.cast(list[dict[str, t.Any]], self._schema_instance(schema).dump(values, many=True))
+        except Exception as exc:
+            raise SchemaValidationError(errors=str(exc))
+
+        if validate:
+            self.validate_many(schema, dump_values)
+
+        return dump_values
+
     def name(self, schema: Schema | type[Schema], *, prefix: str | None = None) -> str:
         s = self.unique_schema(schema)
         schema_name = f"{prefix or ''}{s.__qualname__}"
@@ -164,9 +193,13 @@ class MarshmallowAdapter(Adapter[Schema, Field]):
             return None
 
     def schema_fields(self, schema: Schema | type[Schema]) -> dict[str, tuple[None | type | Schema, Field]]:
-        return {
-            name: (self._get_field_type(field), field) for name, field in self._schema_instance(schema).fields.items()
-        }
+        if isinstance(schema, Schema):
+            return self._build_schema_fields(schema)
+
+        return dict(_schema_fields(self, schema))
+
+    def _build_schema_fields(self, schema: Schema) -> dict[str, tuple[None | type | Schema, Field]]:
+        return {name: (self._get_field_type(field), field) for name, field in schema.fields.items()}
 
     def is_schema(self, obj: t.Any) -> t.TypeGuard[Schema | type[Schema]]:
         return isinstance(obj, Schema) or (inspect.isclass(obj) and issubclass(obj, Schema))
@@ -176,8 +209,30 @@ class MarshmallowAdapter(Adapter[Schema, Field]):
 
     def _schema_instance(self, schema: type[Schema] | Schema) -> Schema:
         if inspect.isclass(schema) and issubclass(schema, Schema):
-            return schema()
+            return _schema_instance(schema)
         elif isinstance(schema, Schema):
             return schema
         else:
             raise ValueError("Wrong schema")
+
+
+@functools.lru_cache(maxsize=2**8)
+def _schema_instance(schema: type[Schema]) -> Schema:
+    """Instance of given schema class, cached as instantiating one binds a copy of every declared field. Loading and
+    dumping take their options per call, so a single instance serves every call.
+
+    :param schema: Schema class.
+    :return: Schema instance.
+    """
+    return schema()
+
+
+@functools.lru_cache(maxsize=2**8)
+def _schema_fields(adapter: MarshmallowAdapter, schema: type[Schema]) -> dict[str, tuple[None | type | Schema, Field]]:
+    """Fields of given schema class along with their types, cached as they are worked out from the bound fields.
+
+    :param adapter: Marshmallow adapter.
+    :param schema: Schema class.
+    :return: Schema fields.
+    """
+    return adapter._build_schema_fields(_schema_instance(schema))
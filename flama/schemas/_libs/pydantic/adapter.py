@@ -1,4 +1,5 @@
 import copy
+import functools
 import inspect
 import typing as t
 
@@ -94,6 +95,30 @@ class PydanticAdapter(Adapter[Schema, Field]):
                 }
             )
 
+    def validate_many(
+        self, schema: Schema | type[Schema], values: t.Sequence[dict[str, t.Any]], *, partial: bool = False
+    ) -> list[dict[str, t.Any]]:
+        schema_cls = self.unique_schema(schema)
+        type_adapter = _type_adapter(list[schema_cls])
+
+        try:
+            return type_adapter.dump_python(type_adapter.validate_python(values), exclude_unset=partial)
+        except pydantic.ValidationError:
+            # Validate values one by one to report the errors exactly as a single value validation does.
+            return super().validate_many(schema, values, partial=partial)
+
+    def validate_json(
+        self, schema: Schema | type[Schema], value: bytes, *, partial: bool = False
+    ) -> dict[str, t.Any] | list[dict[str, t.Any]]:
+        schema_cls = self.unique_schema(schema)
+        type_adapter = _type_adapter(list[schema_cls] if value.lstrip()[:1] == b"[" else schema_cls)
+
+        try:
+            return type_adapter.dump_python(type_adapter.validate_json(value), exclude_unset=partial)
+        except pydantic.ValidationError:
+            # Decode and validate the document again to report the errors exactly as a decoded value validation does.
+            return super().validate_json(schema, value, partial=partial)
+
     def _json_safe(self, value: t.Any) -> t.Any:
         """Recursively replace values that JSON cannot represent with their repr.
 
@@ -119,11 +144,26 @@ class PydanticAdapter(Adapter[Schema, Field]):
 
         return schema_cls(**value)
 
-    def dump(self, schema: Schema | type[Schema], value: dict[str, t.Any]) -> dict[str, t.Any]:
+    def dump(
+        self, schema: Schema | type[Schema], value: dict[str, t.Any], *, validate: bool = True
+    ) -> dict[str, t.Any]:
         schema_cls = self.unique_schema(schema)
 
+        if not validate:
+            # Build the model without validating the value, so it is serialized as the schema defines. Nested values
+            # that were not validated are serialized as they are.
+            return schema_cls.model_construct(**value).model_dump(warnings=False)
+
         return self.validate(schema_cls, value)
 
+    def dump_many(
+        self, schema: Schema | type[Schema], values: t.Sequence[dict[str, t.Any]], *, validate: bool = True
+    ) -> list[dict[str, t.Any]]:
+        if not validate:
+            return super().dump_many(schema, values, validate=False)
+
+        return self.validate_many(schema, values)
+
     def name(self, schema: Schema | type[Schema], *, prefix: str | None = None) -> str:
         schema_cls = self.unique_schema(schema)
 
@@ -206,3 +246,13 @@ class PydanticAdapter(Adapter[Schema, Field]):
 
     def is_field(self, obj: t.Any) -> t.TypeGuard[Field]:
         return isinstance(obj, Field)
+
+
+@functools.lru_cache(maxsize=2**8)
+def _type_adapter(type_: t.Any) -> pydantic.TypeAdapter:
+    """Type adapter for given type, cached as building one compiles its validator and serializer.
+
+    :param type_: Type.
+    :return: Type adapter.
+    """
+    return pydantic.TypeAdapter(type_)
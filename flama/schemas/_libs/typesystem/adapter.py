@@ -1,4 +1,5 @@
 import enum
+import functools
 import inspect
 import itertools
 import typing as t
@@ -73,11 +74,27 @@ class TypesystemAdapter(Adapter[Schema, Field]):
         except typesystem.ValidationError as errors:
             raise SchemaValidationError(errors={k: [v] for k, v in errors.items()})
 
+    def validate_many(self, schema: Schema, values: t.Sequence[dict[str, t.Any]], *, partial: bool = False) -> t.Any:
+        if partial:
+            return super().validate_many(schema, values, partial=partial)
+
+        try:
+            return _array(schema).validate(list(values))
+        except typesystem.ValidationError:
+            # Validate values one by one to report the errors exactly as a single value validation does.
+            return super().validate_many(schema, values)
+
     def load(self, schema: Schema, value: dict[str, t.Any]) -> t.Any:
         return schema.validate(value)
 
-    def dump(self, schema: Schema, value: dict[str, t.Any]) -> t.Any:
-        return self._dump(self.validate(schema, value))
+    def dump(self, schema: Schema, value: dict[str, t.Any], *, validate: bool = True) -> t.Any:
+        return self._dump(self.validate(schema, value) if validate else schema.serialize(value))
+
+    def dump_many(self, schema: Schema, values: t.Sequence[dict[str, t.Any]], *, validate: bool = True) -> t.Any:
+        if not validate:
+            return super().dump_many(schema, values, validate=False)
+
+        return self._dump(self.validate_many(schema, values))
 
     def _dump(self, value: t.Any) -> t.Any:
         if isinstance(value, list):
@@ -156,10 +173,33 @@ class TypesystemAdapter(Adapter[Schema, Field]):
             Field,
         ],
     ]:
-        return {name: (self._get_field_type(field), field) for name, field in schema.fields.items()}
+        return dict(_schema_fields(self, schema))
 
     def is_schema(self, obj: t.Any) -> t.TypeGuard[Schema]:
         return isinstance(obj, Schema) or (inspect.isclass(obj) and issubclass(obj, Schema))
 
     def is_field(self, obj: t.Any) -> t.TypeGuard[Field]:
         return isinstance(obj, Field) or (inspect.isclass(obj) and issubclass(obj, Field))
+
+
+@functools.lru_cache(maxsize=2**8)
+def _array(schema: Schema) -> typesystem.Array:
+    """Array of given schema, cached so validating many values does not build it on every call.
+
+    :param schema: Schema.
+    :return: Array field.
+    """
+    return typesystem.Array(items=schema)
+
+
+@functools.lru_cache(maxsize=2**8)
+def _schema_fields(
+    adapter: TypesystemAdapter, schema: Schema
+) -> dict[str, tuple[Schema | type | list[Schema | type] | dict[str, Schema | type], Field]]:
+    """Fields of given schema along with their types, cached as they are worked out walking every field.
+
+    :param adapter: Typesystem adapter.
+    :param schema: Schema.
+    :return: Schema fields.
+    """
+    return {name: (adapter._get_field_type(field), field) for name, field in schema.fields.items()}
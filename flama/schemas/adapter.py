@@ -1,6 +1,8 @@
 import abc
 import typing as t
 
+from flama._core.json_decoder import decode_json
+from flama._core.json_encoder import encode_json
 from flama.types import JSONSchema
 
 __all__ = ["Adapter"]
@@ -65,11 +67,75 @@ class Adapter(t.Generic[_T_Schema, _T_Field], metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def validate(self, schema: t.Any, values: dict[str, t.Any], *, partial: bool = False) -> dict[str, t.Any]: ...
 
+    def validate_many(
+        self, schema: t.Any, values: t.Sequence[dict[str, t.Any]], *, partial: bool = False
+    ) -> list[dict[str, t.Any]]:
+        """Validate a list of values using given schema.
+
+        Libraries able to validate a whole collection at once should override it to avoid validating each value
+        separately.
+
+        :param schema: Schema.
+        :param values: List of values.
+        :param partial: Partial validation.
+        :return: List of validated values.
+        """
+        return [self.validate(schema, value, partial=partial) for value in values]
+
+    def validate_json(
+        self, schema: t.Any, value: bytes, *, partial: bool = False
+    ) -> dict[str, t.Any] | list[dict[str, t.Any]]:
+        """Validate a JSON document, either an object or an array of objects, using given schema.
+
+        Libraries able to validate straight from JSON should override it to avoid decoding the document first.
+
+        :param schema: Schema.
+        :param value: JSON document.
+        :param partial: Partial validation.
+        :return: Validated value or list of values.
+        :raises ValueError: If the document is not valid JSON.
+        """
+        values = decode_json(value)
+
+        if isinstance(values, list):
+            return self.validate_many(schema, values, partial=partial)
+
+        return self.validate(schema, values or {}, partial=partial)
+
     @abc.abstractmethod
     def load(self, schema: t.Any, value: dict[str, t.Any]) -> _T_Schema: ...
 
     @abc.abstractmethod
-    def dump(self, schema: t.Any, value: dict[str, t.Any]) -> dict[str, t.Any]: ...
+    def dump(self, schema: t.Any, value: dict[str, t.Any], *, validate: bool = True) -> dict[str, t.Any]: ...
+
+    def dump_many(
+        self, schema: t.Any, values: t.Sequence[dict[str, t.Any]], *, validate: bool = True
+    ) -> list[dict[str, t.Any]]:
+        """Dump a list of values using given schema.
+
+        Libraries able to dump a whole collection at once should override it to avoid dumping each value separately.
+
+        :param schema: Schema.
+        :param values: List of values.
+        :param validate: Validate the values, otherwise they are trusted and only serialized.
+        :return: List of dumped values.
+        """
+        return [self.dump(schema, value, validate=validate) for value in values]
+
+    def dump_json(
+        self, schema: t.Any, value: dict[str, t.Any] | t.Sequence[dict[str, t.Any]], *, validate: bool = True
+    ) -> bytes:
+        """Dump a value, or a list of values, using given schema and encode the result as compact JSON.
+
+        :param schema: Schema.
+        :param value: Value or list of values.
+        :param validate: Validate the values, otherwise they are trusted and only serialized.
+        :return: JSON encoded value.
+        """
+        if isinstance(value, list | tuple):
+            return encode_json(self.dump_many(schema, value, validate=validate), compact=True)
+
+        return encode_json(self.dump(schema, value, validate=validate), compact=True)
 
     @t.overload
     @abc.abstractmethod
@@ -1,6 +1,8 @@
+import functools
+import json
 import typing as t
 
-from flama import codecs, exceptions, http, routing, types
+from flama import codecs, exceptions, http, routing, schemas, types
 from flama.http.data_structures import QueryParams, UploadFile
 from flama.injection import Component, Components
 from flama.injection.resolver import Parameter
@@ -54,6 +56,7 @@ class RequestDataComponent(Component):
         self.negotiator = codecs.HTTPContentTypeNegotiator(
             [
                 codecs.JSONDataCodec(),
+                codecs.NDJSONDataCodec(),
                 codecs.URLEncodedCodec(),
                 codecs.MultiPartCodec(
                     max_files=max_files,
@@ -73,21 +76,47 @@ class RequestDataComponent(Component):
         except exceptions.NoCodecAvailable:
             raise exceptions.HTTPException(415)
 
+        if isinstance(codec, codecs.JSONDataCodec):
+            # Keep the raw body so it can be validated straight from the bytes, and decode it only if asked for.
+            return types.RequestData(raw=await request.body(), decode=functools.partial(self._decode_json, codec))
+
         try:
             data = await codec.decode(request)
             return types.RequestData(data)
         except exceptions.DecodeError as exc:
             raise exceptions.HTTPException(400, detail=str(exc))
 
+    @staticmethod
+    def _decode_json(codec: codecs.JSONDataCodec, body: bytes) -> dict[str, t.Any] | None:
+        try:
+            return codec.loads(body)
+        except exceptions.DecodeError as exc:
+            raise exceptions.HTTPException(400, detail=str(exc))
+
+
+def _validate_data(schema: Schema, data: types.RequestData, *, partial: bool = False) -> t.Any:
+    """Validate request data using given schema, straight from the raw body if it was kept.
+
+    :param schema: Schema.
+    :param data: Request data.
+    :param partial: Partial validation.
+    :return: Validated data.
+    """
+    if data.raw is None:
+        return schema.validate(data.data, partial=partial)
+
+    try:
+        return schema.validate_json(data.raw, partial=partial)
+    except json.JSONDecodeError as exc:
+        raise exceptions.HTTPException(400, detail=f"Malformed JSON. {exc}")
+
 
 class ValidatePathParamsComponent(Component):
     async def resolve(
         self, request: http.Request, route: routing.BaseRoute, path_params: types.PathParams
     ) -> ValidatedPathParams:
-        fields = [p.field for p in route.parameters.path[request.method].values() if p.field is not None]
-
         try:
-            validated = Schema.build(name="ValidationSchema", fields=fields).validate(path_params)
+            validated = route.parameters.validator("path", request.method).validate(path_params)
             return ValidatedPathParams({k: v for k, v in path_params.items() if k in validated})
         except SchemaValidationError as exc:
             raise exceptions.ValidationError(detail=exc.errors)
@@ -98,7 +127,6 @@ class ValidateQueryParamsComponent(Component):
         self, request: http.Request, route: routing.BaseRoute, query_params: QueryParams
     ) -> ValidatedQueryParams:
         parameters = route.parameters.query[request.method]
-        fields = [p.field for p in parameters.values() if p.field is not None]
         # A query string expresses a collection by repeating a name, so a list-valued parameter takes
         # every value sent under its own, even when only one was. Any other parameter keeps the last.
         values: dict[str, str | list[str]] = {
@@ -109,7 +137,7 @@ class ValidateQueryParamsComponent(Component):
         }
 
         try:
-            validated = Schema.build(name="ValidationSchema", fields=fields).validate(values)
+            validated = route.parameters.validator("query", request.method).validate(values)
             return ValidatedQueryParams({k: v for k, v in values.items() if k in validated})
         except SchemaValidationError as exc:
             raise exceptions.ValidationError(detail=exc.errors)
@@ -125,20 +153,38 @@ class ValidateRequestDataComponent(Component):
             )
 
         try:
-            return ValidatedRequestData(body_param.schema.validate(data.data))
+            return ValidatedRequestData(_validate_data(body_param.schema, data))
         except SchemaValidationError as exc:  # pragma: no cover # safety net, just should not happen
             raise exceptions.ValidationError(detail=exc.errors)
 
 
 class PrimitiveParamComponent(Component):
+    def __init__(self):
+        self._validators: dict[tuple[Parameter, t.Any], Schema] = {}
+
     def can_handle_parameter(self, parameter: Parameter):
         return Field.is_http_valid_type(parameter.annotation)
 
+    def validator(self, parameter: Parameter) -> Schema:
+        """Schema for validating given parameter, built once per parameter and schema library.
+
+        :param parameter: Parameter to validate.
+        :return: Validation schema.
+        """
+        key = (parameter, schemas.adapter)
+        try:
+            return self._validators[key]
+        except KeyError:
+            validator = self._validators[key] = Schema.build(
+                name="ValidationSchema", fields=[Field.from_parameter(parameter)]
+            )
+            return validator
+
     def resolve(self, parameter: Parameter, path_params: ValidatedPathParams, query_params: ValidatedQueryParams):
         params = path_params if (parameter.name in path_params) else query_params
 
         try:
-            params = Schema.build(name="ValidationSchema", fields=[Field.from_parameter(parameter)]).validate(params)
+            params = self.validator(parameter).validate(params)
         except SchemaValidationError as exc:  # pragma: no cover # safety net, just should not happen
             raise exceptions.ValidationError(detail=exc.errors)
         return params.get(parameter.name, parameter.default)
@@ -157,7 +203,7 @@ class CompositeParamComponent(Component):
             )
 
         try:
-            return body_param.schema.validate(data.data, partial=types.is_schema_partial(parameter.annotation))
+            return _validate_data(body_param.schema, data, partial=types.is_schema_partial(parameter.annotation))
         except SchemaValidationError as exc:  # pragma: no cover # safety net, just should not happen
             raise exceptions.ValidationError(detail=exc.errors)
 
@@ -1,5 +1,6 @@
 import dataclasses
 import enum
+import functools
 import inspect
 import typing as t
 from types import UnionType
@@ -9,6 +10,11 @@ from flama.http.data_structures import UploadFile
 from flama.http.responses.response import Response, StreamingResponse
 from flama.injection.resolver import Parameter as InjectionParameter
 
+if t.TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, AsyncIterable
+
+    from flama.schemas.adapter import Adapter
+
 __all__ = ["Field", "Schema", "Parameter", "Parameters"]
 
 
@@ -107,28 +113,55 @@ class Field:
         return schemas.adapter.to_json_schema(self.field)
 
 
+@functools.lru_cache(maxsize=2**10)
+def _schema_from_type(type_: t.Any, adapter: "Adapter") -> t.Any:
+    """Schema for given type, cached as a partial schema is a brand-new schema class built every time it is derived.
+
+    The type carries the partial-ness and multiplicity of the schema, and the adapter is part of the key so each
+    schema library keeps its own derived schemas.
+
+    :param type_: Type.
+    :param adapter: Schema library adapter.
+    :return: Schema.
+    """
+    if types.is_schema(type_):
+        schema = types.get_schema_metadata(type_).schema
+
+        if types.is_schema_partial(type_):
+            schema = adapter.build_schema(
+                name=adapter.name(schema, prefix="Partial").rsplit(".", 1)[1], schema=schema, partial=True
+            )
+    elif t.get_origin(type_) in (list, tuple, set):
+        return _schema_from_type(t.get_args(type_)[0], adapter)
+    else:
+        schema = type_
+
+    if not adapter.is_schema(schema):
+        raise ValueError("Wrong schema type")
+
+    return schema
+
+
 @dataclasses.dataclass(frozen=True)
 class Schema:
     schema: t.Any = dataclasses.field(hash=False, compare=False)
 
     @classmethod
     def from_type(cls, type_: type | None) -> "Schema":
-        if types.is_schema(type_):
-            schema = types.get_schema_metadata(type_).schema
+        try:
+            schema = _schema_from_type(type_, schemas.adapter)
+        except TypeError:  # Unhashable types cannot be cached
+            schema = _schema_from_type.__wrapped__(type_, schemas.adapter)
 
-            if types.is_schema_partial(type_):
-                schema = schemas.adapter.build_schema(
-                    name=schemas.adapter.name(schema, prefix="Partial").rsplit(".", 1)[1], schema=schema, partial=True
-                )
-        elif t.get_origin(type_) in (list, tuple, set):
-            return cls.from_type(t.get_args(type_)[0])
-        else:
-            schema = type_
+        return cls(schema=schema)
 
-        if not schemas.adapter.is_schema(schema):
-            raise ValueError("Wrong schema type")
+    @classmethod
+    def cache_info(cls) -> "functools._CacheInfo":
+        """Hit and miss stats of the cache of schemas derived from types.
 
-        return cls(schema=schema)
+        :return: Cache stats.
+        """
+        return _schema_from_type.cache_info()
 
     @classmethod
     def build(
@@ -226,10 +259,29 @@ class Schema:
 
     def validate(self, values: dict[str, t.Any] | list[dict[str, t.Any]] | None, *, partial=False):
         if isinstance(values, list | tuple):
-            return [schemas.adapter.validate(self.schema, value, partial=partial) for value in values]
+            return schemas.adapter.validate_many(self.schema, values, partial=partial)
 
         return schemas.adapter.validate(self.schema, values or {}, partial=partial)
 
+    def validate_json(self, value: bytes, *, partial: bool = False) -> dict[str, t.Any] | list[dict[str, t.Any]]:
+        if not value:
+            return self.validate(None, partial=partial)
+
+        return schemas.adapter.validate_json(self.schema, value, partial=partial)
+
+    async def validate_stream(
+        self, values: "AsyncIterable[dict[str, t.Any]]", *, partial: bool = False
+    ) -> "AsyncGenerator[dict[str, t.Any], None]":
+        """Validate the values of an asynchronous stream one by one, as they arrive.
+
+        :param values: Stream of values, such as the items of :meth:`flama.http.Request.json_items`.
+        :param partial: Partial validation.
+        :return: Stream of validated values.
+        :raises SchemaValidationError: If a value is not valid, once the stream reaches it.
+        """
+        async for value in values:
+            yield self.validate(value, partial=partial)
+
     @t.overload
     def load(self, values: dict[str, t.Any]) -> t.Any: ...
 
@@ -250,10 +302,13 @@ class Schema:
 
     def dump(self, values):
         if isinstance(values, list | tuple):
-            return [schemas.adapter.dump(self.schema, value) for value in values]
+            return schemas.adapter.dump_many(self.schema, values)
 
         return schemas.adapter.dump(self.schema, values)
 
+    def dump_json(self, values: dict[str, t.Any] | list[dict[str, t.Any]], *, validate: bool = True) -> bytes:
+        return schemas.adapter.dump_json(self.schema, values, validate=validate)
+
 
 @dataclasses.dataclass(frozen=True)
 class Parameter:
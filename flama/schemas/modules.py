@@ -1,14 +1,89 @@
+import copy
+import dataclasses
 import typing as t
 
-from flama import exceptions, http, pagination, schemas, types
+from flama import codecs, concurrency, exceptions, http, pagination, schemas, types
+from flama._core.json_encoder import encode_json
+from flama.http.cache import etag_matches, generate_etag
 from flama.http.responses.openapi import OpenAPIResponse
+from flama.http.responses.response import BufferedResponse
 from flama.http.responses.templates import _FlamaTemplateResponse
 from flama.modules import Module
+from flama.routing.router import Router
 from flama.schemas.openapi import SchemaGenerator
 
 __all__ = ["SchemaModule"]
 
 
+class _ArtifactResponse(BufferedResponse[bytes, bytes]):
+    """Response for an already rendered body."""
+
+    def render(self, content: bytes) -> bytes:
+        return content
+
+
+@dataclasses.dataclass
+class _Artifact:
+    """A rendered document served as is, along with its entity tag and compressed variants.
+
+    Compressed variants are built in a worker thread the first time a client asks for them and kept from then on.
+
+    :param body: Rendered body.
+    :param media_type: Media type of the body.
+    :param etag: Strong entity tag of the body.
+    :param encoded: Compressed variants of the body by content encoding.
+    """
+
+    body: bytes
+    media_type: str
+    etag: str = dataclasses.field(init=False)
+    encoded: dict[str, bytes] = dataclasses.field(default_factory=dict, init=False)
+
+    negotiator: t.ClassVar[codecs.CompressionNegotiator] = codecs.CompressionNegotiator(
+        [codecs.BrotliCodec(quality=11), codecs.GzipCodec(level=9)]
+    )
+
+    def __post_init__(self) -> None:
+        self.etag = generate_etag(self.body)
+
+    async def response(self, request: http.Request) -> http.Response:
+        """Build a response for this artifact, or a ``304 Not Modified`` one if the client copy is still valid.
+
+        :param request: Request.
+        :return: Response.
+        """
+        headers = {"etag": self.etag, "vary": "Accept-Encoding"}
+
+        if (if_none_match := request.headers.get("if-none-match")) and etag_matches(if_none_match, self.etag):
+            return _ArtifactResponse(b"", status_code=304, headers=headers)
+
+        try:
+            codec = self.negotiator.negotiate(request.headers.get("accept-encoding"))
+        except exceptions.NoCodecAvailable:
+            return _ArtifactResponse(self.body, headers=headers, media_type=self.media_type)
+
+        if (body := self.encoded.get(codec.encoding)) is None:
+            body = self.encoded[codec.encoding] = await concurrency.run(codec.compress, self.body, True)
+
+        return _ArtifactResponse(
+            body, headers={**headers, "content-encoding": codec.encoding}, media_type=self.media_type
+        )
+
+
+@dataclasses.dataclass
+class _Document:
+    """The API schema along with its served artifacts.
+
+    :param schema: API schema.
+    :param openapi: Serialized API schema.
+    :param docs: Rendered docs page, once it has been asked for.
+    """
+
+    schema: dict[str, t.Any]
+    openapi: _Artifact
+    docs: _Artifact | None = None
+
+
 class SchemaModule(Module):
     name = "schema"
 
@@ -26,6 +101,10 @@ class SchemaModule(Module):
         self.schema_path = schema
         self.docs_path = docs
 
+        # Generated document, along with the router version and schema library it was generated for
+        self._document: tuple[int, t.Any, _Document] | None = None
+        self._generator: tuple[t.Any, SchemaGenerator] | None = None
+
     def register_schema(self, name: str, schema: t.Any) -> None:
         """Register a new schema.
 
@@ -33,23 +112,47 @@ class SchemaModule(Module):
         :param schema: Schema.
         """
         self.schemas[name] = schema
+        self._document = None
 
     @property
     def schema_generator(self) -> SchemaGenerator:
-        """Build an API Schema Generator.
+        """Build an API Schema Generator, kept and reused while the schema library and the registered schemas do not
+        change, so it only has to generate the paths added or changed since the last document.
 
         :return: API Schema Generator.
         """
         self.schemas.update({**schemas.schemas.SCHEMAS, **pagination.paginator.schemas})
-        return SchemaGenerator(spec=self.openapi, schemas=self.schemas)
+        key = (schemas.adapter, tuple((name, id(schema)) for name, schema in self.schemas.items()))
+
+        if self._generator is None or self._generator[0] != key:
+            self._generator = (key, SchemaGenerator(spec=self.openapi, schemas=self.schemas))
+
+        return self._generator[1]
+
+    @property
+    def document(self) -> _Document:
+        """The API schema and its served artifacts, generated once and again only when routes or the schema library
+        change.
+
+        :return: API document.
+        """
+        if self._document is not None and self._document[:2] == (Router._version, schemas.adapter):
+            return self._document[2]
+
+        schema = self.schema_generator.get_api_schema(self.app.routes)
+        document = _Document(schema, _Artifact(encode_json(schema, compact=True), OpenAPIResponse.media_type))
+        self._document = (Router._version, schemas.adapter, document)
+        return document
 
     @property
     def schema(self) -> dict[str, t.Any]:
         """Generate the API schema.
 
+        It is a copy of the one served, so it can be freely modified.
+
         :return: API schema.
         """
-        return self.schema_generator.get_api_schema(self.app.routes)
+        return copy.deepcopy(self.document.schema)
 
     @property
     def schema_library(self) -> schemas.Module:
@@ -74,8 +177,12 @@ class SchemaModule(Module):
         if self.docs_path:
             self.app.add_route(self.docs_path, self.docs_view, methods=["GET"], include_in_schema=False)
 
-    def schema_view(self) -> OpenAPIResponse:
-        return OpenAPIResponse(self.schema)
+    async def schema_view(self, request: http.Request) -> http.Response:
+        return await self.document.openapi.response(request)
 
-    def docs_view(self) -> http.HTMLResponse:
-        return _FlamaTemplateResponse("schemas/docs.html", context={"url": self.schema_path})
+    async def docs_view(self, request: http.Request) -> http.Response:
+        document = self.document
+        if document.docs is None:
+            response = _FlamaTemplateResponse("schemas/docs.html", context={"url": self.schema_path})
+            document.docs = _Artifact(response.body, t.cast(str, response.headers["content-type"]))
+        return await document.docs.response(request)
@@ -3,6 +3,7 @@ import inspect
 import itertools
 import logging
 import typing as t
+import weakref
 from collections import defaultdict
 
 import yaml
@@ -450,6 +451,25 @@ class OpenAPISpec:
 class OpenAPISchemaRegistry(SchemaRegistry):
     """Schema registry that resolves references against an OpenAPI ``#/components/schemas`` section."""
 
+    def __init__(self, schemas: dict[str, t.Any] | None = None):
+        self._json_schemas: dict[int, Schema] = {}
+        super().__init__(schemas)
+
+    def json_schema(self, schema: SchemaInfo) -> "Schema":
+        """JSON schema of a registered schema, generated once.
+
+        Names of registered schemas never change, and nested schemas are registered along with their parent, so the
+        JSON schema of a registered schema stays valid while the registry grows.
+
+        :param schema: Registered schema.
+        :return: JSON schema.
+        """
+        try:
+            return self._json_schemas[id(schema.schema)]
+        except KeyError:
+            result = self._json_schemas[id(schema.schema)] = Schema(schema.json_schema(self.names))
+            return result
+
     def _get_schema_references_from_schema(self, schema: "Schema | Reference") -> list[str]:
         if isinstance(schema, Reference):
             return [schema.ref]
@@ -574,8 +594,7 @@ class OpenAPISchemaRegistry(SchemaRegistry):
         while partial_schemas:
             schema = partial_schemas.pop()
             refs_from_schema = {
-                ref.split("/")[-1]
-                for ref in self._get_schema_references_from_schema(Schema(schema.json_schema(self.names)))
+                ref.split("/")[-1] for ref in self._get_schema_references_from_schema(self.json_schema(schema))
             }
             refs |= refs_from_schema
             discovered = {s for s in self.values() if s.name in refs_from_schema and s not in seen}
@@ -612,6 +631,21 @@ class OpenAPISchemaRegistry(SchemaRegistry):
             return Reference(ref=reference)
 
 
+@dataclasses.dataclass(frozen=True)
+class PathFragment:
+    """Path item generated for a single path, kept to be merged in later documents as long as the endpoints of its
+    path do not change.
+
+    :param key: Method and handler of every endpoint in the path.
+    :param item: Path item, or None when no operation could be generated.
+    :param value: Serialized path item.
+    """
+
+    key: tuple[tuple[str, t.Callable], ...]
+    item: Path | None
+    value: dict[str, t.Any] | None
+
+
 @dataclasses.dataclass(frozen=True)
 class EndpointInfo:
     path: str
@@ -630,6 +664,12 @@ class SchemaGenerator:
         # Builtin definitions
         self.schemas = OpenAPISchemaRegistry(schemas=schemas)
 
+        # Endpoints of every route, by base path, and fragments of the previously generated document, by path
+        self._endpoints: weakref.WeakKeyDictionary[routing.Route, dict[str, tuple[EndpointInfo, ...]]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._fragments: dict[str, PathFragment] = {}
+
     def get_endpoints(  # type: ignore[override]
         self, routes: list[routing.BaseRoute], base_path: str = ""
     ) -> dict[str, list[EndpointInfo]]:
@@ -650,47 +690,66 @@ class SchemaGenerator:
         endpoints_info: dict[str, list[EndpointInfo]] = defaultdict(list)
 
         for route in routes:
-            path = str(url.Path(base_path) / route.path)
-
             if isinstance(route, routing.Route) and route.include_in_schema:
-                if inspect.isfunction(route.endpoint) or inspect.ismethod(route.endpoint):
-                    for method in route.methods or ["GET"]:
-                        if method == "HEAD":
-                            continue
-
-                        endpoints_info[path].append(
-                            EndpointInfo(
-                                path=path,
-                                method=method.lower(),
-                                func=route.endpoint,
-                                query_parameters=route.parameters.query.get(method, {}),
-                                path_parameters=route.parameters.path.get(method, {}),
-                                body_parameter=route.parameters.body.get(method),
-                                response_parameter=route.parameters.response[method],
-                            )
-                        )
-                else:
-                    for method in [x.lower() for x in route.methods]:
-                        if not hasattr(route.endpoint, method):
-                            continue
-
-                        func = getattr(route.endpoint, method)
-                        endpoints_info[path].append(
-                            EndpointInfo(
-                                path=path,
-                                method=method.lower(),
-                                func=func,
-                                query_parameters=route.parameters.query.get(method.upper(), {}),
-                                path_parameters=route.parameters.path.get(method.upper(), {}),
-                                body_parameter=route.parameters.body.get(method.upper()),
-                                response_parameter=route.parameters.response[method.upper()],
-                            )
-                        )
+                for endpoint in self._get_route_endpoints(route, base_path):
+                    endpoints_info[endpoint.path].append(endpoint)
             elif isinstance(route, routing.Mount):
-                endpoints_info.update(self.get_endpoints(route.routes, base_path=path))
+                endpoints_info.update(self.get_endpoints(route.routes, base_path=str(url.Path(base_path) / route.path)))
 
         return endpoints_info
 
+    def _get_route_endpoints(self, route: routing.Route, base_path: str) -> tuple[EndpointInfo, ...]:
+        """Metadata of every endpoint of a route, gathered once per route and base path.
+
+        :param route: Route.
+        :param base_path: The base endpoints path.
+        :return: Endpoints metadata.
+        """
+        try:
+            return self._endpoints[route][base_path]
+        except KeyError:
+            pass
+
+        path = str(url.Path(base_path) / route.path)
+        endpoints: list[EndpointInfo] = []
+
+        if inspect.isfunction(route.endpoint) or inspect.ismethod(route.endpoint):
+            for method in route.methods or ["GET"]:
+                if method == "HEAD":
+                    continue
+
+                endpoints.append(
+                    EndpointInfo(
+                        path=path,
+                        method=method.lower(),
+                        func=route.endpoint,
+                        query_parameters=route.parameters.query.get(method, {}),
+                        path_parameters=route.parameters.path.get(method, {}),
+                        body_parameter=route.parameters.body.get(method),
+                        response_parameter=route.parameters.response[method],
+                    )
+                )
+        else:
+            for method in [x.lower() for x in route.methods]:
+                if not hasattr(route.endpoint, method):
+                    continue
+
+                func = getattr(route.endpoint, method)
+                endpoints.append(
+                    EndpointInfo(
+                        path=path,
+                        method=method.lower(),
+                        func=func,
+                        query_parameters=route.parameters.query.get(method.upper(), {}),
+                        path_parameters=route.parameters.path.get(method.upper(), {}),
+                        body_parameter=route.parameters.body.get(method.upper()),
+                        response_parameter=route.parameters.response[method.upper()],
+                    )
+                )
+
+        result = self._endpoints.setdefault(route, {})[base_path] = tuple(endpoints)
+        return result
+
     def _build_endpoint_parameters(
         self, endpoint: EndpointInfo, metadata: dict[str, t.Any]
     ) -> list[Parameter | Reference] | None:
@@ -855,23 +914,52 @@ class SchemaGenerator:
             },
         )
 
+    def get_path_fragment(self, path: str, endpoints: list[EndpointInfo]) -> PathFragment:
+        """Generate the path item of a path, or reuse the one generated before if its endpoints did not change.
+
+        :param path: Path.
+        :param endpoints: Endpoints of the path.
+        :return: Path fragment.
+        """
+        key = tuple((endpoint.method, endpoint.func) for endpoint in endpoints)
+
+        if (fragment := self._fragments.get(path)) is not None and fragment.key == key:
+            return fragment
+
+        operations = {}
+        for endpoint in endpoints:
+            try:
+                operations[endpoint.method] = self.get_operation_schema(endpoint)
+            except Exception:
+                logger.error("Cannot generate schema for endpoint %s", endpoint)
+
+        item = Path(**operations) if operations else None  # ty: ignore[invalid-argument-type]
+        return PathFragment(key=key, item=item, value=self.spec.to_dict(item) if item is not None else None)
+
     def get_api_schema(self, routes: list[routing.BaseRoute]) -> dict[str, t.Any]:
-        endpoints_info = self.get_endpoints(routes)
+        """Generate the API schema, merging the path items already generated for unchanged paths with the ones
+        generated for new or changed paths.
 
-        for path, endpoints in endpoints_info.items():
-            operations = {}
-            for endpoint in endpoints:
-                try:
-                    operations[endpoint.method] = self.get_operation_schema(endpoint)
-                except Exception:
-                    logger.error("Cannot generate schema for endpoint %s", endpoint)
+        :param routes: Routes.
+        :return: API schema.
+        """
+        self._fragments = {
+            path: self.get_path_fragment(path, endpoints) for path, endpoints in self.get_endpoints(routes).items()
+        }
 
-            if operations:
-                self.spec.add_path(path, Path(**operations))  # ty: ignore[invalid-argument-type]
+        self.spec.spec.paths.clear()
+        self.spec.spec.components.schemas.clear()
+
+        for path, fragment in self._fragments.items():
+            if fragment.item is not None:
+                self.spec.add_path(path, fragment.item)
 
         for schema in self.schemas.used(self.spec).values():
-            self.spec.add_schema(schema.name, Schema(schema.json_schema(self.schemas.names)))
+            self.spec.add_schema(schema.name, self.schemas.json_schema(schema))
 
-        api_schema: dict[str, t.Any] = self.spec.to_dict()
+        api_schema: dict[str, t.Any] = self.spec.to_dict(dataclasses.replace(self.spec.spec, paths=Paths({})))
+        api_schema["paths"] = {
+            path: fragment.value for path, fragment in self._fragments.items() if fragment.value is not None
+        }
 
         return api_schema
@@ -1,10 +1,11 @@
+import functools
 import inspect
 import typing as t
 
-from flama import exceptions, types
+from flama import exceptions, schemas, types
 from flama.http.data_structures import UploadFile
 from flama.injection.resolver import Return
-from flama.schemas.data_structures import Field, Parameter, Parameters
+from flama.schemas.data_structures import Field, Parameter, Parameters, Schema
 
 if t.TYPE_CHECKING:
     from flama.injection.resolver import Parameter as InjectionParameter
@@ -12,11 +13,25 @@ if t.TYPE_CHECKING:
 
 __all__ = ["ParametersDescriptor"]
 
+R = t.TypeVar("R")
+
+
+def _memoized(func: t.Callable[["ParametersDescriptor"], R]) -> property:
+    """Property whose value is computed once and kept until the descriptor cache is invalidated."""
+
+    @functools.wraps(func)
+    def wrapper(self: "ParametersDescriptor") -> R:
+        return self._memoize(func.__name__, lambda: func(self))
+
+    return property(wrapper)
+
 
 class ParametersDescriptor:
     def __init__(self, route: "BaseRoute") -> None:
         self._route = route
         self._parent_app: types.App | None = None
+        self._resolver: t.Any = None
+        self._cache: dict[t.Hashable, t.Any] = {}
 
     @property
     def _app(self) -> types.App:
@@ -29,7 +44,7 @@ class ParametersDescriptor:
     def _app(self, app: types.App):
         self._parent_app = app
 
-    @property
+    @_memoized
     def _parameters(self) -> dict[str, list["InjectionParameter"]]:
         return {
             method: sorted(
@@ -43,14 +58,14 @@ class ParametersDescriptor:
             for method, handler in self._route.endpoint_handlers().items()
         }
 
-    @property
+    @_memoized
     def _return_values(self) -> dict[str, "InjectionParameter"]:
         return {
             method: Return.from_return_annotation(inspect.signature(handler).return_annotation)
             for method, handler in self._route.endpoint_handlers().items()
         }
 
-    @property
+    @_memoized
     def query(self) -> dict[str, Parameters]:
         return {
             method: {
@@ -61,14 +76,14 @@ class ParametersDescriptor:
             for method, parameters in self._parameters.items()
         }
 
-    @property
+    @_memoized
     def path(self) -> dict[str, Parameters]:
         return {
             method: {p.name: Parameter.build("path", p) for p in parameters if p.name in self._route.path.parameters}
             for method, parameters in self._parameters.items()
         }
 
-    @property
+    @_memoized
     def body(self) -> dict[str, Parameter | None]:
         return {
             method: next(
@@ -87,12 +102,51 @@ class ParametersDescriptor:
             for method, parameters in self._parameters.items()
         }
 
-    @property
+    @_memoized
     def response(self) -> dict[str, Parameter]:
         return {
             method: Parameter.build("response", return_value) for method, return_value in self._return_values.items()
         }
 
+    def validator(self, location: t.Literal["path", "query"], method: str) -> Schema:
+        """Schema for validating the path or query parameters of the route for given method.
+
+        It is built once per method and schema library, so requests only run the validation.
+
+        :param location: Parameters location.
+        :param method: HTTP method.
+        :return: Validation schema.
+        """
+        parameters = (self.path if location == "path" else self.query)[method]
+        return self._memoize(
+            ("validator", location, method),
+            lambda: Schema.build(
+                name="ValidationSchema", fields=[p.field for p in parameters.values() if p.field is not None]
+            ),
+        )
+
+    def _memoize(self, key: t.Hashable, build: t.Callable[[], R]) -> R:
+        """Get a value from the descriptor cache, building it if missing.
+
+        Values are computed from the app injector and the schema library, so the cache is invalidated whenever the
+        injector components change, and values are kept per schema library.
+
+        :param key: Value key.
+        :param build: Function that builds the value.
+        :return: Value.
+        """
+        resolver = self._app.injector.resolver
+        if resolver is not self._resolver:
+            self._resolver, self._cache = resolver, {}
+
+        key = (key, schemas.adapter)
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = build()
+            return value
+
     def _build(self, app: types.App) -> "ParametersDescriptor":
         self._app = app
+        self._resolver, self._cache = None, {}
         return self
@@ -1,11 +1,78 @@
 import inspect
+import logging
+import random
+import typing as t
 from functools import wraps
 
 from flama import exceptions
 from flama.schemas.data_structures import Schema
 from flama.schemas.exceptions import SchemaValidationError
 
-__all__ = ["output_validation"]
+__all__ = ["OutputValidation", "output_validation"]
+
+logger = logging.getLogger(__name__)
+
+
+class OutputValidation:
+    modes: t.ClassVar[tuple[str, ...]] = ("strict", "sampled", "off")
+
+    def __init__(self, mode: t.Literal["strict", "sampled", "off"] = "strict", *, sample_rate: float = 0.1) -> None:
+        """A policy for validating the output of HTTP routes against the schema of their return annotation.
+
+        Outputs are always dumped through their schema, and this policy only decides whether they are validated
+        before. In ``strict`` mode every output is validated, and an invalid one fails the request. In ``sampled``
+        mode only a random share of the outputs is validated, and an invalid one is logged and counted, but it is
+        still dumped and sent. In ``off`` mode outputs are trusted and never validated.
+
+        :param mode: Validation mode, one of ``strict``, ``sampled`` or ``off``.
+        :param sample_rate: Share of the outputs validated in ``sampled`` mode, between 0 and 1.
+        """
+        if mode not in self.modes:
+            raise ValueError(f"Wrong output validation mode '{mode}', must be one of: {', '.join(self.modes)}")
+
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"Wrong output validation sample rate '{sample_rate}', must be between 0 and 1")
+
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.validated = 0
+        self.failed = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(mode={self.mode!r}, sample_rate={self.sample_rate!r})"
+
+    def should_validate(self) -> bool:
+        """Decide whether the next output is validated.
+
+        :return: True if the output must be validated.
+        """
+        if self.mode == "sampled":
+            return random.random() < self.sample_rate
+
+        return self.mode == "strict"
+
+    def dump_json(self, schema: Schema, content: t.Any) -> bytes:
+        """Dump an output as JSON using given schema, validating it according to this policy.
+
+        :param schema: Output schema.
+        :param content: Output.
+        :return: JSON encoded output.
+        :raises SchemaValidationError: If the output is not valid in strict mode.
+        """
+        if not self.should_validate():
+            return schema.dump_json(content, validate=False)
+
+        self.validated += 1
+        try:
+            return schema.dump_json(content)
+        except SchemaValidationError as e:
+            self.failed += 1
+
+            if self.mode == "strict":
+                raise
+
+            logger.warning("Output not valid for schema %r: %s", schema.schema, e.errors)
+            return schema.dump_json(content, validate=False)
 
 
 def output_validation(error_cls=exceptions.ValidationError, error_status_code=500):
@@ -1,6 +1,7 @@
 import dataclasses
 import datetime
 import decimal
+import functools
 import typing as t
 import uuid
 
@@ -56,9 +57,55 @@ class PathParams(dict[str, t.Any]): ...
 class PathParam(str): ...
 
 
-@dataclasses.dataclass(frozen=True)
 class RequestData:
-    data: dict[str, t.Any] | None
+    """Request body decoded according to its content type.
+
+    A body can be given as its raw bytes along with the function that decodes them. It is then decoded only the first
+    time :attr:`data` is accessed, so consumers able to work with the bytes, such as schema validation, avoid building
+    the intermediate values. Such a body is compared, hashed and represented by its raw bytes, so none of them decodes
+    it.
+
+    :param data: Decoded body.
+    :param raw: Raw body.
+    :param decode: Function that decodes the raw body.
+    """
+
+    def __init__(
+        self,
+        data: dict[str, t.Any] | None = None,
+        /,
+        *,
+        raw: bytes | None = None,
+        decode: t.Callable[[bytes], dict[str, t.Any] | None] | None = None,
+    ):
+        self.raw = raw
+        self._decode = decode
+        if decode is None:
+            self.data = data
+
+    @functools.cached_property
+    def data(self) -> dict[str, t.Any] | None:
+        return self._decode(self.raw) if self._decode is not None and self.raw is not None else None
+
+    @property
+    def decoded(self) -> bool:
+        """Whether the body is already decoded."""
+        return "data" in self.__dict__
+
+    def _key(self) -> tuple[str, t.Any]:
+        return ("raw", self.raw) if self._decode is not None else ("data", self.data)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, RequestData) and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        if self._decode is None:
+            return f"{self.__class__.__name__}(data={self.data!r})"
+
+        return f"{self.__class__.__name__}(raw={self.raw!r}, decoded={self.decoded})"
 
 
 class Cookies(dict[str, dict[str, str]]): ...
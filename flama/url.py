@@ -246,13 +246,19 @@ class Path:
         match_kind, raw_values, matched, unmatched = result
         return _MatchResult(
             match=self.Match.partial if match_kind == MatchKind.Partial else self.Match.exact,
-            parameters={
-                name: self._parameters[name].serializer.load(raw_values[i]) for i, name in enumerate(self._param_order)
-            },
+            parameters=self.load_parameters(raw_values),
             matched=matched,
             unmatched=unmatched,
         )
 
+    def load_parameters(self, values: t.Sequence[str]) -> dict[str, t.Any]:
+        """Serialize raw parameter values, given in declaration order, into their typed values.
+
+        :param values: Raw parameter values as captured by the path matcher.
+        :return: Parameters serialized values.
+        """
+        return {name: self._parameters[name].serializer.load(values[i]) for i, name in enumerate(self._param_order)}
+
     def build(self, **params: t.Any) -> _BuildResult:
         """Build a path by completing param placeholders with given values.
 
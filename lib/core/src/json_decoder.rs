@@ -0,0 +1,515 @@
+//! Fast JSON decoder building Python values straight from a UTF-8 document.
+//!
+//! Mirrors the semantics of `json.loads`: the last duplicate key wins, integers of any size are
+//! preserved, `NaN`/`Infinity`/`-Infinity` are accepted and syntax errors raise
+//! `json.JSONDecodeError` with the same message and character position. The rare inputs that
+//! cannot be represented as a Rust `str` (UTF-16/32 documents, lone surrogate escapes, …) are
+//! delegated to `json.loads` itself, cached once per interpreter via [`Handles`].
+//!
+//! `raw_decode_json` decodes a single value out of a longer string, like
+//! `json.JSONDecoder.raw_decode`, so the items of a JSON array received in chunks can be decoded
+//! one by one.
+
+use pyo3::exceptions::{PyRecursionError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::sync::PyOnceLock;
+use pyo3::types::{PyBytes, PyDict, PyFloat, PyList, PyString};
+use std::borrow::Cow;
+use std::collections::HashMap;
+use std::convert::Infallible;
+
+/// Maximum nesting of arrays and objects, matching the default interpreter recursion limit.
+const MAX_DEPTH: usize = 1000;
+
+const UTF8_BOM: &[u8] = b"\xef\xbb\xbf";
+
+/// Lazily-resolved Python handles used by the decoder.
+struct Handles {
+    int_type: Py<PyAny>,
+    decode_error: Py<PyAny>,
+    loads: Py<PyAny>,
+    raw_decode: Py<PyAny>,
+}
+
+static HANDLES: PyOnceLock<Handles> = PyOnceLock::new();
+
+impl Handles {
+    fn new(py: Python<'_>) -> PyResult<Self> {
+        let json_mod = py.import("json")?;
+
+        Ok(Self {
+            int_type: py.import("builtins")?.getattr("int")?.unbind(),
+            decode_error: json_mod.getattr("JSONDecodeError")?.unbind(),
+            loads: json_mod.getattr("loads")?.unbind(),
+            raw_decode: json_mod
+                .getattr("JSONDecoder")?
+                .call0()?
+                .getattr("raw_decode")?
+                .unbind(),
+        })
+    }
+
+    fn get(py: Python<'_>) -> PyResult<&Self> {
+        HANDLES.get_or_try_init(py, || Self::new(py))
+    }
+}
+
+/// Reasons for a decoding to stop.
+enum Error {
+    /// Malformed document, with the message used by `json` and the byte offset of the error.
+    Syntax(&'static str, usize),
+    /// A `\uXXXX` escape encodes a lone surrogate, which a Rust `str` cannot hold.
+    LoneSurrogate,
+    /// Error raised by Python while building a value.
+    Python(PyErr),
+}
+
+impl From<PyErr> for Error {
+    fn from(err: PyErr) -> Self {
+        Self::Python(err)
+    }
+}
+
+impl From<Infallible> for Error {
+    fn from(err: Infallible) -> Self {
+        match err {}
+    }
+}
+
+type DecodeResult<T> = Result<T, Error>;
+
+/// Recursive descent JSON decoder over a borrowed UTF-8 document.
+struct JsonDecoder<'a, 'py> {
+    py: Python<'py>,
+    text: &'a str,
+    bytes: &'a [u8],
+    pos: usize,
+    depth: usize,
+    keys: HashMap<String, Bound<'py, PyString>>,
+}
+
+impl<'a, 'py> JsonDecoder<'a, 'py> {
+    fn new(py: Python<'py>, text: &'a str) -> Self {
+        Self {
+            py,
+            text,
+            bytes: text.as_bytes(),
+            pos: 0,
+            depth: 0,
+            keys: HashMap::new(),
+        }
+    }
+
+    /// Decode the whole document, rejecting anything but whitespace after the value.
+    fn decode(&mut self) -> DecodeResult<Bound<'py, PyAny>> {
+        self.skip_whitespace();
+        let value = self.decode_value()?;
+        self.skip_whitespace();
+        if self.pos != self.bytes.len() {
+            return Err(Error::Syntax("Extra data", self.pos));
+        }
+        Ok(value)
+    }
+
+    fn peek(&self) -> Option<u8> {
+        self.bytes.get(self.pos).copied()
+    }
+
+    fn skip_whitespace(&mut self) {
+        while matches!(self.peek(), Some(b' ' | b'\t' | b'\n' | b'\r')) {
+            self.pos += 1;
+        }
+    }
+
+    /// Advance past `literal` if the document continues with it.
+    fn consume(&mut self, literal: &[u8]) -> bool {
+        if self.bytes[self.pos..].starts_with(literal) {
+            self.pos += literal.len();
+            true
+        } else {
+            false
+        }
+    }
+
+    fn decode_value(&mut self) -> DecodeResult<Bound<'py, PyAny>> {
+        let py = self.py;
+        match self.peek() {
+            Some(b'"') => Ok(PyString::new(py, &self.decode_string()?).into_any()),
+            Some(b'{') => self.decode_object(),
+            Some(b'[') => self.decode_array(),
+            Some(b'n') if self.consume(b"null") => Ok(py.None().into_bound(py)),
+            Some(b't') if self.consume(b"true") => Ok(true.into_pyobject(py)?.to_owned().into_any()),
+            Some(b'f') if self.consume(b"false") => Ok(false.into_pyobject(py)?.to_owned().into_any()),
+            Some(b'N') if self.consume(b"NaN") => Ok(PyFloat::new(py, f64::NAN).into_any()),
+            Some(b'I') if self.consume(b"Infinity") => Ok(PyFloat::new(py, f64::INFINITY).into_any()),
+            Some(b'-') if self.consume(b"-Infinity") => Ok(PyFloat::new(py, f64::NEG_INFINITY).into_any()),
+            Some(b'-' | b'0'..=b'9') => self.decode_number(),
+            _ => Err(Error::Syntax("Expecting value", self.pos)),
+        }
+    }
+
+    /// Enter a nested array or object, guarding against unbounded recursion.
+    fn enter(&mut self) -> DecodeResult<()> {
+        self.depth += 1;
+        if self.depth > MAX_DEPTH {
+            return Err(Error::Python(PyRecursionError::new_err(
+                "maximum recursion depth exceeded while decoding a JSON document",
+            )));
+        }
+        Ok(())
+    }
+
+    fn decode_object(&mut self) -> DecodeResult<Bound<'py, PyAny>> {
+        self.enter()?;
+        let dict = PyDict::new(self.py);
+        self.pos += 1;
+        self.skip_whitespace();
+
+        if self.peek() == Some(b'}') {
+            self.pos += 1;
+        } else {
+            loop {
+                if self.peek() != Some(b'"') {
+                    return Err(Error::Syntax(
+                        "Expecting property name enclosed in double quotes",
+                        self.pos,
+                    ));
+                }
+                let key = self.decode_key()?;
+                self.skip_whitespace();
+                if self.peek() != Some(b':') {
+                    return Err(Error::Syntax("Expecting ':' delimiter", self.pos));
+                }
+                self.pos += 1;
+                self.skip_whitespace();
+                dict.set_item(key, self.decode_value()?)?;
+                self.skip_whitespace();
+                match self.peek() {
+                    Some(b',') => {
+                        self.pos += 1;
+                        self.skip_whitespace();
+                    }
+                    Some(b'}') => {
+                        self.pos += 1;
+                        break;
+                    }
+                    _ => return Err(Error::Syntax("Expecting ',' delimiter", self.pos)),
+                }
+            }
+        }
+
+        self.depth -= 1;
+        Ok(dict.into_any())
+    }
+
+    fn decode_array(&mut self) -> DecodeResult<Bound<'py, PyAny>> {
+        self.enter()?;
+        let list = PyList::empty(self.py);
+        self.pos += 1;
+        self.skip_whitespace();
+
+        if self.peek() == Some(b']') {
+            self.pos += 1;
+        } else {
+            loop {
+                list.append(self.decode_value()?)?;
+                self.skip_whitespace();
+                match self.peek() {
+                    Some(b',') => {
+                        self.pos += 1;
+                        self.skip_whitespace();
+                    }
+                    Some(b']') => {
+                        self.pos += 1;
+                        break;
+                    }
+                    _ => return Err(Error::Syntax("Expecting ',' delimiter", self.pos)),
+                }
+            }
+        }
+
+        self.depth -= 1;
+        Ok(list.into_any())
+    }
+
+    /// Decode an object key, reusing the Python string of a key already seen in this document.
+    fn decode_key(&mut self) -> DecodeResult<Bound<'py, PyString>> {
+        let key = self.decode_string()?;
+        if let Some(cached) = self.keys.get(key.as_ref()) {
+            return Ok(cached.clone());
+        }
+        let value = PyString::new(self.py, &key);
+        self.keys.insert(key.into_owned(), value.clone());
+        Ok(value)
+    }
+
+    /// Decode the string starting at the current `"`, borrowing from the document when it holds
+    /// no escape sequences.
+    fn decode_string(&mut self) -> DecodeResult<Cow<'a, str>> {
+        let text = self.text;
+        let begin = self.pos;
+        self.pos += 1;
+        let mut chunk_start = self.pos;
+        let mut owned: Option<String> = None;
+
+        loop {
+            let Some(byte) = self.peek() else {
+                return Err(Error::Syntax("Unterminated string starting at", begin));
+            };
+            match byte {
+                b'"' => {
+                    let chunk = &text[chunk_start..self.pos];
+                    self.pos += 1;
+                    return Ok(match owned {
+                        Some(mut s) => {
+                            s.push_str(chunk);
+                            Cow::Owned(s)
+                        }
+                        None => Cow::Borrowed(chunk),
+                    });
+                }
+                b'\\' => {
+                    let s = owned.get_or_insert_with(String::new);
+                    s.push_str(&text[chunk_start..self.pos]);
+                    let escape = self.pos;
+                    self.pos += 1;
+                    let Some(kind) = self.peek() else {
+                        return Err(Error::Syntax("Unterminated string starting at", begin));
+                    };
+                    self.pos += 1;
+                    match kind {
+                        b'"' => s.push('"'),
+                        b'\\' => s.push('\\'),
+                        b'/' => s.push('/'),
+                        b'b' => s.push('\u{8}'),
+                        b'f' => s.push('\u{c}'),
+                        b'n' => s.push('\n'),
+                        b'r' => s.push('\r'),
+                        b't' => s.push('\t'),
+                        b'u' => s.push(self.decode_unicode_escape(escape + 1)?),
+                        _ => return Err(Error::Syntax("Invalid \\escape", escape)),
+                    }
+                    chunk_start = self.pos;
+                }
+                0x00..=0x1f => return Err(Error::Syntax("Invalid control character at", self.pos)),
+                _ => self.pos += 1,
+            }
+        }
+    }
+
+    /// Decode the digits of a `\uXXXX` escape whose `u` is at `at`, combining a surrogate pair
+    /// into a single character.
+    fn decode_unicode_escape(&mut self, at: usize) -> DecodeResult<char> {
+        let high = hex4(self.bytes, self.pos).ok_or(Error::Syntax("Invalid \\uXXXX escape", at))?;
+        self.pos += 4;
+
+        if (0xD800..=0xDBFF).contains(&high) && self.bytes.get(self.pos..self.pos + 2) == Some(&b"\\u"[..]) {
+            if let Some(low @ 0xDC00..=0xDFFF) = hex4(self.bytes, self.pos + 2) {
+                self.pos += 6;
+                return char::from_u32(0x10000 + ((high - 0xD800) << 10) + (low - 0xDC00)).ok_or(Error::LoneSurrogate);
+            }
+        }
+
+        char::from_u32(high).ok_or(Error::LoneSurrogate)
+    }
+
+    fn decode_number(&mut self) -> DecodeResult<Bound<'py, PyAny>> {
+        let start = self.pos;
+        let (end, is_float) = scan_number(self.bytes, start).ok_or(Error::Syntax("Expecting value", start))?;
+        self.pos = end;
+        let number = &self.text[start..end];
+
+        if is_float {
+            let value = number
+                .parse::<f64>()
+                .map_err(|_| Error::Syntax("Expecting value", start))?;
+            return Ok(PyFloat::new(self.py, value).into_any());
+        }
+
+        if let Ok(value) = number.parse::<i64>() {
+            return Ok(value.into_pyobject(self.py)?.into_any());
+        }
+        Ok(Handles::get(self.py)?.int_type.bind(self.py).call1((number,))?)
+    }
+}
+
+/// Parse the four hexadecimal digits at `at`.
+fn hex4(bytes: &[u8], at: usize) -> Option<u32> {
+    bytes
+        .get(at..at + 4)?
+        .iter()
+        .try_fold(0, |acc, &digit| Some(acc * 16 + char::from(digit).to_digit(16)?))
+}
+
+/// Scan the number starting at `start` following the grammar
+/// `-?(0|[1-9][0-9]*)(\.[0-9]+)?([eE][-+]?[0-9]+)?`.
+///
+/// Returns the end offset of the longest valid number and whether it has a fraction or exponent,
+/// or `None` if no number starts there. As in `json`, an incomplete fraction or exponent ends the
+/// number before it, so that `1.` scans as `1` followed by extra data.
+fn scan_number(bytes: &[u8], start: usize) -> Option<(usize, bool)> {
+    let digits = |from: usize| bytes[from..].iter().take_while(|b| b.is_ascii_digit()).count();
+
+    let mut pos = start;
+    if bytes.get(pos) == Some(&b'-') {
+        pos += 1;
+    }
+    match bytes.get(pos) {
+        Some(b'0') => pos += 1,
+        Some(b'1'..=b'9') => pos += digits(pos),
+        _ => return None,
+    }
+
+    let mut is_float = false;
+    if bytes.get(pos) == Some(&b'.') {
+        let fraction = digits(pos + 1);
+        if fraction > 0 {
+            pos += 1 + fraction;
+            is_float = true;
+        }
+    }
+    if matches!(bytes.get(pos), Some(b'e' | b'E')) {
+        let sign = usize::from(matches!(bytes.get(pos + 1), Some(b'-' | b'+')));
+        let exponent = digits(pos + 1 + sign);
+        if exponent > 0 {
+            pos += 1 + sign + exponent;
+            is_float = true;
+        }
+    }
+    Some((pos, is_float))
+}
+
+/// Build the `json.JSONDecoder` error for a syntax error at byte offset `pos` of `text`.
+fn syntax_error(py: Python<'_>, text: &str, msg: &str, pos: usize) -> PyResult<PyErr> {
+    let pos = text[..pos].chars().count();
+    let err = Handles::get(py)?
+        .decode_error
+        .bind(py)
+        .call1((msg, PyString::new(py, text), pos))?;
+    Ok(PyErr::from_value(err))
+}
+
+/// Decode `text`, the UTF-8 view of `content`, reporting errors the same way as `json.loads`.
+fn decode<'py>(py: Python<'py>, content: &Bound<'py, PyAny>, text: &str) -> PyResult<Bound<'py, PyAny>> {
+    match JsonDecoder::new(py, text).decode() {
+        Ok(value) => Ok(value),
+        Err(Error::Python(err)) => Err(err),
+        Err(Error::LoneSurrogate) => Handles::get(py)?.loads.bind(py).call1((content,)),
+        Err(Error::Syntax(msg, pos)) => Err(syntax_error(py, text, msg, pos)?),
+    }
+}
+
+#[pyfunction]
+#[pyo3(signature = (content))]
+fn decode_json<'py>(py: Python<'py>, content: &Bound<'py, PyAny>) -> PyResult<Bound<'py, PyAny>> {
+    if let Ok(bytes) = content.cast::<PyBytes>() {
+        let raw = bytes.as_bytes();
+        // UTF-16 and UTF-32 documents are detected by ``json`` from their leading bytes.
+        let wide = raw.starts_with(b"\xff\xfe") || raw.starts_with(b"\xfe\xff") || raw.iter().take(4).any(|&b| b == 0);
+        if !wide {
+            if let Ok(text) = std::str::from_utf8(raw.strip_prefix(UTF8_BOM).unwrap_or(raw)) {
+                return decode(py, content, text);
+            }
+        }
+    } else if let Ok(string) = content.cast::<PyString>() {
+        if let Ok(text) = string.to_str() {
+            if !text.starts_with('\u{feff}') {
+                return decode(py, content, text);
+            }
+        }
+    }
+
+    Handles::get(py)?.loads.bind(py).call1((content,))
+}
+
+/// Decode the value starting at `pos` of `content`, ignoring anything after it, and return it along
+/// with the offset where it ends.
+///
+/// Offsets are byte offsets into the UTF-8 view of `content`, which CPython caches on the string,
+/// so decoding many values out of the same string only walks each of them once. Errors are raised
+/// as `json.JSONDecodeError` with character positions, as `json.JSONDecoder.raw_decode` does.
+#[pyfunction]
+#[pyo3(signature = (content, pos = 0))]
+fn raw_decode_json<'py>(
+    py: Python<'py>,
+    content: &Bound<'py, PyString>,
+    pos: usize,
+) -> PyResult<(Bound<'py, PyAny>, usize)> {
+    let text = content.to_str()?;
+    if !text.is_char_boundary(pos) {
+        return Err(PyValueError::new_err(format!(
+            "position {pos} is not at a character boundary"
+        )));
+    }
+
+    let mut decoder = JsonDecoder::new(py, text);
+    decoder.pos = pos;
+    match decoder.decode_value() {
+        Ok(value) => Ok((value, decoder.pos)),
+        Err(Error::Python(err)) => Err(err),
+        Err(Error::LoneSurrogate) => {
+            let start = text[..pos].chars().count();
+            let (value, end): (Bound<'py, PyAny>, usize) = Handles::get(py)?
+                .raw_decode
+                .bind(py)
+                .call1((content, start))?
+                .extract()?;
+            let end = text.char_indices().nth(end).map_or(text.len(), |(offset, _)| offset);
+            Ok((value, end))
+        }
+        Err(Error::Syntax(msg, at)) => Err(syntax_error(py, text, msg, at)?),
+    }
+}
+
+pub fn build(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(decode_json, m)?)?;
+    m.add_function(wrap_pyfunction!(raw_decode_json, m)?)?;
+    Ok(())
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn hex4_valid() {
+        assert_eq!(hex4(b"\\u00e9", 2), Some(0xe9));
+        assert_eq!(hex4(b"D83D", 0), Some(0xD83D));
+    }
+
+    #[test]
+    fn hex4_invalid() {
+        assert_eq!(hex4(b"12", 0), None);
+        assert_eq!(hex4(b"12g4", 0), None);
+    }
+
+    #[test]
+    fn scan_number_integers() {
+        assert_eq!(scan_number(b"0", 0), Some((1, false)));
+        assert_eq!(scan_number(b"-42,", 0), Some((3, false)));
+        assert_eq!(scan_number(b"[123]", 1), Some((4, false)));
+    }
+
+    #[test]
+    fn scan_number_floats() {
+        assert_eq!(scan_number(b"1.5", 0), Some((3, true)));
+        assert_eq!(scan_number(b"-1e10", 0), Some((5, true)));
+        assert_eq!(scan_number(b"2.5E-3", 0), Some((6, true)));
+    }
+
+    #[test]
+    fn scan_number_stops_before_incomplete_parts() {
+        // Leading zeros, bare dots and bare exponents end the number, leaving extra data behind.
+        assert_eq!(scan_number(b"01", 0), Some((1, false)));
+        assert_eq!(scan_number(b"1.", 0), Some((1, false)));
+        assert_eq!(scan_number(b"1e", 0), Some((1, false)));
+        assert_eq!(scan_number(b"1e+", 0), Some((1, false)));
+    }
+
+    #[test]
+    fn scan_number_invalid() {
+        assert_eq!(scan_number(b"-", 0), None);
+        assert_eq!(scan_number(b"-a", 0), None);
+        assert_eq!(scan_number(b".5", 0), None);
+    }
+}
@@ -13,6 +13,7 @@ use pyo3::prelude::*;
 mod compression;
 mod cookies;
 mod http;
+mod json_decoder;
 mod json_encoder;
 mod multipart;
 mod route_table;
@@ -43,6 +44,7 @@ fn _core(m: &Bound<'_, PyModule>) -> PyResult<()> {
     register_submodule(m, "compression", compression::build)?;
     register_submodule(m, "cookies", cookies::build)?;
     register_submodule(m, "http", http::build)?;
+    register_submodule(m, "json_decoder", json_decoder::build)?;
     register_submodule(m, "json_encoder", json_encoder::build)?;
     register_submodule(m, "multipart", multipart::build)?;
     register_submodule(m, "route_table", route_table::build)?;
@@ -3,11 +3,25 @@
 //! Holds an ordered list of [`PathMatcher`] entries (with optional method/scope filters) and
 //! resolves an incoming ``(path, scope_type, method)`` tuple in a single pass, returning a
 //! typed [`Resolution`] alongside the matched route's metadata.
+//!
+//! Entries are compiled into a segment trie ([`TrieNode`]) keyed by literal segments and typed
+//! parameter edges, so a lookup only visits the entries whose leading segments can match the
+//! input instead of scanning the whole table. Fully static paths additionally hit a hash index
+//! that stores their precomputed candidate list. Candidates are always evaluated in
+//! registration order, which keeps first-match, ``Mount`` and ``MethodNotAllowed`` semantics
+//! identical to a linear scan.
+//!
+//! Resolutions are memoised in a bounded LRU cache ([`LruCache`]) keyed by the
+//! ``(path, scope_type, method)`` tuple, so the handful of concrete paths that take most of the
+//! traffic skip matching altogether. The cache is emptied whenever an entry is added.
+
+use std::collections::HashMap;
+use std::sync::{Mutex, OnceLock, PoisonError};
 
 use pyo3::prelude::*;
 use pyo3::types::PyTuple;
 
-use crate::url::{MatchKind, PathMatcher};
+use crate::url::{MatchKind, PathMatcher, Segment, TypeTag};
 
 #[derive(Clone)]
 struct RouteEntry {
@@ -47,18 +61,289 @@ enum ResolveOutcome<'a> {
     NotFound,
 }
 
+/// One node of the compiled segment trie.
+///
+/// An entry is stored at the node reached by the segments that must match whole input segments
+/// for the entry to match at all, so descending the trie never discards a potential match.
+#[derive(Default)]
+struct TrieNode {
+    /// Indexes of the entries whose indexed segments end at this node.
+    entries: Vec<usize>,
+    /// Literal segment edges.
+    statics: HashMap<String, TrieNode>,
+    /// Typed parameter edges, followed only when the input segment validates against the tag.
+    params: Vec<(TypeTag, TrieNode)>,
+}
+
+impl TrieNode {
+    fn insert(&mut self, edges: &[Segment], index: usize) {
+        let mut node = self;
+        for edge in edges {
+            node = match edge {
+                Segment::Constant(value) => node.statics.entry(value.clone()).or_default(),
+                Segment::Parameter { type_tag } => {
+                    let position = if let Some(position) = node.params.iter().position(|(tag, _)| tag == type_tag) {
+                        position
+                    } else {
+                        node.params.push((*type_tag, Self::default()));
+                        node.params.len() - 1
+                    };
+                    &mut node.params[position].1
+                }
+            };
+        }
+        node.entries.push(index);
+    }
+
+    fn collect(&self, segments: &[&str], depth: usize, candidates: &mut Vec<usize>) {
+        candidates.extend_from_slice(&self.entries);
+
+        let Some(segment) = segments.get(depth) else {
+            return;
+        };
+
+        if let Some(child) = self.statics.get(*segment) {
+            child.collect(segments, depth + 1, candidates);
+        }
+
+        for (tag, child) in &self.params {
+            if PathMatcher::validate(segment.as_bytes(), *tag) {
+                child.collect(segments, depth + 1, candidates);
+            }
+        }
+    }
+}
+
+/// Segments of `matcher` that must match whole input segments, or ``None`` when the template
+/// cannot be indexed by segments (it does not start with ``/``).
+///
+/// A trailing constant of a partial template without trailing slash matches by prefix (e.g. a
+/// mount at ``/api`` consumes the ``/api`` of ``/apix``), so it is left out of the index.
+fn indexed_segments(matcher: &PathMatcher, accept_partial_path: bool) -> Option<&[Segment]> {
+    if !matcher.has_starting_slash() {
+        return None;
+    }
+
+    let segments = matcher.segments();
+    match segments.last() {
+        Some(Segment::Constant(_)) if accept_partial_path && !matcher.has_trailing_slash() => {
+            Some(&segments[..segments.len() - 1])
+        }
+        _ => Some(segments),
+    }
+}
+
+/// Literal path matched by a template without parameters, or ``None`` if it has any.
+fn static_path(matcher: &PathMatcher) -> Option<String> {
+    if !matcher.has_starting_slash() {
+        return None;
+    }
+
+    let mut values = Vec::with_capacity(matcher.segments().len());
+    for segment in matcher.segments() {
+        match segment {
+            Segment::Constant(value) => values.push(value.as_str()),
+            Segment::Parameter { .. } => return None,
+        }
+    }
+
+    let trailing_slash = if matcher.has_trailing_slash() { "/" } else { "" };
+    Some(format!("/{}{trailing_slash}", values.join("/")))
+}
+
+/// Default number of resolutions kept by the cache of a [`RouteTable`].
+const DEFAULT_CACHE_SIZE: usize = 256;
+
+struct LruNode<V> {
+    key: String,
+    value: V,
+    prev: Option<usize>,
+    next: Option<usize>,
+}
+
+/// Bounded map that evicts its least recently used item when full.
+///
+/// Items live in a slab of nodes linked in recency order, from the most recently used one
+/// (``head``) to the least recently used one (``tail``), so lookups, insertions and evictions are
+/// all constant time. A capacity of zero disables the cache.
+struct LruCache<V> {
+    capacity: usize,
+    map: HashMap<String, usize>,
+    nodes: Vec<LruNode<V>>,
+    head: Option<usize>,
+    tail: Option<usize>,
+}
+
+impl<V> LruCache<V> {
+    fn new(capacity: usize) -> Self {
+        Self {
+            capacity,
+            map: HashMap::new(),
+            nodes: Vec::new(),
+            head: None,
+            tail: None,
+        }
+    }
+
+    fn len(&self) -> usize {
+        self.map.len()
+    }
+
+    /// Look up `key`, marking it as the most recently used item.
+    fn get(&mut self, key: &str) -> Option<&V> {
+        let index = *self.map.get(key)?;
+        self.detach(index);
+        self.attach(index);
+        Some(&self.nodes[index].value)
+    }
+
+    /// Insert or replace `key`, evicting the least recently used item if the cache is full.
+    fn insert(&mut self, key: String, value: V) {
+        if self.capacity == 0 {
+            return;
+        }
+
+        if let Some(&index) = self.map.get(&key) {
+            self.nodes[index].value = value;
+            self.detach(index);
+            self.attach(index);
+            return;
+        }
+
+        let index = if self.nodes.len() < self.capacity {
+            self.nodes.push(LruNode {
+                key: key.clone(),
+                value,
+                prev: None,
+                next: None,
+            });
+            self.nodes.len() - 1
+        } else {
+            let index = self.tail.expect("a full cache has a least recently used item");
+            self.detach(index);
+            let node = &mut self.nodes[index];
+            self.map.remove(&node.key);
+            node.key.clone_from(&key);
+            node.value = value;
+            index
+        };
+
+        self.map.insert(key, index);
+        self.attach(index);
+    }
+
+    fn clear(&mut self) {
+        self.map.clear();
+        self.nodes.clear();
+        self.head = None;
+        self.tail = None;
+    }
+
+    fn detach(&mut self, index: usize) {
+        let (prev, next) = (self.nodes[index].prev, self.nodes[index].next);
+        match prev {
+            Some(prev) => self.nodes[prev].next = next,
+            None => self.head = next,
+        }
+        match next {
+            Some(next) => self.nodes[next].prev = prev,
+            None => self.tail = prev,
+        }
+    }
+
+    fn attach(&mut self, index: usize) {
+        self.nodes[index].prev = None;
+        self.nodes[index].next = self.head;
+        match self.head {
+            Some(head) => self.nodes[head].prev = Some(index),
+            None => self.tail = Some(index),
+        }
+        self.head = Some(index);
+    }
+}
+
+/// Resolutions cached by a [`RouteTable`], along with its usage counters.
+struct ResolveCache {
+    items: LruCache<Py<PyAny>>,
+    hits: u64,
+    misses: u64,
+}
+
+/// Key of a resolution in the cache. HTTP methods are tokens that cannot contain ``:``, so the
+/// first two separators are unambiguous whatever the path is.
+fn cache_key(path: &str, scope_type: u8, method: &str) -> String {
+    format!("{scope_type}:{method}:{path}")
+}
+
 #[pyclass]
 struct RouteTable {
     entries: Vec<RouteEntry>,
+    /// Segment trie over all indexable entries.
+    trie: TrieNode,
+    /// Entries that cannot be indexed by segments and are candidates for every path.
+    unindexed: Vec<usize>,
+    /// Fully static paths mapped to their candidate entries, built lazily on first resolution.
+    static_paths: OnceLock<HashMap<String, Vec<usize>>>,
+    /// Recently resolved paths, emptied every time an entry is added.
+    cache: Mutex<ResolveCache>,
 }
 
 impl RouteTable {
+    fn cache(&self) -> std::sync::MutexGuard<'_, ResolveCache> {
+        self.cache.lock().unwrap_or_else(PoisonError::into_inner)
+    }
+
+    fn push_entry(&mut self, entry: RouteEntry) {
+        let index = self.entries.len();
+        match indexed_segments(&entry.matcher, entry.accept_partial_path) {
+            Some(segments) => self.trie.insert(segments, index),
+            None => self.unindexed.push(index),
+        }
+        self.entries.push(entry);
+        self.static_paths = OnceLock::new();
+        self.cache().items.clear();
+    }
+
+    /// Indexes of the entries that may match `path`, in registration order.
+    fn candidates(&self, path: &str) -> Vec<usize> {
+        let mut candidates = self.unindexed.clone();
+        if let Some(rest) = path.strip_prefix('/') {
+            let segments: Vec<&str> = rest.split('/').collect();
+            self.trie.collect(&segments, 0, &mut candidates);
+        }
+        candidates.sort_unstable();
+        candidates
+    }
+
+    fn static_paths(&self) -> &HashMap<String, Vec<usize>> {
+        self.static_paths.get_or_init(|| {
+            self.entries
+                .iter()
+                .filter(|entry| !entry.accept_partial_path)
+                .filter_map(|entry| static_path(&entry.matcher))
+                .map(|path| {
+                    let candidates = self.candidates(&path);
+                    (path, candidates)
+                })
+                .collect()
+        })
+    }
+
     /// Pure-Rust route resolution shared by the Python binding and the unit tests.
     fn resolve_inner<'a>(&self, path: &'a str, scope_type: u8, method: &str) -> ResolveOutcome<'a> {
+        let collected;
+        let candidates: &[usize] = if let Some(candidates) = self.static_paths().get(path) {
+            candidates
+        } else {
+            collected = self.candidates(path);
+            &collected
+        };
+
         let mut partial_index: Option<usize> = None;
         let mut allowed_methods: Vec<String> = Vec::new();
 
-        for (index, entry) in self.entries.iter().enumerate() {
+        for &index in candidates {
+            let entry = &self.entries[index];
             if entry.scope_type_mask & scope_type == 0 {
                 continue;
             }
@@ -104,9 +389,21 @@ impl RouteTable {
 
 #[pymethods]
 impl RouteTable {
+    /// Create an empty table whose cache keeps up to `cache_size` resolutions (``0`` disables it).
     #[new]
-    const fn new() -> Self {
-        Self { entries: Vec::new() }
+    #[pyo3(signature = (cache_size=DEFAULT_CACHE_SIZE))]
+    fn new(cache_size: usize) -> Self {
+        Self {
+            entries: Vec::new(),
+            trie: TrieNode::default(),
+            unindexed: Vec::new(),
+            static_paths: OnceLock::new(),
+            cache: Mutex::new(ResolveCache {
+                items: LruCache::new(cache_size),
+                hits: 0,
+                misses: 0,
+            }),
+        }
     }
 
     #[pyo3(signature = (matcher, scope_type_mask, accept_partial_path, methods=None))]
@@ -117,7 +414,7 @@ impl RouteTable {
         accept_partial_path: bool,
         methods: Option<Vec<String>>,
     ) {
-        self.entries.push(RouteEntry {
+        self.push_entry(RouteEntry {
             matcher: matcher.clone(),
             scope_type_mask,
             accept_partial_path,
@@ -133,8 +430,60 @@ impl RouteTable {
     /// - [`Resolution::Full`] — ``(0, index, params, matched, unmatched)``
     /// - [`Resolution::Mount`] — ``(1, index, params, matched, unmatched)``
     /// - [`Resolution::MethodNotAllowed`] — ``(2, index, allowed_methods)``
-    #[allow(clippy::cast_possible_wrap)]
+    ///
+    /// Found resolutions are cached, so resolving the same tuple again returns the very same
+    /// object. Hence ``params`` and ``allowed_methods`` are tuples, so no caller can mutate a
+    /// resolution shared with the others. Not-found paths are not cached, so random paths cannot
+    /// evict the hot ones.
     fn resolve<'py>(&self, py: Python<'py>, path: &'py str, scope_type: u8, method: &str) -> PyResult<Py<PyAny>> {
+        let key = {
+            let mut cache = self.cache();
+            if cache.items.capacity == 0 {
+                drop(cache);
+                return self.resolve_uncached(py, path, scope_type, method);
+            }
+
+            let key = cache_key(path, scope_type, method);
+            if let Some(result) = cache.items.get(&key) {
+                let result = result.clone_ref(py);
+                cache.hits += 1;
+                return Ok(result);
+            }
+            cache.misses += 1;
+            key
+        };
+
+        let result = self.resolve_uncached(py, path, scope_type, method)?;
+        if !result.is_none(py) {
+            self.cache().items.insert(key, result.clone_ref(py));
+        }
+        Ok(result)
+    }
+
+    /// Usage of the resolution cache as a ``(hits, misses, maxsize, currsize)`` tuple.
+    fn cache_info(&self) -> (u64, u64, usize, usize) {
+        let cache = self.cache();
+        (cache.hits, cache.misses, cache.items.capacity, cache.items.len())
+    }
+
+    /// Empty the resolution cache and reset its counters.
+    fn cache_clear(&self) {
+        let mut cache = self.cache();
+        cache.items.clear();
+        cache.hits = 0;
+        cache.misses = 0;
+    }
+}
+
+impl RouteTable {
+    #[allow(clippy::cast_possible_wrap)]
+    fn resolve_uncached<'py>(
+        &self,
+        py: Python<'py>,
+        path: &'py str,
+        scope_type: u8,
+        method: &str,
+    ) -> PyResult<Py<PyAny>> {
         match self.resolve_inner(path, scope_type, method) {
             ResolveOutcome::Match {
                 kind,
@@ -179,7 +528,7 @@ mod tests {
     }
 
     fn table_with_entries(entries: Vec<(PathMatcher, u8, bool, Option<Vec<String>>)>) -> RouteTable {
-        let mut t = RouteTable::new();
+        let mut t = RouteTable::new(DEFAULT_CACHE_SIZE);
         for (m, mask, partial, methods) in entries {
             t.add_entry(&m, mask, partial, methods);
         }
@@ -267,6 +616,278 @@ mod tests {
         ));
     }
 
+    #[test]
+    fn resolve_keeps_first_match_between_static_and_parameter_routes() {
+        let t = table_with_entries(vec![
+            (matcher(&[(false, "users", ""), (true, "id", "str")]), 0xFF, false, None),
+            (matcher(&[(false, "users", ""), (false, "me", "")]), 0xFF, false, None),
+        ]);
+
+        match t.resolve_inner("/users/me", 0xFF, "GET") {
+            ResolveOutcome::Match { index, param_vals, .. } => {
+                assert_eq!(index, 0);
+                assert_eq!(param_vals, vec!["me"]);
+            }
+            other => panic!("expected full match, got {:?}", outcome_label(&other)),
+        }
+    }
+
+    #[test]
+    fn resolve_follows_typed_parameter_edges() {
+        let t = table_with_entries(vec![
+            (matcher(&[(false, "items", ""), (true, "id", "int")]), 0xFF, false, None),
+            (
+                matcher(&[(false, "items", ""), (true, "slug", "str")]),
+                0xFF,
+                false,
+                None,
+            ),
+        ]);
+
+        match t.resolve_inner("/items/42", 0xFF, "GET") {
+            ResolveOutcome::Match { index, .. } => assert_eq!(index, 0),
+            other => panic!("expected full match, got {:?}", outcome_label(&other)),
+        }
+        match t.resolve_inner("/items/foo", 0xFF, "GET") {
+            ResolveOutcome::Match { index, param_vals, .. } => {
+                assert_eq!(index, 1);
+                assert_eq!(param_vals, vec!["foo"]);
+            }
+            other => panic!("expected full match, got {:?}", outcome_label(&other)),
+        }
+    }
+
+    #[test]
+    fn resolve_mount_keeps_prefix_semantics() {
+        let t = table_with_entries(vec![(matcher(&[(false, "api", "")]), 0xFF, true, None)]);
+
+        match t.resolve_inner("/apix", 0xFF, "GET") {
+            ResolveOutcome::Match {
+                kind,
+                matched,
+                unmatched,
+                ..
+            } => {
+                assert_eq!(kind, Resolution::Mount);
+                assert_eq!(matched, "/api");
+                assert_eq!(unmatched, "x");
+            }
+            other => panic!("expected mount match, got {:?}", outcome_label(&other)),
+        }
+    }
+
+    #[test]
+    fn resolve_method_not_allowed_collects_methods_before_match() {
+        let t = table_with_entries(vec![
+            (
+                matcher(&[(false, "users", "")]),
+                0xFF,
+                false,
+                Some(vec!["GET".to_string()]),
+            ),
+            (
+                matcher(&[(true, "name", "str")]),
+                0xFF,
+                false,
+                Some(vec!["PUT".to_string()]),
+            ),
+            (
+                matcher(&[(false, "users", "")]),
+                0xFF,
+                false,
+                Some(vec!["DELETE".to_string()]),
+            ),
+        ]);
+
+        match t.resolve_inner("/users", 0xFF, "POST") {
+            ResolveOutcome::MethodNotAllowed { index, allowed_methods } => {
+                assert_eq!(index, 0);
+                assert_eq!(
+                    allowed_methods,
+                    vec!["GET".to_string(), "PUT".to_string(), "DELETE".to_string()]
+                );
+            }
+            other => panic!("expected method not allowed, got {:?}", outcome_label(&other)),
+        }
+        match t.resolve_inner("/users", 0xFF, "DELETE") {
+            ResolveOutcome::Match { index, .. } => assert_eq!(index, 2),
+            other => panic!("expected full match, got {:?}", outcome_label(&other)),
+        }
+    }
+
+    #[test]
+    fn resolve_unindexed_entry_is_always_a_candidate() {
+        let t = table_with_entries(vec![
+            (matcher(&[(false, "users", "")]), 0xFF, false, None),
+            (
+                PathMatcher::new(false, false, vec![(false, String::new(), String::new())]),
+                0xFF,
+                true,
+                None,
+            ),
+        ]);
+
+        match t.resolve_inner("/posts", 0xFF, "GET") {
+            ResolveOutcome::Match {
+                kind,
+                index,
+                matched,
+                unmatched,
+                ..
+            } => {
+                assert_eq!(kind, Resolution::Mount);
+                assert_eq!(index, 1);
+                assert_eq!(matched, "");
+                assert_eq!(unmatched, "/posts");
+            }
+            other => panic!("expected mount match, got {:?}", outcome_label(&other)),
+        }
+    }
+
+    #[test]
+    fn resolve_root_and_trailing_slash_paths() {
+        let t = table_with_entries(vec![
+            (matcher(&[(false, "", "")]), 0xFF, false, None),
+            (
+                PathMatcher::new(true, true, vec![(false, "users".to_owned(), String::new())]),
+                0xFF,
+                false,
+                None,
+            ),
+        ]);
+
+        assert!(matches!(
+            t.resolve_inner("/", 0xFF, "GET"),
+            ResolveOutcome::Match { index: 0, .. }
+        ));
+        assert!(matches!(
+            t.resolve_inner("/users/", 0xFF, "GET"),
+            ResolveOutcome::Match { index: 1, .. }
+        ));
+        assert!(matches!(
+            t.resolve_inner("/users", 0xFF, "GET"),
+            ResolveOutcome::NotFound
+        ));
+    }
+
+    #[test]
+    fn resolve_static_index_is_rebuilt_after_add_entry() {
+        let mut t = table_with_entries(vec![(
+            matcher(&[(false, "users", "")]),
+            0xFF,
+            false,
+            Some(vec!["GET".to_string()]),
+        )]);
+
+        assert!(matches!(
+            t.resolve_inner("/users", 0xFF, "POST"),
+            ResolveOutcome::MethodNotAllowed { .. }
+        ));
+
+        t.add_entry(
+            &matcher(&[(true, "name", "str")]),
+            0xFF,
+            false,
+            Some(vec!["POST".to_string()]),
+        );
+
+        assert!(matches!(
+            t.resolve_inner("/users", 0xFF, "POST"),
+            ResolveOutcome::Match { index: 1, .. }
+        ));
+    }
+
+    #[test]
+    fn resolve_large_table() {
+        let entries = (0..5000)
+            .map(|i| {
+                let name = format!("resource_{i}");
+                (
+                    matcher(&[(false, name.as_str(), ""), (true, "id", "int")]),
+                    0xFF,
+                    false,
+                    Some(vec!["GET".to_string()]),
+                )
+            })
+            .collect();
+        let t = table_with_entries(entries);
+
+        match t.resolve_inner("/resource_4999/42", 0xFF, "GET") {
+            ResolveOutcome::Match { index, param_vals, .. } => {
+                assert_eq!(index, 4999);
+                assert_eq!(param_vals, vec!["42"]);
+            }
+            other => panic!("expected full match, got {:?}", outcome_label(&other)),
+        }
+        assert!(matches!(
+            t.resolve_inner("/resource_5000/42", 0xFF, "GET"),
+            ResolveOutcome::NotFound
+        ));
+    }
+
+    #[test]
+    fn lru_cache_evicts_least_recently_used() {
+        let mut cache = LruCache::new(2);
+        cache.insert("a".to_owned(), 1);
+        cache.insert("b".to_owned(), 2);
+
+        assert_eq!(cache.get("a"), Some(&1));
+
+        cache.insert("c".to_owned(), 3);
+
+        assert_eq!(cache.len(), 2);
+        assert_eq!(cache.get("b"), None);
+        assert_eq!(cache.get("a"), Some(&1));
+        assert_eq!(cache.get("c"), Some(&3));
+
+        cache.insert("d".to_owned(), 4);
+
+        assert_eq!(cache.get("a"), None);
+        assert_eq!(cache.get("c"), Some(&3));
+        assert_eq!(cache.get("d"), Some(&4));
+    }
+
+    #[test]
+    fn lru_cache_replaces_existing_key() {
+        let mut cache = LruCache::new(2);
+        cache.insert("a".to_owned(), 1);
+        cache.insert("b".to_owned(), 2);
+        cache.insert("a".to_owned(), 3);
+        cache.insert("c".to_owned(), 4);
+
+        assert_eq!(cache.len(), 2);
+        assert_eq!(cache.get("a"), Some(&3));
+        assert_eq!(cache.get("b"), None);
+    }
+
+    #[test]
+    fn lru_cache_with_zero_capacity_is_disabled() {
+        let mut cache = LruCache::new(0);
+        cache.insert("a".to_owned(), 1);
+
+        assert_eq!(cache.len(), 0);
+        assert_eq!(cache.get("a"), None);
+    }
+
+    #[test]
+    fn lru_cache_clear() {
+        let mut cache = LruCache::new(1);
+        cache.insert("a".to_owned(), 1);
+        cache.clear();
+
+        assert_eq!(cache.get("a"), None);
+
+        cache.insert("b".to_owned(), 2);
+
+        assert_eq!(cache.get("b"), Some(&2));
+    }
+
+    #[test]
+    fn cache_key_distinguishes_scope_type_and_method() {
+        assert_ne!(cache_key("/a", 1, "GET"), cache_key("/a", 1, "GE"));
+        assert_ne!(cache_key("/a", 1, "GET"), cache_key("/a", 2, "GET"));
+    }
+
     fn outcome_label(o: &ResolveOutcome<'_>) -> &'static str {
         match o {
             ResolveOutcome::Match { .. } => "Match",
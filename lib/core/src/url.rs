@@ -26,14 +26,14 @@ pub enum MatchKind {
 
 /// One element of a parsed path template.
 #[derive(Clone)]
-enum Segment {
+pub(crate) enum Segment {
     Constant(String),
     Parameter { type_tag: TypeTag },
 }
 
 /// Validation tag for a parameter segment.
-#[derive(Clone, Copy)]
-enum TypeTag {
+#[derive(Clone, Copy, PartialEq, Eq)]
+pub(crate) enum TypeTag {
     Str,
     Int,
     Float,
@@ -67,6 +67,21 @@ pub struct PathMatcher {
 }
 
 impl PathMatcher {
+    /// Whether the template requires a leading ``/``.
+    pub(crate) const fn has_starting_slash(&self) -> bool {
+        self.has_starting_slash
+    }
+
+    /// Whether the template requires a trailing ``/``.
+    pub(crate) const fn has_trailing_slash(&self) -> bool {
+        self.has_trailing_slash
+    }
+
+    /// Parsed template segments, in declaration order.
+    pub(crate) fn segments(&self) -> &[Segment] {
+        &self.segments
+    }
+
     /// Pure-Rust path matching without Python object creation.
     ///
     /// Returns ``(kind, param_values, matched, unmatched)`` or ``None`` on no-match.
@@ -171,7 +186,7 @@ impl PathMatcher {
     }
 
     #[inline]
-    fn validate(seg: &[u8], tag: TypeTag) -> bool {
+    pub(crate) fn validate(seg: &[u8], tag: TypeTag) -> bool {
         match tag {
             TypeTag::Str => !seg.is_empty(),
             TypeTag::Int => Self::is_valid_int(seg),
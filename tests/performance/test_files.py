@@ -0,0 +1,83 @@
+"""Benchmark: file serving.
+
+Measures the full-drain latency of ``FileResponse`` through a full Flama application, for a whole file and for a
+range request, exercising the threaded ``FileReader`` producer and the ASGI send loop. Small static assets are measured
+both through ``FileResponse`` and through a mounted ``StaticFiles`` app, which serves them from its in-memory cache.
+"""
+
+import pytest
+
+from flama import Flama
+from flama.client import Client
+from flama.http.responses.file import FileResponse
+from flama.http.static import StaticFiles
+
+pytestmark = pytest.mark.benchmark(group="files")
+
+FILE_SIZE = 8 * 1024 * 1024
+ASSET_SIZE = 16 * 1024
+
+
+class TestCaseFileResponse:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def client(cls, loop, tmp_path_factory):
+        path = tmp_path_factory.mktemp("files") / "payload.bin"
+        path.write_bytes(bytes(range(256)) * (FILE_SIZE // 256))
+
+        app = Flama(schema=None, docs=None)
+
+        @app.route("/file/")
+        def file():
+            return FileResponse(path)
+
+        client = Client(app=app)
+        loop.run_until_complete(client.__aenter__())
+        yield client
+        loop.run_until_complete(client.__aexit__(None, None, None))
+
+    @pytest.mark.parametrize(
+        "headers",
+        [
+            pytest.param({}, id="full"),
+            pytest.param({"range": f"bytes=0-{FILE_SIZE // 2 - 1}"}, id="range"),
+        ],
+    )
+    def test_request(self, benchmark, client, loop, headers):
+        def run():
+            loop.run_until_complete(client.get("/file/", headers=headers))
+
+        benchmark(run)
+
+
+class TestCaseStaticFiles:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def client(cls, loop, tmp_path_factory):
+        directory = tmp_path_factory.mktemp("static")
+        (directory / "app.js").write_bytes(b"x" * ASSET_SIZE)
+
+        app = Flama(schema=None, docs=None)
+        app.mount("/static", StaticFiles(directory))
+
+        @app.route("/file/")
+        def file():
+            return FileResponse(directory / "app.js")
+
+        client = Client(app=app)
+        loop.run_until_complete(client.__aenter__())
+        yield client
+        loop.run_until_complete(client.__aexit__(None, None, None))
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            pytest.param("/file/", id="file_response"),
+            pytest.param("/static/app.js", id="static_files"),
+        ],
+    )
+    def test_request(self, benchmark, client, loop, path):
+        def run():
+            loop.run_until_complete(client.get(path))
+
+        benchmark(run)
@@ -1,9 +1,11 @@
 """Benchmark: Dependency injection performance.
 
 Measures DI resolution overhead at different chain depths (simple, nested,
-multi-dependency) through a full Flama application.
+multi-dependency, deep chains and wide fan-out) through a full Flama application.
 """
 
+import inspect
+
 import pytest
 
 from flama import Flama
@@ -37,8 +39,42 @@ class CompC(Component):
         return TypeC()
 
 
+DEPTH = 12
+WIDTH = 16
+
+
+def _component(name: str, returns: type, deps: dict[str, type]) -> Component:
+    def resolve(self, **kwargs):
+        return returns()
+
+    resolve.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+        [inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+        + [inspect.Parameter(k, inspect.Parameter.KEYWORD_ONLY, annotation=v) for k, v in deps.items()],
+        return_annotation=returns,
+    )
+    return type(name, (Component,), {"resolve": resolve})()
+
+
+def _handler(deps: dict[str, type]):
+    def handler(**kwargs):
+        return {"ok": True}
+
+    handler.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+        [inspect.Parameter(k, inspect.Parameter.KEYWORD_ONLY, annotation=v) for k, v in deps.items()]
+    )
+    return handler
+
+
+DEEP_TYPES = [type(f"Deep{i}", (), {}) for i in range(DEPTH)]
+DEEP_COMPONENTS = [
+    _component(f"DeepComp{i}", t, {"dep": DEEP_TYPES[i - 1]} if i else {}) for i, t in enumerate(DEEP_TYPES)
+]
+WIDE_TYPES = [type(f"Wide{i}", (), {}) for i in range(WIDTH)]
+WIDE_COMPONENTS = [_component(f"WideComp{i}", t, {}) for i, t in enumerate(WIDE_TYPES)]
+
+
 def _build_app() -> Flama:
-    app = Flama(schema=None, docs=None, components=[CompA(), CompB(), CompC()])
+    app = Flama(schema=None, docs=None, components=[CompA(), CompB(), CompC(), *DEEP_COMPONENTS, *WIDE_COMPONENTS])
 
     @app.route("/simple/")
     def simple(a: TypeA):
@@ -52,6 +88,9 @@ def _build_app() -> Flama:
     def multi(a: TypeA, c: TypeC):
         return {"ok": True}
 
+    app.add_route("/deep/", _handler({"deep": DEEP_TYPES[-1]}), name="deep")
+    app.add_route("/wide/", _handler({f"wide_{i}": t for i, t in enumerate(WIDE_TYPES)}), name="wide")
+
     return app
 
 
@@ -79,3 +118,9 @@ class TestCaseInjection:
 
     def test_multi(self, benchmark, client, loop):
         self._bench_get(benchmark, loop, client, "/multi/")
+
+    def test_deep(self, benchmark, client, loop):
+        self._bench_get(benchmark, loop, client, "/deep/")
+
+    def test_wide(self, benchmark, client, loop):
+        self._bench_get(benchmark, loop, client, "/wide/")
@@ -1,15 +1,16 @@
-"""Benchmark: JSON response performance.
+"""Benchmark: JSON response and request performance.
 
-Measures end-to-end JSON serialization latency at different payload sizes
-through a full Flama application.
+Measures end-to-end JSON serialization and deserialization latency at different
+payload sizes through a full Flama application.
 """
 
 import datetime
+import json
 import uuid
 
 import pytest
 
-from flama import Flama
+from flama import Flama, http
 from flama.client import Client
 
 pytestmark = pytest.mark.benchmark(group="json")
@@ -58,6 +59,10 @@ def _build_app() -> Flama:
     def complex_types():
         return COMPLEX_TYPES
 
+    @app.route("/decode/", methods=["POST"])
+    async def decode(request: http.Request):
+        return {"type": type(await request.json()).__name__}
+
     return app
 
 
@@ -88,3 +93,35 @@ class TestCaseJsonPayloadSize:
 
     def test_complex_types(self, benchmark, client, loop):
         self._bench_get(benchmark, loop, client, "/complex/")
+
+
+class TestCaseJsonDecodePayloadSize:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def client(cls, loop):
+        app = _build_app()
+        client = Client(app=app)
+        loop.run_until_complete(client.__aenter__())
+        yield client
+        loop.run_until_complete(client.__aexit__(None, None, None))
+
+    def _bench_post(self, benchmark, loop, client, payload):
+        body = json.dumps(payload).encode()
+        headers = {"content-type": "application/json"}
+
+        def run():
+            loop.run_until_complete(client.post("/decode/", content=body, headers=headers))
+
+        benchmark(run)
+
+    def test_small_dict(self, benchmark, client, loop):
+        self._bench_post(benchmark, loop, client, SMALL_DICT)
+
+    def test_nested_dict(self, benchmark, client, loop):
+        self._bench_post(benchmark, loop, client, NESTED_DICT)
+
+    def test_large_list(self, benchmark, client, loop):
+        self._bench_post(benchmark, loop, client, LARGE_LIST)
+
+    def test_complex_types(self, benchmark, client, loop):
+        self._bench_post(benchmark, loop, client, COMPLEX_TYPES)
@@ -1,23 +1,45 @@
 """Benchmark: OpenAPI document generation.
 
 Measures the cost of generating the OpenAPI specification for an application with many distinct schema-typed
-routes, exercising the schema registry, generator, and ``$defs`` bundling.
+routes, exercising the schema registry, generator, and ``$defs`` bundling, and the cost of generating it again
+after a single route or mount is added to a large application.
 """
 
+import itertools
 import typing as t
 
 import pydantic
 import pytest
 
-from flama import Flama, types
+from flama import Flama, routing, types
 from flama.client import Client
 
 pytestmark = pytest.mark.benchmark(group="schema")
 
 N_MODELS = 50
+N_ROUTES = 500
 _EXTRA_FIELDS = {f"field_{i}": (str, "") for i in range(8)}
 
 
+def _handler(model: type[pydantic.BaseModel]) -> t.Callable:
+    def handler():
+        return {}
+
+    handler.__annotations__["return"] = t.Annotated[types.Schema, types.SchemaMetadata(model)]
+    return handler
+
+
+def _build_app(n: int) -> Flama:
+    app = Flama(schema="/schema/", docs=None, schema_library="pydantic")
+    models = [
+        pydantic.create_model(f"Model{i}", id=(int, ...), name=(str, ...), price=(float, 0.0), **_EXTRA_FIELDS)
+        for i in range(N_MODELS)
+    ]
+    for i in range(n):
+        app.add_route(f"/m{i}/", _handler(models[i % N_MODELS]), methods=["GET"], name=f"get_{i}")
+    return app
+
+
 class TestCaseOpenAPIGeneration:
     @pytest.fixture(scope="class")
     @classmethod
@@ -44,3 +66,43 @@ class TestCaseOpenAPIGeneration:
             loop.run_until_complete(client.get("/schema/"))
 
         benchmark(run)
+
+
+class TestCaseOpenAPIIncremental:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def app(cls):
+        return _build_app(N_ROUTES)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def client(cls, app, loop):
+        client = Client(app=app)
+        loop.run_until_complete(client.__aenter__())
+        loop.run_until_complete(client.get("/schema/"))
+        yield client
+        loop.run_until_complete(client.__aexit__(None, None, None))
+
+    def test_add_route(self, benchmark, app, client, loop):
+        counter = itertools.count()
+        model = pydantic.create_model("Delta", id=(int, ...), **_EXTRA_FIELDS)
+
+        def run():
+            i = next(counter)
+            app.add_route(f"/delta{i}/", _handler(model), methods=["GET"], name=f"delta_{i}")
+            loop.run_until_complete(client.get("/schema/"))
+
+        benchmark(run)
+
+    def test_mount(self, benchmark, app, client, loop):
+        counter = itertools.count()
+        model = pydantic.create_model("MountDelta", id=(int, ...), **_EXTRA_FIELDS)
+
+        def run():
+            i = next(counter)
+            router = routing.Router(app=app)
+            router.add_route("/item/", _handler(model), methods=["GET"], name="item")
+            app.mount(f"/mount{i}/", app=router, name=f"mount_{i}")
+            loop.run_until_complete(client.get("/schema/"))
+
+        benchmark(run)
@@ -1,6 +1,6 @@
 """Benchmark: Route resolution performance.
 
-Measures how request latency scales with route table size (10, 50, 200 routes)
+Measures how request latency scales with route table size (10 up to 5000 routes)
 using static and parametric paths through a full Flama application.
 """
 
@@ -110,3 +110,55 @@ class TestCaseRoutes200:
 
     def test_last(self, benchmark, client, loop):
         self._bench_get(benchmark, loop, client, "/resource_199/42/")
+
+
+class TestCaseRoutes1000:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def client(cls, loop):
+        app = _build_app(1000)
+        client = Client(app=app)
+        loop.run_until_complete(client.__aenter__())
+        yield client
+        loop.run_until_complete(client.__aexit__(None, None, None))
+
+    def _bench_get(self, benchmark, loop, client, path):
+        def run():
+            loop.run_until_complete(client.get(path))
+
+        benchmark(run)
+
+    def test_first(self, benchmark, client, loop):
+        self._bench_get(benchmark, loop, client, "/resource_0/42/")
+
+    def test_last(self, benchmark, client, loop):
+        self._bench_get(benchmark, loop, client, "/resource_999/42/")
+
+    def test_not_found(self, benchmark, client, loop):
+        self._bench_get(benchmark, loop, client, "/missing/42/")
+
+
+class TestCaseRoutes5000:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def client(cls, loop):
+        app = _build_app(5000)
+        client = Client(app=app)
+        loop.run_until_complete(client.__aenter__())
+        yield client
+        loop.run_until_complete(client.__aexit__(None, None, None))
+
+    def _bench_get(self, benchmark, loop, client, path):
+        def run():
+            loop.run_until_complete(client.get(path))
+
+        benchmark(run)
+
+    def test_first(self, benchmark, client, loop):
+        self._bench_get(benchmark, loop, client, "/resource_0/42/")
+
+    def test_last(self, benchmark, client, loop):
+        self._bench_get(benchmark, loop, client, "/resource_4999/42/")
+
+    def test_not_found(self, benchmark, client, loop):
+        self._bench_get(benchmark, loop, client, "/missing/42/")
@@ -1,7 +1,8 @@
 """Benchmark: Schema validation performance.
 
 Measures pydantic input validation and output serialization overhead through
-schema-typed Flama endpoints.
+schema-typed Flama endpoints, and compares validation and serialization across
+the supported schema libraries.
 """
 
 import typing as t
@@ -9,8 +10,10 @@ import typing as t
 import pydantic
 import pytest
 
-from flama import Flama, types
+from flama import Flama, schemas, types
 from flama.client import Client
+from flama.injection.resolver import Parameter
+from flama.schemas.data_structures import Field, Schema
 
 pytestmark = pytest.mark.benchmark(group="schema")
 
@@ -155,3 +158,58 @@ class TestCaseSchemaMedium:
 
     def test_post(self, benchmark, client, loop):
         self._bench_post(benchmark, loop, client, "/medium/", MEDIUM_DATA)
+
+
+QUERY_PARAMS = 16
+
+
+class TestCaseSchemaQueryParams:
+    """Validation of query params with a validator built once per route against building it on every request."""
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def fields(cls):
+        schemas._module.setup("pydantic")
+        return [Field.from_parameter(Parameter(f"param_{i}", int, 0)) for i in range(QUERY_PARAMS)]
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def values(cls):
+        return {f"param_{i}": str(i) for i in range(QUERY_PARAMS)}
+
+    def test_prebuilt(self, benchmark, fields, values):
+        validator = Schema.build(name="ValidationSchema", fields=fields)
+
+        benchmark(lambda: validator.validate(values))
+
+    def test_build_each_time(self, benchmark, fields, values):
+        benchmark(lambda: Schema.build(name="ValidationSchema", fields=fields).validate(values))
+
+
+BATCH = 100
+
+
+class TestCaseSchemaLibraries:
+    """The same schema validated and dumped through every supported schema library."""
+
+    @pytest.fixture(scope="function", params=["pydantic", "marshmallow", "typesystem"])
+    def schema(self, request):
+        schemas._module.setup(request.param)
+        return Schema.build(
+            name="MediumSchema",
+            fields=[
+                Field(name, t.cast(type, field.annotation), required=field.is_required(), default=field.default)
+                for name, field in MediumModel.model_fields.items()
+            ],
+        )
+
+    def test_validate(self, benchmark, schema):
+        benchmark(lambda: schema.validate(MEDIUM_DATA))
+
+    def test_validate_many(self, benchmark, schema):
+        values = [MEDIUM_DATA] * BATCH
+
+        benchmark(lambda: schema.validate(values))
+
+    def test_dump(self, benchmark, schema):
+        benchmark(lambda: schema.dump(MEDIUM_DATA))
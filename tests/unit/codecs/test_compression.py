@@ -1,5 +1,6 @@
 import pytest
 
+from flama._core.compression import decompress
 from flama.codecs.compression.brotli import BrotliCodec
 from flama.codecs.compression.gzip import GzipCodec
 from flama.codecs.compression.negotiator import CompressionNegotiator
@@ -7,6 +8,9 @@ from flama.exceptions import NoCodecAvailable
 
 
 class TestCaseBrotliCodec:
+    def test_compress(self):
+        assert decompress(BrotliCodec().compress(b"x" * 1000, True), "brotli") == b"x" * 1000
+
     async def test_decode(self):
         codec = BrotliCodec()
 
@@ -26,6 +30,9 @@ class TestCaseBrotliCodec:
 
 
 class TestCaseGzipCodec:
+    def test_compress(self):
+        assert decompress(GzipCodec().compress(b"x" * 1000, True), "gzip") == b"x" * 1000
+
     async def test_decode(self):
         codec = GzipCodec()
 
@@ -1,10 +1,11 @@
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from flama import exceptions
 from flama.codecs.http.jsondata import JSONDataCodec
 from flama.codecs.http.multipart import MultiPartCodec
+from flama.codecs.http.ndjsondata import NDJSONDataCodec
 from flama.codecs.http.negotiator import HTTPContentTypeNegotiator
 from flama.codecs.http.urlencoded import URLEncodedCodec
 from flama.http.data_structures import FormData, UploadFile
@@ -39,6 +40,51 @@ class TestCaseJSONDataCodec:
             result = await JSONDataCodec().decode(request)
             assert result == expected
 
+    @pytest.mark.parametrize(
+        ["body", "expected", "exception"],
+        [
+            pytest.param(b'{"key": "value"}', {"key": "value"}, None, id="success"),
+            pytest.param(b"", None, None, id="empty_body"),
+            pytest.param(b"not-json", None, (exceptions.DecodeError, "Malformed JSON."), id="malformed"),
+        ],
+        indirect=["exception"],
+    )
+    def test_loads(self, body, expected, exception):
+        with exception:
+            assert JSONDataCodec().loads(body) == expected
+
+
+class TestCaseNDJSONDataCodec:
+    @pytest.mark.parametrize(
+        ["items", "expected", "exception"],
+        [
+            pytest.param(
+                [{"key": "value"}, {"key": "other"}], [{"key": "value"}, {"key": "other"}], None, id="success"
+            ),
+            pytest.param([], None, None, id="empty_body"),
+            pytest.param(
+                [{"key": "value"}, ValueError("bad")],
+                None,
+                exceptions.DecodeError("Malformed JSON. bad"),
+                id="malformed",
+            ),
+        ],
+        indirect=["exception"],
+    )
+    async def test_decode(self, items, expected, exception):
+        async def json_items():
+            for item in items:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+
+        request = MagicMock()
+        request.json_items = json_items
+
+        with exception:
+            result = await NDJSONDataCodec().decode(request)
+            assert result == expected
+
 
 class TestCaseURLEncodedCodec:
     @pytest.mark.parametrize(
@@ -89,7 +135,7 @@ class TestCaseMultiPartCodec:
 class TestCaseHTTPContentTypeNegotiator:
     @pytest.fixture(scope="function")
     def negotiator(self):
-        return HTTPContentTypeNegotiator([JSONDataCodec(), URLEncodedCodec(), MultiPartCodec()])
+        return HTTPContentTypeNegotiator([JSONDataCodec(), NDJSONDataCodec(), URLEncodedCodec(), MultiPartCodec()])
 
     @pytest.mark.parametrize(
         ["value", "expected_type", "exception"],
@@ -99,6 +145,8 @@ class TestCaseHTTPContentTypeNegotiator:
             pytest.param("application/json; charset=utf-8", JSONDataCodec, None, id="json_with_params"),
             pytest.param("application/x-www-form-urlencoded", URLEncodedCodec, None, id="urlencoded"),
             pytest.param("multipart/form-data", MultiPartCodec, None, id="multipart"),
+            pytest.param("application/x-ndjson", NDJSONDataCodec, None, id="ndjson"),
+            pytest.param("application/ndjson", NDJSONDataCodec, None, id="ndjson_alias"),
             pytest.param(
                 "application/xml",
                 None,
@@ -0,0 +1,146 @@
+import json
+import math
+
+import pytest
+
+from flama._core.json_decoder import decode_json, raw_decode_json
+
+
+class TestCaseDecodeJson:
+    @pytest.mark.parametrize(
+        ["content", "result"],
+        (
+            # -- Standard types --
+            pytest.param(b"null", None, id="null"),
+            pytest.param(b"true", True, id="bool_true"),
+            pytest.param(b"false", False, id="bool_false"),
+            pytest.param(b"0", 0, id="int_zero"),
+            pytest.param(b"42", 42, id="int_positive"),
+            pytest.param(b"-7", -7, id="int_negative"),
+            pytest.param(str(10**100).encode(), 10**100, id="int_large"),
+            pytest.param(b"1.5", 1.5, id="float"),
+            pytest.param(b"-2.5e-3", -2.5e-3, id="float_exponent"),
+            pytest.param(b"1E2", 100.0, id="float_exponent_no_fraction"),
+            pytest.param(b"1e400", math.inf, id="float_overflow"),
+            pytest.param(b"Infinity", math.inf, id="infinity"),
+            pytest.param(b"-Infinity", -math.inf, id="negative_infinity"),
+            pytest.param(b'""', "", id="str_empty"),
+            pytest.param(b'"hello"', "hello", id="str_simple"),
+            pytest.param('"café \U0001f600"'.encode(), "café \U0001f600", id="str_unicode"),
+            pytest.param(b'"a\\"b\\\\c\\/d\\b\\f\\n\\r\\t"', 'a"b\\c/d\b\f\n\r\t', id="str_escapes"),
+            pytest.param(b'"\\u00e9\\ud83d\\ude00"', "é\U0001f600", id="str_unicode_escapes"),
+            pytest.param(b'"\\ud800"', "\ud800", id="str_lone_surrogate"),
+            pytest.param(b"{}", {}, id="dict_empty"),
+            pytest.param(b'{"a": 1, "b": [true, null]}', {"a": 1, "b": [True, None]}, id="dict"),
+            pytest.param(b'{"a": 1, "a": 2}', {"a": 2}, id="dict_duplicate_key"),
+            pytest.param(b"[]", [], id="list_empty"),
+            pytest.param(b' [1, "a", [{}]] \n', [1, "a", [{}]], id="list_whitespace"),
+            # -- Inputs --
+            pytest.param('{"a": "é"}', {"a": "é"}, id="input_str"),
+            pytest.param(b'\xef\xbb\xbf{"a": 1}', {"a": 1}, id="input_utf8_bom"),
+            pytest.param('{"a": 1}'.encode("utf-16"), {"a": 1}, id="input_utf16"),
+            pytest.param('{"a": 1}'.encode("utf-32-le"), {"a": 1}, id="input_utf32"),
+        ),
+    )
+    def test_decode_json(self, content, result):
+        assert decode_json(content) == json.loads(content) == result
+
+    def test_decode_json_nan(self):
+        assert math.isnan(decode_json(b"NaN"))
+
+    def test_decode_json_duplicate_key_order(self):
+        content = b'{"a": 1, "b": 2, "a": 3}'
+
+        assert list(decode_json(content).items()) == list(json.loads(content).items()) == [("a", 3), ("b", 2)]
+
+    @pytest.mark.parametrize(
+        "content",
+        (
+            pytest.param(b"", id="empty"),
+            pytest.param(b"  ", id="whitespace"),
+            pytest.param(b"[1,]", id="list_trailing_comma"),
+            pytest.param(b"[1 2]", id="list_missing_comma"),
+            pytest.param(b"[1", id="list_unterminated"),
+            pytest.param(b'{"a":1,}', id="dict_trailing_comma"),
+            pytest.param(b'{"a" 1}', id="dict_missing_colon"),
+            pytest.param(b"{1: 2}", id="dict_key_not_str"),
+            pytest.param(b'{"a": 1', id="dict_unterminated"),
+            pytest.param(b"1 x", id="extra_data"),
+            pytest.param(b"01", id="number_leading_zero"),
+            pytest.param(b"1.", id="number_bare_dot"),
+            pytest.param(b"1e", id="number_bare_exponent"),
+            pytest.param(b"-", id="number_bare_minus"),
+            pytest.param(b"[-", id="number_bare_minus_nested"),
+            pytest.param(b"tru", id="literal_truncated"),
+            pytest.param(b'"ab', id="str_unterminated"),
+            pytest.param(b'"\\', id="str_unterminated_escape"),
+            pytest.param(b'"a\nb"', id="str_control_character"),
+            pytest.param(b'"ab\\x"', id="str_invalid_escape"),
+            pytest.param(b'"\\u12"', id="str_invalid_unicode_escape"),
+            pytest.param(b'"\\ud800\\u12"', id="str_invalid_low_surrogate"),
+            pytest.param('["é", x]'.encode(), id="position_in_chars"),
+            pytest.param("\ufeff{}", id="str_with_bom"),
+        ),
+    )
+    def test_decode_json_error(self, content):
+        with pytest.raises(json.JSONDecodeError) as expected:
+            json.loads(content)
+
+        with pytest.raises(json.JSONDecodeError) as exc_info:
+            decode_json(content)
+
+        assert exc_info.value.msg == expected.value.msg
+        assert exc_info.value.pos == expected.value.pos
+        assert exc_info.value.doc == expected.value.doc
+
+    def test_decode_json_invalid_utf8(self):
+        with pytest.raises(UnicodeDecodeError):
+            decode_json(b'"\xff"')
+
+    def test_decode_json_too_deep(self):
+        with pytest.raises(RecursionError):
+            decode_json(b"[" * 100_000 + b"]" * 100_000)
+
+
+class TestCaseRawDecodeJson:
+    @pytest.mark.parametrize(
+        ["content", "pos", "result"],
+        (
+            pytest.param('[1, {"a": 2}] x', 0, ([1, {"a": 2}], 13), id="start"),
+            pytest.param('[1, {"a": 2}] x', 4, ({"a": 2}, 12), id="offset"),
+            pytest.param("123,", 0, (123, 3), id="number"),
+            pytest.param('["é", "ü"]', 7, ("ü", 11), id="utf8_offsets"),
+            pytest.param('"\\ud800" 1', 0, ("\ud800", 8), id="lone_surrogate"),
+        ),
+    )
+    def test_raw_decode_json(self, content, pos, result):
+        assert raw_decode_json(content, pos) == result
+
+    @pytest.mark.parametrize(
+        ["content", "pos"],
+        (
+            pytest.param("[1,]", 3, id="trailing_comma"),
+            pytest.param('{"a" 1}', 0, id="dict_missing_colon"),
+            pytest.param('["ab', 1, id="str_unterminated"),
+            pytest.param("[1, ", 4, id="end"),
+        ),
+    )
+    def test_raw_decode_json_error(self, content, pos):
+        with pytest.raises(json.JSONDecodeError) as expected:
+            json.JSONDecoder().raw_decode(content, pos)
+
+        with pytest.raises(json.JSONDecodeError) as exc_info:
+            raw_decode_json(content, pos)
+
+        assert exc_info.value.msg == expected.value.msg
+        assert exc_info.value.pos == expected.value.pos
+
+    def test_raw_decode_json_error_position_in_chars(self):
+        with pytest.raises(json.JSONDecodeError) as exc_info:
+            raw_decode_json('["é", x]', 7)
+
+        assert exc_info.value.pos == 6
+
+    def test_raw_decode_json_not_char_boundary(self):
+        with pytest.raises(ValueError, match="not at a character boundary"):
+            raw_decode_json('"é"', 2)
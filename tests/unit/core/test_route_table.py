@@ -5,9 +5,9 @@ from flama._core.url import PathMatcher
 from flama.routing.routes._base import ScopeType
 
 
-def _table(*entries):
+def _table(*entries, **kwargs):
     """Build a RouteTable from (path_pattern, scope_type_mask, accept_partial, methods) tuples."""
-    rt = RouteTable()
+    rt = RouteTable(**kwargs)
     for path, mask, partial, methods in entries:
         has_start = path.startswith("/")
         has_trail = path.endswith("/") and len(path) > 1
@@ -233,3 +233,62 @@ class TestCaseRouteTable:
                 assert tuple(result[2]) == expected[2]
                 assert result[3] == expected[3]
                 assert result[4] == expected[4]
+
+    def test_resolve_cache(self):
+        table = _table(("/foo/", ScopeType.http, False, ["GET"]), ("/bar/", ScopeType.http, False, ["GET"]))
+
+        first = table.resolve("/foo/", ScopeType.http, "GET")
+        second = table.resolve("/foo/", ScopeType.http, "GET")
+        other_method = table.resolve("/foo/", ScopeType.http, "POST")
+        not_found = table.resolve("/baz/", ScopeType.http, "GET")
+
+        assert second is first
+        assert other_method[0] == 2
+        assert not_found is None
+        assert table.cache_info() == (1, 3, 256, 2)
+
+    def test_resolve_cache_evicts_least_recently_used(self):
+        table = _table(
+            ("/foo/", ScopeType.http, False, None),
+            ("/bar/", ScopeType.http, False, None),
+            ("/baz/", ScopeType.http, False, None),
+            cache_size=2,
+        )
+
+        foo = table.resolve("/foo/", ScopeType.http, "GET")
+        table.resolve("/bar/", ScopeType.http, "GET")
+        table.resolve("/foo/", ScopeType.http, "GET")
+        table.resolve("/baz/", ScopeType.http, "GET")
+
+        assert table.resolve("/foo/", ScopeType.http, "GET") is foo
+        assert table.cache_info() == (2, 3, 2, 2)
+
+        table.resolve("/bar/", ScopeType.http, "GET")
+
+        assert table.cache_info() == (2, 4, 2, 2)
+
+    def test_resolve_cache_invalidated_by_add_entry(self):
+        table = _table(("/foo/", ScopeType.http, False, ["GET"]))
+        table.resolve("/foo/", ScopeType.http, "POST")
+
+        table.add_entry(PathMatcher(True, True, [(False, "foo", "")]), ScopeType.http, False, ["POST"])
+
+        assert table.cache_info() == (0, 1, 256, 0)
+        assert table.resolve("/foo/", ScopeType.http, "POST")[:2] == (0, 1)
+
+    def test_resolve_cache_disabled(self):
+        table = _table(("/foo/", ScopeType.http, False, ["GET"]), cache_size=0)
+
+        first = table.resolve("/foo/", ScopeType.http, "GET")
+
+        assert table.resolve("/foo/", ScopeType.http, "GET") == first
+        assert table.cache_info() == (0, 0, 0, 0)
+
+    def test_cache_clear(self):
+        table = _table(("/foo/", ScopeType.http, False, ["GET"]))
+        table.resolve("/foo/", ScopeType.http, "GET")
+        table.resolve("/foo/", ScopeType.http, "GET")
+
+        table.cache_clear()
+
+        assert table.cache_info() == (0, 0, 256, 0)
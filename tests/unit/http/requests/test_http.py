@@ -190,6 +190,22 @@ class TestCaseRequest:
         if check_cached:
             assert await request.json() is data
 
+    @pytest.mark.parametrize(
+        ["content_type", "body_bytes", "expected"],
+        [
+            pytest.param(b"application/json", b'[{"x": 1}, {"x": 2}]', [{"x": 1}, {"x": 2}], id="array"),
+            pytest.param(b"application/json", b'{"x": 1}', [{"x": 1}], id="single_value"),
+            pytest.param(b"application/x-ndjson", b'{"x": 1}\n{"x": 2}\n', [{"x": 1}, {"x": 2}], id="ndjson"),
+            pytest.param(b"application/ndjson", b'{"x": 1}\n{"x": 2}\n', [{"x": 1}, {"x": 2}], id="ndjson_alias"),
+            pytest.param(b"application/json", b"", [], id="empty"),
+        ],
+    )
+    async def test_json_items(self, scope, content_type, body_bytes, expected):
+        scope["headers"] = [(b"content-type", content_type)]
+        request = Request(scope, self._make_receive(body_bytes, chunked=True))
+
+        assert [item async for item in request.json_items()] == expected
+
     @pytest.mark.parametrize(
         ["scenario"],
         [
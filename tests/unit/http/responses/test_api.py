@@ -33,6 +33,13 @@ class TestCaseAPIResponse:
         ["use_schema", "content", "expected", "exception"],
         (
             pytest.param(True, {"name": "Canna"}, '{"name":"Canna"}', None, id="schema_and_content"),
+            pytest.param(
+                True,
+                [{"name": "Canna"}, {"name": "Sandy"}],
+                '[{"name":"Canna"},{"name":"Sandy"}]',
+                None,
+                id="schema_and_list_content",
+            ),
             pytest.param(False, {}, "{}", None, id="no_content"),
             pytest.param(False, {"name": "Canna"}, '{"name":"Canna"}', None, id="no_schema"),
             pytest.param(True, {"foo": "bar"}, "", exceptions.SerializationError, id="error"),
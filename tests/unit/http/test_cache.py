@@ -0,0 +1,315 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from flama import http
+from flama.applications import Flama
+from flama.client import Client
+from flama.http.cache import ResponseCache, ResponseETag, etag_matches, generate_etag
+
+
+@pytest.mark.parametrize(
+    ["if_none_match", "etag", "result"],
+    [
+        pytest.param('"foo"', '"foo"', True, id="match"),
+        pytest.param('"bar"', '"foo"', False, id="no_match"),
+        pytest.param('"bar", "foo"', '"foo"', True, id="list"),
+        pytest.param('W/"foo"', '"foo"', True, id="weak"),
+        pytest.param("*", '"foo"', True, id="any"),
+    ],
+)
+def test_etag_matches(if_none_match, etag, result):
+    assert etag_matches(if_none_match, etag) is result
+
+
+@pytest.mark.parametrize(
+    ["weak", "result"],
+    [
+        pytest.param(False, '"0beec7b5ea3f0fdbc95d0dd47f3c5bc275da8a33"', id="strong"),
+        pytest.param(True, 'W/"0beec7b5ea3f0fdbc95d0dd47f3c5bc275da8a33"', id="weak"),
+    ],
+)
+def test_generate_etag(weak, result):
+    assert generate_etag(b"foo", weak=weak) == result
+
+
+class TestCaseResponseETag:
+    @pytest.fixture(scope="function")
+    def calls(self):
+        return []
+
+    @pytest.fixture(scope="function")
+    def app(self, calls, request):
+        app = Flama(schema=None, docs=None, **getattr(request, "param", {}))
+
+        def handler():
+            calls.append("foo")
+            return {"name": "foo"}
+
+        app.add_route("/foo/", handler, methods=["GET", "POST"], etag=ResponseETag())
+        app.add_route("/weak/", handler, etag=ResponseETag(weak=True))
+        app.add_route("/app/", handler)
+        app.add_route("/text/", lambda: http.PlainTextResponse("foo", headers={"etag": '"bar"'}), etag=ResponseETag())
+        app.add_route("/error/", lambda: http.APIResponse({}, status_code=400), etag=ResponseETag())
+        app.add_route("/stream/", lambda: http.NDJSONResponse([{"name": "foo"}]), etag=ResponseETag())
+        return app
+
+    @pytest.mark.parametrize(
+        ["path", "etag"],
+        [
+            pytest.param("/foo/", generate_etag(b'{"name":"foo"}'), id="strong"),
+            pytest.param("/weak/", generate_etag(b'{"name":"foo"}', weak=True), id="weak"),
+        ],
+    )
+    async def test_not_modified(self, app, calls, path, etag):
+        async with Client(app=app) as client:
+            first = await client.get(path)
+            second = await client.get(path, headers={"if-none-match": first.headers["etag"]})
+            head = await client.head(path, headers={"if-none-match": first.headers["etag"]})
+            changed = await client.get(path, headers={"if-none-match": '"bar"'})
+
+        assert first.status_code == changed.status_code == 200
+        assert first.headers["etag"] == second.headers["etag"] == changed.headers["etag"] == etag
+        assert second.status_code == head.status_code == 304
+        assert second.content == b""
+        assert "content-type" not in second.headers
+        assert "content-length" not in second.headers
+        assert changed.json() == {"name": "foo"}
+        assert calls == ["foo"] * 4
+
+    async def test_not_modified_handler_etag(self, app):
+        async with Client(app=app) as client:
+            first = await client.get("/text/")
+            second = await client.get("/text/", headers={"if-none-match": '"bar"'})
+            changed = await client.get("/text/", headers={"if-none-match": '"foo"'})
+
+        assert first.status_code == changed.status_code == 200
+        assert first.headers["etag"] == second.headers["etag"] == changed.headers["etag"] == '"bar"'
+        assert second.status_code == 304
+        assert second.content == b""
+        assert changed.text == "foo"
+
+    @pytest.mark.parametrize(
+        ["app", "path", "etag"],
+        [
+            pytest.param({}, "/app/", False, id="disabled"),
+            pytest.param({"etag": ResponseETag()}, "/app/", True, id="app"),
+            pytest.param({"etag": ResponseETag()}, "/weak/", True, id="route_overrides_app"),
+        ],
+        indirect=["app"],
+    )
+    async def test_app(self, app, path, etag):
+        async with Client(app=app) as client:
+            response = await client.get(path)
+
+        assert ("etag" in response.headers) is etag
+        if path == "/weak/":
+            assert response.headers["etag"].startswith("W/")
+
+    @pytest.mark.parametrize(
+        ["method", "path", "status_code", "etag"],
+        [
+            pytest.param("POST", "/foo/", 200, None, id="method"),
+            pytest.param("GET", "/error/", 400, None, id="status_code"),
+            pytest.param("GET", "/stream/", 200, None, id="streaming"),
+        ],
+    )
+    async def test_not_tagged(self, app, method, path, status_code, etag):
+        async with Client(app=app) as client:
+            response = await client.request(method, path, headers={"if-none-match": "*"})
+
+        assert response.status_code == status_code
+        assert response.headers.get("etag") == etag
+
+
+class TestCaseResponseCache:
+    @pytest.fixture(scope="function")
+    def clock(self):
+        with patch("flama.http.cache.time.monotonic", return_value=1000.0) as clock:
+            yield clock
+
+    @pytest.fixture(scope="function")
+    def calls(self):
+        return []
+
+    @pytest.fixture(scope="function")
+    def app(self, calls):
+        app = Flama(schema=None, docs=None)
+
+        def handler(name: str = "foo"):
+            calls.append(name)
+            return {"name": name, "call": len(calls)}
+
+        app.add_route("/foo/", handler, methods=["GET", "POST"])
+        return app
+
+    @pytest.fixture(scope="function")
+    def cache(self, app, request):
+        cache = ResponseCache(**getattr(request, "param", {"ttl": 10}))
+        app.routes[0].cache = cache
+        return cache
+
+    async def test_hit(self, app, cache, calls, clock):
+        async with Client(app=app) as client:
+            first = await client.get("/foo/")
+            second = await client.get("/foo/")
+
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json() == {"name": "foo", "call": 1}
+        assert first.headers["etag"] == second.headers["etag"] == generate_etag(first.content)
+        assert calls == ["foo"]
+        assert len(cache) == 1
+
+    async def test_key(self, app, cache, calls, clock):
+        async with Client(app=app) as client:
+            await client.get("/foo/?name=bar&x=1")
+            await client.get("/foo/?x=1&name=bar")
+            await client.get("/foo/?name=baz")
+
+        assert calls == ["bar", "baz"]
+
+    @pytest.mark.parametrize("cache", [{"ttl": 10, "vary": ["Accept-Language"]}], indirect=True)
+    async def test_vary(self, app, cache, calls, clock):
+        async with Client(app=app) as client:
+            first = await client.get("/foo/", headers={"accept-language": "en"})
+            await client.get("/foo/", headers={"accept-language": "en"})
+            await client.get("/foo/", headers={"accept-language": "es"})
+
+        assert first.headers["vary"] == "accept-language"
+        assert calls == ["foo", "foo"]
+
+    async def test_not_modified(self, app, cache, calls, clock):
+        async with Client(app=app) as client:
+            first = await client.get("/foo/")
+            second = await client.get("/foo/", headers={"if-none-match": first.headers["etag"]})
+            third = await client.get("/foo/", headers={"if-none-match": '"other"'})
+
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == first.headers["etag"]
+        assert third.status_code == 200
+        assert calls == ["foo"]
+
+    async def test_expired(self, app, cache, calls, clock):
+        async with Client(app=app) as client:
+            await client.get("/foo/")
+            clock.return_value += 10
+            response = await client.get("/foo/")
+
+        assert response.json() == {"name": "foo", "call": 2}
+        assert calls == ["foo", "foo"]
+
+    @pytest.mark.parametrize("cache", [{"ttl": 10, "stale_while_revalidate": 5}], indirect=True)
+    async def test_stale_while_revalidate(self, app, cache, calls, clock):
+        async with Client(app=app) as client:
+            await client.get("/foo/")
+            clock.return_value += 12
+            stale = await client.get("/foo/")
+            await asyncio.gather(*cache._tasks)
+            fresh = await client.get("/foo/")
+            clock.return_value += 20
+            expired = await client.get("/foo/")
+
+        assert stale.json() == {"name": "foo", "call": 1}
+        assert fresh.json() == {"name": "foo", "call": 2}
+        assert expired.json() == {"name": "foo", "call": 3}
+
+    @pytest.mark.parametrize("cache", [{"ttl": 10, "stale_while_revalidate": 5}], indirect=True)
+    async def test_stale_while_revalidate_background(self, app, cache, clock):
+        released = asyncio.Event()
+        calls = []
+
+        async def slow():
+            calls.append(None)
+            if len(calls) > 1:
+                await released.wait()
+            return {"call": len(calls)}
+
+        app.add_route("/slow/", slow, cache=cache)
+
+        async with Client(app=app) as client:
+            await client.get("/slow/")
+            clock.return_value += 12
+            stale = await asyncio.wait_for(client.get("/slow/"), timeout=1)
+            revalidating = await asyncio.wait_for(client.get("/slow/"), timeout=1)
+            released.set()
+            await asyncio.gather(*cache._tasks)
+            fresh = await client.get("/slow/")
+
+        assert stale.json() == revalidating.json() == {"call": 1}
+        assert fresh.json() == {"call": 2}
+        assert len(calls) == 2
+
+    @pytest.mark.parametrize("cache", [{"ttl": 10, "stale_while_revalidate": 5}], indirect=True)
+    async def test_stale_while_revalidate_error(self, app, cache, clock, caplog):
+        calls = []
+
+        def error():
+            calls.append(None)
+            if len(calls) > 1:
+                raise ValueError("Foo")
+            return {"call": len(calls)}
+
+        app.add_route("/error/", error, cache=cache)
+
+        async with Client(app=app) as client:
+            await client.get("/error/")
+            clock.return_value += 12
+            stale = await client.get("/error/")
+            await asyncio.gather(*cache._tasks)
+
+        assert stale.json() == {"call": 1}
+        assert "Cannot revalidate stale response for '/error/'" in caplog.text
+        assert not cache._revalidating
+
+    @pytest.mark.parametrize("cache", [{"ttl": 10, "max_size": 2}], indirect=True)
+    async def test_eviction(self, app, cache, calls, clock):
+        async with Client(app=app) as client:
+            for name in ("a", "b", "a", "c", "a", "b"):
+                await client.get(f"/foo/?name={name}")
+
+        assert calls == ["a", "b", "c", "b"]
+        assert len(cache) == 2
+
+    async def test_not_cached(self, app, cache, calls, clock):
+        def cookie():
+            response = http.APIResponse({"foo": "bar"})
+            response.set_cookie("foo", "bar")
+            return response
+
+        def error():
+            return http.APIResponse({"foo": "bar"}, status_code=400)
+
+        app.add_route("/cookie/", cookie, cache=cache)
+        app.add_route("/error/", error, cache=cache)
+
+        async with Client(app=app) as client:
+            post = await client.post("/foo/")
+            await client.post("/foo/")
+            cookie_response = await client.get("/cookie/")
+            error_response = await client.get("/error/")
+
+        assert post.json() == {"name": "foo", "call": 1}
+        assert "etag" not in post.headers
+        assert calls == ["foo", "foo"]
+        assert "etag" not in cookie_response.headers
+        assert error_response.status_code == 400
+        assert len(cache) == 0
+
+    async def test_streaming(self, app, cache, clock):
+        async def stream():
+            yield {"foo": 1}
+            yield {"bar": 2}
+
+        def handler():
+            return http.NDJSONResponse(stream())
+
+        app.add_route("/stream/", handler, cache=cache)
+
+        async with Client(app=app) as client:
+            response = await client.get("/stream/")
+
+        assert response.status_code == 200
+        assert response.content == b'{"foo":1}\n{"bar":2}\n'
+        assert len(cache) == 0
@@ -1,10 +1,21 @@
+import json
 import os
+from unittest.mock import patch
 
 import pytest
 
 from flama import types
 from flama.exceptions import ApplicationError
-from flama.http.data_structures import FormData, Headers, MutableHeaders, QueryParams, State, UploadFile
+from flama.http import data_structures
+from flama.http.data_structures import (
+    FormData,
+    Headers,
+    JSONItemsDecoder,
+    MutableHeaders,
+    QueryParams,
+    State,
+    UploadFile,
+)
 
 
 class TestCaseHeaders:
@@ -673,3 +684,81 @@ class TestCaseFormData:
     async def test_from_multipart_limits(self, body, kwargs, expected_error):
         with pytest.raises(ValueError, match=expected_error):
             await FormData.from_multipart(self._make_receive(body), "----B", **kwargs)
+
+
+class TestCaseJSONItemsDecoder:
+    @pytest.mark.parametrize(
+        ["document", "lines", "expected"],
+        [
+            pytest.param(
+                json.dumps([{"a": [1, {"b": 'x"]},'}]}, -1.5e-3, "é,]", [], {}, None, True, 10**30]).encode(),
+                False,
+                [{"a": [1, {"b": 'x"]},'}]}, -1.5e-3, "é,]", [], {}, None, True, 10**30],
+                id="array",
+            ),
+            pytest.param(b" [ ] ", False, [], id="array_empty"),
+            pytest.param(b'{"a": 1}', False, [{"a": 1}], id="single_value"),
+            pytest.param(b"", False, [], id="empty"),
+            pytest.param(b'{"a": 1}\n\n{"b": 2}\r\n3', True, [{"a": 1}, {"b": 2}, 3], id="lines"),
+            pytest.param(b"", True, [], id="lines_empty"),
+        ],
+    )
+    @pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+    def test_decode(self, document, lines, expected, chunk_size):
+        decoder = JSONItemsDecoder(lines=lines)
+
+        items = [
+            item for i in range(0, len(document), chunk_size) for item in decoder.feed(document[i : i + chunk_size])
+        ]
+
+        assert items + decoder.close() == expected
+
+    def test_decode_incremental(self):
+        decoder = JSONItemsDecoder()
+
+        assert decoder.feed(b'[{"a": 1}, 12') == [{"a": 1}]
+        assert decoder.feed(b"3") == []
+        assert decoder.feed(b', "b') == [123]
+        assert decoder.feed(b'"]') == ["b"]
+        assert decoder.close() == []
+
+    def test_decode_large_item(self):
+        item = {"a": ["x" * 1024] * 1024}
+        document = json.dumps([item, 1]).encode()
+        decoder = JSONItemsDecoder()
+
+        with patch(
+            "flama.http.data_structures.raw_decode_json", wraps=data_structures.raw_decode_json
+        ) as raw_decode_json:
+            items = [x for i in range(0, len(document), 1024) for x in decoder.feed(document[i : i + 1024])]
+            items += decoder.close()
+
+        assert items == [item, 1]
+        # The item spans about a thousand chunks but it is only decoded again each time the received data doubles.
+        assert raw_decode_json.call_count < 20
+
+    @pytest.mark.parametrize(
+        ["document", "exception"],
+        [
+            pytest.param(b"[1,]", ValueError("Expecting value (char 3)"), id="trailing_comma"),
+            pytest.param(b"[,1]", ValueError("Expecting value (char 1)"), id="leading_comma"),
+            pytest.param(b"[1 2]", ValueError("Expecting ',' delimiter (char 3)"), id="missing_comma"),
+            pytest.param(b"[1}", ValueError("Expecting ',' delimiter (char 2)"), id="wrong_bracket"),
+            pytest.param(b"[1] x", ValueError("Extra data (char 4)"), id="extra_data"),
+            pytest.param(b"[1, 2", ValueError("Unterminated JSON array (char 5)"), id="unterminated_array"),
+            pytest.param(b'["ab', ValueError("Unterminated string starting at (char 1)"), id="unterminated_string"),
+            pytest.param(b"[tru]", ValueError("Expecting value (char 1)"), id="wrong_literal"),
+            pytest.param('["é", x]'.encode(), ValueError("Expecting value (char 6)"), id="value_position_in_chars"),
+            pytest.param('["é" 1]'.encode(), ValueError("Expecting ',' delimiter (char 5)"), id="position_in_chars"),
+            pytest.param(b"{", ValueError("Expecting property name"), id="wrong_single_value"),
+        ],
+        indirect=["exception"],
+    )
+    @pytest.mark.parametrize("chunk_size", [1, 1024])
+    def test_decode_error(self, document, exception, chunk_size):
+        decoder = JSONItemsDecoder()
+
+        with exception:
+            for i in range(0, len(document), chunk_size):
+                decoder.feed(document[i : i + chunk_size])
+            decoder.close()
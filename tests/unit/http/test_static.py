@@ -0,0 +1,250 @@
+import gzip
+import os
+import threading
+from unittest.mock import call, patch
+
+import pytest
+
+from flama import exceptions, types
+from flama.applications import Flama
+from flama.client import Client
+from flama.http.static import StaticFiles
+
+
+class TestCaseStaticFiles:
+    @pytest.fixture(scope="function")
+    def clock(self):
+        with patch("flama.http.static.time.monotonic", return_value=1000.0) as clock:
+            yield clock
+
+    @pytest.fixture(scope="function")
+    def directory(self, tmp_path):
+        directory = tmp_path / "static"
+        directory.mkdir()
+        (directory / "app.js").write_text("console.log('foo');")
+        (directory / "app.js.gz").write_bytes(gzip.compress(b"console.log('foo');"))
+        (directory / "app.3f2a9c1d.css").write_text("body {}")
+        (directory / "large.txt").write_bytes(b"x" * 1024)
+        (directory / "docs").mkdir()
+        (directory / "docs" / "index.html").write_text("<html></html>")
+        (tmp_path / "secret.txt").write_text("secret")
+        return directory
+
+    @pytest.fixture(scope="function")
+    def static(self, directory, request):
+        return StaticFiles(directory, **getattr(request, "param", {"max_file_size": 512}))
+
+    @pytest.fixture(scope="function")
+    def app(self, static):
+        app = Flama(schema=None, docs=None)
+        app.mount("/static", static)
+        return app
+
+    @pytest.mark.parametrize(
+        ["path", "status_code", "content", "media_type", "cache_control"],
+        [
+            pytest.param("/static/app.js", 200, b"console.log('foo');", "text/javascript", "no-cache", id="file"),
+            pytest.param(
+                "/static/app.3f2a9c1d.css",
+                200,
+                b"body {}",
+                "text/css",
+                "public, max-age=31536000, immutable",
+                id="immutable",
+            ),
+            pytest.param("/static/large.txt", 200, b"x" * 1024, "text/plain", "no-cache", id="not_cached_content"),
+            pytest.param("/static/docs/", 200, b"<html></html>", "text/html", "no-cache", id="index"),
+            pytest.param("/static/missing.js", 404, None, None, None, id="not_found"),
+            pytest.param("/static/../secret.txt", 404, None, None, None, id="traversal"),
+            pytest.param("/static/%2e%2e/secret.txt", 404, None, None, None, id="traversal_encoded"),
+        ],
+    )
+    async def test_get(self, app, path, status_code, content, media_type, cache_control):
+        async with Client(app=app) as client:
+            response = await client.get(path)
+
+        assert response.status_code == status_code
+        if status_code == 200:
+            assert response.content == content
+            assert response.headers["content-type"].startswith(media_type)
+            assert response.headers["cache-control"] == cache_control
+            assert "etag" in response.headers
+            assert "last-modified" in response.headers
+
+    async def test_method_not_allowed(self, app):
+        async with Client(app=app) as client:
+            response = await client.post("/static/app.js")
+
+        assert response.status_code == 405
+
+    async def test_symlink_escape(self, app, directory, tmp_path):
+        os.symlink(tmp_path / "secret.txt", directory / "link.txt")
+
+        async with Client(app=app) as client:
+            response = await client.get("/static/link.txt")
+
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize(
+        ["accept_encoding", "content_encoding"],
+        [
+            pytest.param("gzip, deflate", "gzip", id="gzip"),
+            pytest.param("gzip;q=0, deflate", None, id="gzip_refused"),
+            pytest.param("br", None, id="no_variant"),
+            pytest.param("identity", None, id="identity"),
+        ],
+    )
+    async def test_precompressed(self, app, accept_encoding, content_encoding):
+        async with Client(app=app) as client:
+            response = await client.get("/static/app.js", headers={"accept-encoding": accept_encoding})
+
+        assert response.status_code == 200
+        assert response.content == b"console.log('foo');"
+        assert response.headers.get("content-encoding") == content_encoding
+        assert response.headers["vary"] == "Accept-Encoding"
+
+    async def test_precompressed_etag(self, app):
+        async with Client(app=app) as client:
+            identity = await client.get("/static/app.js", headers={"accept-encoding": "identity"})
+            encoded = await client.get("/static/app.js", headers={"accept-encoding": "gzip"})
+
+        assert identity.headers["etag"] != encoded.headers["etag"]
+
+    async def test_range(self, app):
+        async with Client(app=app) as client:
+            response = await client.get("/static/app.js", headers={"accept-encoding": "gzip", "range": "bytes=0-6"})
+
+        assert response.status_code == 206
+        assert response.content == b"console"
+        assert "content-encoding" not in response.headers
+
+    @pytest.mark.parametrize(
+        ["headers", "status_code"],
+        [
+            pytest.param(lambda r: {"if-none-match": r.headers["etag"]}, 304, id="if_none_match"),
+            pytest.param(lambda r: {"if-none-match": '"bar"'}, 200, id="if_none_match_changed"),
+            pytest.param(lambda r: {"if-modified-since": r.headers["last-modified"]}, 304, id="if_modified_since"),
+            pytest.param(
+                lambda r: {"if-modified-since": "Mon, 01 Jan 2001 00:00:00 GMT"}, 200, id="if_modified_since_changed"
+            ),
+            pytest.param(
+                lambda r: {"if-none-match": '"bar"', "if-modified-since": r.headers["last-modified"]},
+                200,
+                id="if_none_match_precedence",
+            ),
+            pytest.param(lambda r: {"if-modified-since": "foo"}, 200, id="if_modified_since_malformed"),
+        ],
+    )
+    async def test_conditional(self, app, headers, status_code):
+        async with Client(app=app) as client:
+            first = await client.get("/static/app.js")
+            response = await client.get("/static/app.js", headers=headers(first))
+
+        assert response.status_code == status_code
+        assert response.headers["etag"] == first.headers["etag"]
+        assert response.headers["cache-control"] == "no-cache"
+        if status_code == 304:
+            assert response.content == b""
+
+    async def test_cache(self, app, static, directory, clock):
+        async with Client(app=app) as client:
+            await client.get("/static/app.js", headers={"accept-encoding": "identity"})
+            (directory / "app.js").write_text("console.log('bar');")
+            os.utime(directory / "app.js", (0, 0))
+            cached = await client.get("/static/app.js", headers={"accept-encoding": "identity"})
+
+            clock.return_value += static.check_interval
+            changed = await client.get("/static/app.js", headers={"accept-encoding": "identity"})
+
+        assert cached.content == b"console.log('foo');"
+        assert changed.content == b"console.log('bar');"
+        assert len(static) == 1
+
+    async def test_cache_deleted(self, app, static, directory, clock):
+        async with Client(app=app) as client:
+            await client.get("/static/app.js")
+            (directory / "app.js").unlink()
+            clock.return_value += static.check_interval
+            response = await client.get("/static/app.js")
+
+        assert response.status_code == 404
+        assert len(static) == 0
+        assert static.memory == 0
+
+    @pytest.mark.parametrize(
+        ["static", "paths", "cached", "memory"],
+        [
+            pytest.param(
+                {"max_size": 2, "max_file_size": 512},
+                ["/app.js", "/docs/", "/app.3f2a9c1d.css"],
+                {"/docs/", "/app.3f2a9c1d.css"},
+                20,
+                id="max_size",
+            ),
+            pytest.param(
+                {"max_memory": 1024, "max_file_size": 1024},
+                ["/app.js", "/large.txt"],
+                {"/large.txt"},
+                1024,
+                id="max_memory",
+            ),
+            pytest.param(
+                {"max_file_size": 512},
+                ["/large.txt"],
+                {"/large.txt"},
+                0,
+                id="max_file_size",
+            ),
+        ],
+        indirect=["static"],
+    )
+    async def test_cache_limits(self, static, clock, paths, cached, memory):
+        for path in paths:
+            await static.lookup(path)
+
+        assert set(static._files) == cached
+        assert static.memory == memory
+
+    async def test_cache_hit_no_disk(self, static, clock):
+        await static.lookup("/app.js")
+
+        with patch("flama.http.static.os.stat", side_effect=AssertionError):
+            file = await static.lookup("/app.js")
+
+        assert file.identity.body == b"console.log('foo');"
+
+    async def test_lookup_io_executor(self, static):
+        threads = set()
+        load = static._load
+
+        def load_(*args):
+            threads.add(threading.current_thread().name)
+            return load(*args)
+
+        with patch.object(static, "_load", side_effect=load_):
+            file = await static.lookup("/app.js")
+
+        assert file.identity.body == b"console.log('foo');"
+        assert len(threads) == 1
+        assert threads.pop().startswith("flama-io")
+
+    async def test_websocket(self, static, asgi_receive, asgi_send):
+        await static(types.Scope({"type": "websocket", "path": "/app.js"}), asgi_receive, asgi_send)
+
+        assert asgi_send.call_args_list == [call({"type": "websocket.close", "code": 1000, "reason": ""})]
+
+    async def test_wrong_scope_type(self, static, asgi_receive, asgi_send):
+        with pytest.raises(ValueError, match="Wrong scope type"):
+            await static(types.Scope({"type": "lifespan"}), asgi_receive, asgi_send)
+
+    def test_clear(self, static):
+        static._store("/foo", static._load("/app.js", None))
+
+        static.clear()
+
+        assert len(static) == 0
+        assert static.memory == 0
+
+    def test_wrong_encoding(self, directory):
+        with pytest.raises(exceptions.ApplicationError, match="Unsupported static files encodings: deflate"):
+            StaticFiles(directory, encodings=("gzip", "deflate"))
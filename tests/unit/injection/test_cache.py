@@ -64,8 +64,31 @@ class TestCaseLRUCache:
         cache["c"] = 3
         assert len(cache) == 2
         assert "c" in cache
-        assert "a" in cache
-        assert "b" not in cache
+        assert "b" in cache
+        assert "a" not in cache
+
+    def test_eviction_least_recently_used(self):
+        cache = LRUCache[str, int](max_size=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert cache["a"] == 1
+        cache["c"] = 3
+        assert list(cache) == ["a", "c"]
+
+    def test_set_existing_key_at_max_size(self):
+        cache = LRUCache[str, int](max_size=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["a"] = 3
+        assert list(cache) == ["b", "a"]
+        assert cache["a"] == 3
+
+    def test_unbounded(self):
+        cache = LRUCache[int, int](max_size=None)
+        for i in range(1000):
+            cache[i] = i
+        assert len(cache) == 1000
+        assert cache[0] == 0
 
     def test_reset(self):
         cache = LRUCache[str, int]()
@@ -2,7 +2,7 @@ import typing as t
 
 import pytest
 
-from flama.injection.components import Component, Components
+from flama.injection.components import Component, Components, Lifetime
 from flama.injection.exceptions import ComponentNotFound
 from flama.injection.resolver import Parameter
 
@@ -77,6 +77,21 @@ class TestCaseComponent:
     def test_str(self, foo_component):
         assert str(foo_component) == "FooComponent"
 
+    @pytest.mark.parametrize(
+        ["attributes", "cacheable", "lifetime"],
+        (
+            pytest.param({}, True, Lifetime.REQUEST, id="default"),
+            pytest.param({"cacheable": False}, False, Lifetime.TRANSIENT, id="non_cacheable"),
+            pytest.param({"lifetime": Lifetime.SINGLETON}, True, Lifetime.SINGLETON, id="singleton"),
+            pytest.param({"lifetime": Lifetime.TRANSIENT}, False, Lifetime.TRANSIENT, id="transient"),
+        ),
+    )
+    def test_lifetime(self, attributes, cacheable, lifetime):
+        component_cls = type("LifetimeComponent", (Component,), {"resolve": lambda self: None, **attributes})
+
+        assert component_cls.cacheable is cacheable
+        assert component_cls.lifetime is lifetime
+
 
 class TestCaseComponents:
     @pytest.fixture(scope="function")
@@ -1,14 +1,15 @@
 import functools
+import gc
 from unittest.mock import MagicMock, call, patch
 
 import pytest
 
-from flama.injection.components import Component, Components
+from flama.injection.components import Component, Components, Lifetime
 from flama.injection.context import Context as BaseContext
 from flama.injection.context import Field
 from flama.injection.exceptions import ComponentError, ComponentNotFound
 from flama.injection.injector import Injector
-from flama.injection.resolver import Parameter, ResolutionTree, Resolver
+from flama.injection.resolver import ExecutionPlan, Parameter, ResolutionTree, Resolver
 
 
 class Foo(str): ...
@@ -127,10 +128,9 @@ class TestCaseInjector:
         }
 
         # Regression: class-based endpoints (HTTP, WebSocket, JSON-RPC) dispatch through ``getattr(self, handler)``,
-        # which builds a fresh, short-lived bound method on every access. Caching by ``id(bound method)`` is unsafe
-        # (a collected bound method's address can be recycled by an unrelated handler, leaking the wrong kwargs), so
-        # the cache keys on the underlying function: distinct bound methods of one handler share a single entry, and
-        # different handlers never contaminate each other.
+        # which builds a fresh, short-lived bound method on every access, so the cache keys on the underlying function:
+        # distinct bound methods of one handler share a single entry, and different handlers never contaminate each
+        # other.
         injector = Injector(XContext, Components([LiteralFooComponent(), LiteralBarComponent()]))
         obj = Handlers()
         bound_first, bound_second = obj.handler_a, obj.handler_a
@@ -142,6 +142,141 @@ class TestCaseInjector:
         assert set(injector.resolve_function(obj.handler_b)) == {"foo", "bar"}
         assert len(injector._function_cache) == 2
 
+    def test_resolve_plan(self):
+        injector = Injector(XContext, Components([LiteralFooComponent(), LiteralBarComponent()]))
+        obj = Handlers()
+
+        plan = injector.resolve_plan(obj.handler_b)
+
+        assert isinstance(plan, ExecutionPlan)
+        assert plan.outputs == (("foo", 0), ("bar", 1))
+        assert injector.resolve_plan(obj.handler_b) is plan
+        assert len(injector._plan_cache) == 1
+
+        injector.cache["foo"] = "bar"
+        del injector.resolver
+        assert len(injector._plan_cache) == 0
+        assert len(injector.cache) == 0
+        assert injector.resolve_plan(obj.handler_b) is not plan
+
+    async def test_resolve_plan_unbounded(self):
+        def build_handler():
+            def handler(foo: Foo):
+                return foo
+
+            return handler
+
+        injector = Injector(XContext, Components([LiteralFooComponent()]))
+        handlers = [build_handler() for _ in range(1000)]
+
+        await injector.warm_up(*handlers)
+
+        assert len(injector._function_cache) == 1000
+        assert len(injector._plan_cache) == 1000
+
+    async def test_resolve_plan_weak(self):
+        def build_handler():
+            def handler(foo: Foo):
+                return foo
+
+            return handler
+
+        injector = Injector(XContext, Components([LiteralFooComponent()]))
+        handlers = [build_handler() for _ in range(10)]
+
+        await injector.warm_up(*handlers)
+        del handlers
+        gc.collect()
+
+        assert len(injector._function_cache) == 0
+        assert len(injector._plan_cache) == 0
+
+    def test_resolve_plan_not_weak_referenceable(self):
+        class Handler:
+            __slots__ = ()
+
+            def __call__(self, foo: Foo):
+                return foo
+
+        injector = Injector(XContext, Components([LiteralFooComponent()]))
+
+        plan = injector.resolve_plan(Handler())
+
+        assert plan.outputs == (("foo", 0),)
+        assert len(injector._plan_cache) == 0
+
+    async def test_warm_up(self):
+        injector = Injector(XContext, Components([LiteralFooComponent(), LiteralBarComponent()]))
+        obj = Handlers()
+
+        await injector.warm_up(obj.handler_a, obj.handler_b)
+
+        assert len(injector._plan_cache) == 2
+        assert injector.resolve_plan(obj.handler_a).outputs == (("foo", 0),)
+
+    async def test_warm_up_error(self):
+        injector = Injector(XContext, Components([LiteralFooComponent()]))
+
+        with pytest.raises(ComponentNotFound, match="No component able to handle parameter 'bar' for function"):
+            await injector.warm_up(function)
+
+    async def test_warm_up_lifetime(self):
+        resolve = MagicMock(side_effect=lambda: Foo("foo"))
+
+        class SingletonFooComponent(Component):
+            lifetime = Lifetime.SINGLETON
+
+            def resolve(self) -> Foo:
+                return resolve()
+
+        class AppComponent(Component):
+            lifetime = Lifetime.APP
+
+            def resolve(self, foo: Foo, x: CustomStr) -> Bar:
+                return Bar(foo + x)
+
+        component = SingletonFooComponent()
+        injector = Injector(XContext, Components([component, AppComponent()]))
+
+        await injector.warm_up(function)
+
+        # The singleton is resolved upfront, but the app scoped value depends on the context so it is not.
+        assert resolve.call_args_list == [call()]
+        assert dict(injector.cache) == {component: Foo("foo")}
+        assert (await injector.inject(function, XContext(x=CustomStr("x"))))() == ("foo", "foox")
+        assert resolve.call_args_list == [call()]
+
+    async def test_cache_unbounded(self):
+        class AppComponent(Component):
+            lifetime = Lifetime.APP
+
+            def can_handle_parameter(self, parameter: Parameter) -> bool:
+                return parameter.annotation is Foo
+
+            def resolve(self, parameter: Parameter) -> Foo:
+                return Foo(parameter.name)
+
+        injector = Injector(XContext, Components([AppComponent()]))
+
+        for i in range(1000):
+            await injector.value(Foo, XContext(x=CustomStr("x")), name=f"foo_{i}")
+
+        assert len(injector.cache) == 1000
+
+    @pytest.mark.parametrize(["concurrent", "staged"], [(False, False), (True, True)])
+    def test_resolve_plan_concurrent(self, concurrent, staged):
+        class AsyncFooComponent(Component):
+            async def resolve(self) -> Foo:
+                return Foo("foo")
+
+        class AsyncBarComponent(Component):
+            async def resolve(self) -> Bar:
+                return Bar("bar")
+
+        injector = Injector(XContext, Components([AsyncFooComponent(), AsyncBarComponent()]), concurrent=concurrent)
+
+        assert (injector.resolve_plan(function).stages is not None) is staged
+
     @pytest.mark.parametrize(
         ["annotation", "context", "components", "result", "exception"],
         (
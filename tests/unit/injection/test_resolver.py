@@ -1,11 +1,11 @@
+import asyncio
 import inspect
 import uuid
 from unittest.mock import MagicMock, call
 
 import pytest
 
-from flama.injection.cache import LRUCache
-from flama.injection.components import Component, Components
+from flama.injection.components import Component, Components, Lifetime
 from flama.injection.context import Context as BaseContext
 from flama.injection.context import Field
 from flama.injection.exceptions import ComponentNotFound, InjectionError
@@ -16,6 +16,7 @@ from flama.injection.resolver import (
     ContextNode,
     ContextStep,
     Empty,
+    ExecutionPlan,
     Parameter,
     ParameterNode,
     ParameterStep,
@@ -238,14 +239,20 @@ class TestCaseResolutionTree:
                 [],
                 id="context_custom_type",
             ),
+            pytest.param(
+                Parameter("foo", Cacheable, Empty),
+                [(Context(), Cacheable(str(uuid.UUID(int=0))))] * 2,
+                [call()],
+                id="cacheable_component_same_context",
+            ),
             pytest.param(
                 Parameter("foo", Cacheable, Empty),
                 [
                     (Context(), Cacheable(str(uuid.UUID(int=0)))),
                     (Context(), Cacheable(str(uuid.UUID(int=0)))),
                 ],
-                [call()],
-                id="cacheable_component",
+                [call(), call()],
+                id="cacheable_component_different_context",
             ),
             pytest.param(
                 Parameter("foo", NonCacheable, Empty),
@@ -377,51 +384,7 @@ class TestCaseReturn:
         assert ret.annotation is Empty
 
 
-class TestCaseNodeValue:
-    """Tests for the recursive ResolutionNode.value() methods (public API)."""
-
-    @pytest.fixture(scope="function")
-    def context(self):
-        return Context(x=42, data={"bar": 7})
-
-    async def test_context_node_value(self, context):
-        node = ContextNode(name="x", parameter=Parameter("x", int), nodes=[])
-        assert await node.value(context) == 42
-
-    async def test_parameter_node_value(self, context):
-        param = Parameter("bar", Bar)
-        node = ParameterNode(name="parameter", parameter=param, nodes=[])
-        assert await node.value(context) is param
-
-    async def test_component_node_value(self, context):
-        node = ComponentNode(
-            name="foo",
-            parameter=Parameter("foo", Foo),
-            nodes=[ContextNode(name="x", parameter=Parameter("x", int), nodes=[])],
-            component=foo_component,
-        )
-        assert await node.value(context) == Foo(42)
-
-    async def test_component_node_value_with_cache(self, context):
-        cache = InjectionCache()
-        node = ComponentNode(
-            name="foo",
-            parameter=Parameter("foo", Foo),
-            nodes=[ContextNode(name="x", parameter=Parameter("x", int), nodes=[])],
-            component=foo_component,
-        )
-        first = await node.value(context, cache=cache)
-        second = await node.value(context, cache=cache)
-        assert first == second == Foo(42)
-
-
 class TestCaseStep:
-    """Tests for Step.build() and polymorphic execute()."""
-
-    @pytest.fixture(scope="function")
-    def context(self):
-        return Context(x=42, data={"bar": 7})
-
     def test_build_context_step(self):
         node = ContextNode(name="x", parameter=Parameter("x", int), nodes=[])
         steps = Step.build(node, [])
@@ -450,50 +413,232 @@ class TestCaseStep:
         assert isinstance(steps[1], ComponentStep)
         assert steps[1].deps == (("x", 0),)
         assert steps[1].component is foo_component
+        assert steps[1].call == foo_component.resolve
+        assert steps[1].is_async is False
+        assert steps[1].parallel is False
 
-    async def test_execute_context_step(self, context):
-        step = ContextStep(context_key="x")
-        assert await step.execute([], context, None) == 42
 
-    async def test_execute_parameter_step(self, context):
-        param = Parameter("bar", Bar)
-        step = ParameterStep(parameter=param)
-        assert await step.execute([], context, None) is param
+class TestCaseExecutionPlan:
+    @pytest.fixture(scope="function")
+    def uuid_mock(self):
+        return MagicMock(uuid4=MagicMock(side_effect=[uuid.UUID(int=i) for i in range(10)]))
 
-    async def test_execute_component_step(self, context):
-        node = ComponentNode(
-            name="foo",
-            parameter=Parameter("foo", Foo),
-            nodes=[ContextNode(name="x", parameter=Parameter("x", int), nodes=[])],
-            component=foo_component,
+    @pytest.fixture(scope="function")
+    def resolver(self, uuid_mock):
+        return Resolver(
+            Context,
+            Components([foo_component, bar_component, CacheableComponent(uuid_mock), NonCacheableComponent(uuid_mock)]),
         )
-        steps = Step.build(node, [])
-        results = []
-        for step in steps:
-            results.append(await step.execute(results, context, None))
-        assert results[-1] == Foo(42)
 
-    async def test_execute_component_step_with_cache(self, context):
-        cache = LRUCache()
-        node = ComponentNode(
-            name="foo",
-            parameter=Parameter("foo", Foo),
-            nodes=[ContextNode(name="x", parameter=Parameter("x", int), nodes=[])],
-            component=foo_component,
+    @pytest.fixture(scope="function")
+    def context(self):
+        return Context(x=42, data={"bar": 7, "baz": 8})
+
+    def test_build(self, resolver):
+        plan = ExecutionPlan.build(
+            {
+                "foo": resolver.resolve(Parameter("foo", Foo)),
+                "other_foo": resolver.resolve(Parameter("foo", Foo)),
+                "bar": resolver.resolve(Parameter("bar", Bar)),
+                "baz": resolver.resolve(Parameter("baz", Bar)),
+            }
         )
-        steps = Step.build(node, [])
 
-        results = []
-        for step in steps:
-            results.append(await step.execute(results, context, cache))
-        first = results[-1]
+        assert [type(x) for x in plan.steps] == [
+            ContextStep,
+            ComponentStep,
+            ParameterStep,
+            ContextStep,
+            ComponentStep,
+            ParameterStep,
+            ComponentStep,
+        ]
+        assert [x.deps for x in plan.steps if isinstance(x, ComponentStep)] == [
+            (("x", 0),),
+            (("parameter", 2), ("data", 3)),
+            (("parameter", 5), ("data", 3)),
+        ]
+        assert plan.outputs == (("foo", 1), ("other_foo", 1), ("bar", 4), ("baz", 6))
+
+    def test_build_non_cacheable(self, resolver):
+        plan = ExecutionPlan.build(
+            {
+                "first": resolver.resolve(Parameter("first", NonCacheable)),
+                "second": resolver.resolve(Parameter("second", NonCacheable)),
+            }
+        )
+
+        assert plan.outputs == (("first", 0), ("second", 1))
+
+    async def test_value(self, resolver, context, uuid_mock):
+        plan = ExecutionPlan.build(
+            {
+                "foo": resolver.resolve(Parameter("foo", Foo)),
+                "bar": resolver.resolve(Parameter("bar", Bar)),
+                "cacheable": resolver.resolve(Parameter("cacheable", Cacheable)),
+                "other_cacheable": resolver.resolve(Parameter("cacheable", Cacheable)),
+                "non_cacheable": resolver.resolve(Parameter("non_cacheable", NonCacheable)),
+            }
+        )
+
+        assert await plan.value(context) == {
+            "foo": Foo(42),
+            "bar": Bar(7),
+            "cacheable": Cacheable(int=0),
+            "other_cacheable": Cacheable(int=0),
+            "non_cacheable": NonCacheable(int=1),
+        }
+        assert uuid_mock.uuid4.call_count == 2
+
+    async def test_value_with_cache(self, resolver, context, uuid_mock):
+        cache = InjectionCache()
+        plan = ExecutionPlan.build(
+            {
+                "cacheable": resolver.resolve(Parameter("cacheable", Cacheable)),
+                "non_cacheable": resolver.resolve(Parameter("non_cacheable", NonCacheable)),
+            }
+        )
+
+        first = await plan.value(context, cache=cache)
+        second = await plan.value(context, cache=cache)
+
+        assert first["cacheable"] == second["cacheable"] == Cacheable(int=0)
+        assert first["non_cacheable"] == NonCacheable(int=1)
+        assert second["non_cacheable"] == NonCacheable(int=2)
+
+    async def test_value_async_component(self, context):
+        class AsyncFooComponent(Component):
+            async def resolve(self, x: int) -> Foo:
+                return Foo(x + 1)
+
+        plan = ExecutionPlan.build(
+            {"foo": Resolver(Context, Components([AsyncFooComponent()])).resolve(Parameter("foo", Foo))}
+        )
+
+        assert await plan.value(context) == {"foo": Foo(43)}
+
+    async def test_value_custom_call(self, context):
+        class CustomCallComponent(FooComponent):
+            async def __call__(self, *args, **kwargs):
+                return Foo(await super().__call__(*args, **kwargs) * 2)
+
+        plan = ExecutionPlan.build(
+            {"foo": Resolver(Context, Components([CustomCallComponent()])).resolve(Parameter("foo", Foo))}
+        )
+
+        assert await plan.value(context) == {"foo": Foo(84)}
+
+    @pytest.mark.parametrize(
+        ["lifetime", "values"],
+        [
+            pytest.param(Lifetime.SINGLETON, [0, 0, 0, 0, 0, 0], id="singleton"),
+            pytest.param(Lifetime.APP, [0, 0, 0, 0, 0, 0], id="app"),
+            pytest.param(Lifetime.REQUEST, [0, 0, 1, 1, 1, 1], id="request"),
+            pytest.param(Lifetime.TRANSIENT, [0, 1, 2, 3, 4, 5], id="transient"),
+        ],
+    )
+    async def test_value_lifetime(self, uuid_mock, lifetime, values):
+        class LifetimeComponent(Component):
+            def resolve(self) -> Cacheable:
+                return Cacheable(int=uuid_mock.uuid4().int)
+
+        LifetimeComponent.lifetime = lifetime
+        resolver = Resolver(Context, Components([LifetimeComponent()]))
+        cache = InjectionCache()
+        plan = ExecutionPlan.build(
+            {
+                "first": resolver.resolve(Parameter("first", Cacheable)),
+                "second": resolver.resolve(Parameter("second", Cacheable)),
+            }
+        )
+        context = Context()
+
+        result = []
+        for x in (Context(), context, context):
+            result += (await plan.value(x, cache=cache)).values()
+
+        assert result == [Cacheable(int=x) for x in values]
+
+
+class TestCaseExecutionPlanConcurrent:
+    @pytest.fixture(scope="function")
+    def events(self):
+        return {"foo": asyncio.Event(), "bar": asyncio.Event(), "cancelled": asyncio.Event()}
+
+    @pytest.fixture(scope="function")
+    def resolver(self, events):
+        class FooAsyncComponent(Component):
+            concurrent = True
+
+            async def resolve(self) -> Foo:
+                events["foo"].set()
+                try:
+                    await events["bar"].wait()
+                except asyncio.CancelledError:
+                    events["cancelled"].set()
+                    raise
+                return Foo(1)
+
+        class BarAsyncComponent(Component):
+            concurrent = True
+
+            async def resolve(self) -> Bar:
+                events["bar"].set()
+                await events["foo"].wait()
+                return Bar(2)
+
+        class WrongAsyncComponent(Component):
+            async def resolve(self) -> Wrong:
+                raise ValueError("Wrong")
+
+        return Resolver(Context, Components([FooAsyncComponent(), BarAsyncComponent(), WrongAsyncComponent()]))
+
+    @pytest.mark.parametrize(
+        ["parameters", "concurrent", "staged"],
+        [
+            pytest.param(["foo", "bar"], False, True, id="concurrent_components"),
+            pytest.param(["foo"], False, False, id="single_component"),
+            pytest.param(["foo", "wrong"], False, False, id="non_concurrent_component"),
+            pytest.param(["foo", "wrong"], True, True, id="concurrent_plan"),
+        ],
+    )
+    def test_build(self, resolver, parameters, concurrent, staged):
+        types = {"foo": Foo, "bar": Bar, "wrong": Wrong}
+        plan = ExecutionPlan.build(
+            {x: resolver.resolve(Parameter(x, types[x])) for x in parameters}, concurrent=concurrent
+        )
+
+        assert (plan.stages is not None) is staged
+
+    async def test_value(self, resolver):
+        cache = InjectionCache()
+        plan = ExecutionPlan.build(
+            {
+                "foo": resolver.resolve(Parameter("foo", Foo)),
+                "bar": resolver.resolve(Parameter("bar", Bar)),
+                "x": resolver.resolve(Parameter("x", int)),
+            }
+        )
+        context = Context(x=42)
+
+        assert await asyncio.wait_for(plan.value(context, cache=cache), timeout=1) == {
+            "foo": Foo(1),
+            "bar": Bar(2),
+            "x": 42,
+        }
+        assert len(context._cache) == 2
+        assert await plan.value(context, cache=cache) == {"foo": Foo(1), "bar": Bar(2), "x": 42}
+
+    async def test_value_error(self, resolver, events):
+        plan = ExecutionPlan.build(
+            {"foo": resolver.resolve(Parameter("foo", Foo)), "wrong": resolver.resolve(Parameter("wrong", Wrong))},
+            concurrent=True,
+        )
 
-        results = []
-        for step in steps:
-            results.append(await step.execute(results, context, cache))
-        second = results[-1]
+        with pytest.raises(ValueError, match="Wrong"):
+            await asyncio.wait_for(plan.value(Context()), timeout=1)
 
-        assert first == second == Foo(42)
+        await asyncio.wait_for(events["cancelled"].wait(), timeout=1)
 
 
 class TestCaseResolutionTreeBuildNode:
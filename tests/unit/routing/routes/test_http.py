@@ -43,7 +43,7 @@ class TestCaseBaseHTTPEndpointWrapper:
         ],
     )
     def test_build_api_response(self, endpoint, response, result):
-        assert endpoint._build_api_response(response) == result
+        assert endpoint._build_api_response(response, MagicMock(output_validation=None)) == result
 
 
 class TestCaseHTTPFunctionWrapper:
@@ -48,6 +48,17 @@ class TestCaseMount:
 
         assert handle.call_args_list == expected_calls
 
+    async def test_call_built_scope(self, mount, asgi_scope, asgi_receive, asgi_send):
+        asgi_scope["path"] = "/foo/1/bar"
+        scope = types.Scope({**asgi_scope, **mount.route_scope(asgi_scope)})
+        handle = AsyncMock()
+
+        with patch.object(mount, "handle", new=handle):
+            await mount(scope, asgi_receive, asgi_send)
+
+        assert handle.call_args_list == [call(scope, asgi_receive, asgi_send)]
+        assert scope["path"] == "/bar"
+
     def test_eq(self, app):
         assert Mount("/", app, name="app_mock") == Mount("/", app, name="app_mock")
         assert Mount("/", app, name="app_mock") != Mount("/", app, name="bar")
@@ -116,6 +127,7 @@ class TestCaseMount:
             "app": app if used else asgi_scope["app"],
             "path": "/bar",
             "root_path": "" if used else "/foo/1/",
+            "mount": mount,
         }
 
     @pytest.mark.parametrize(
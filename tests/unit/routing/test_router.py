@@ -10,6 +10,7 @@ from flama.endpoints import HTTPEndpoint, WebSocketEndpoint
 from flama.injection import Component, Components
 from flama.lifespan import Lifespan
 from flama.routing.router import Router
+from flama.routing.routes._base import ResolvedRoute
 from flama.routing.routes.http import Route
 from flama.routing.routes.mount import Mount
 from flama.routing.routes.websocket import WebSocketRoute
@@ -126,6 +127,20 @@ class TestCaseRouter:
     def test_init(self, app_mock):
         Router([], app=app_mock)
 
+    @pytest.mark.parametrize(
+        ["route_cache_size", "call_kwargs"],
+        [
+            pytest.param(None, {}, id="default"),
+            pytest.param(1024, {"cache_size": 1024}, id="size"),
+            pytest.param(0, {"cache_size": 0}, id="disabled"),
+        ],
+    )
+    def test_init_route_cache_size(self, app_mock, route_cache_size, call_kwargs):
+        with patch("flama.routing.router.RouteTable") as route_table_mock:
+            Router([], app=app_mock, route_cache_size=route_cache_size)
+
+        assert route_table_mock.call_args_list == [call(**call_kwargs)]
+
     def test_eq(self, app_mock):
         route = MagicMock(Route)
         assert Router(routes=[route], app=app_mock) == Router(routes=[route], app=app_mock)
@@ -147,6 +162,22 @@ class TestCaseRouter:
 
         assert route.call_args_list == [call(route_scope, asgi_receive, asgi_send)]
 
+    async def test_call_mount(self, app):
+        scopes = []
+
+        async def plain_asgi_app(scope, receive, send):
+            scopes.append(scope)
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        app.mount("/mounted", app=plain_asgi_app)
+
+        async with Client(app=app) as client:
+            response = await client.get("/mounted/foo/bar")
+
+        assert response.status_code == 200
+        assert [(x["root_path"], x["path"]) for x in scopes] == [("/mounted", "/foo/bar")]
+
     async def test_call_lifespan(self, router, asgi_scope, asgi_receive, asgi_send):
         asgi_scope["type"] = "lifespan"
 
@@ -473,6 +504,245 @@ class TestCaseRouter:
         assert route.app is plain_asgi_app
         assert route_scope["path"] == "/sub"
 
+    def test_resolve_route_stores_resolution(self, app, asgi_scope):
+        async def foo(): ...
+
+        route = app.add_route("/foo/{id:int}/", foo)
+
+        asgi_scope["path"] = "/foo/1/"
+
+        resolved_route, route_scope = app.router.resolve_route(scope=asgi_scope)
+
+        resolved = asgi_scope["resolved_route"]
+        assert isinstance(resolved, ResolvedRoute)
+        assert resolved.router is app.router
+        assert resolved.route is route is resolved_route
+        assert resolved.scope is route_scope
+        assert resolved.path_params == {"id": 1}
+        assert resolved.mounts == ()
+        assert route_scope["resolved_route"] is resolved
+
+    def test_resolve_route_reuses_resolution(self, app, asgi_scope):
+        async def foo(): ...
+
+        app.add_route("/foo/", foo)
+
+        asgi_scope["path"] = "/foo/"
+
+        with patch.object(app.router, "_route_table", wraps=app.router._route_table) as route_table:
+            first = app.router.resolve_route(scope=asgi_scope)
+            second = app.router.resolve_route(scope=asgi_scope)
+            third = app.router.resolve_route(scope=first[1])
+
+        assert first == second == third
+        assert route_table.resolve.call_count == 1
+
+    def test_resolve_route_resolution_invalidated_by_scope(self, app, asgi_scope):
+        async def foo(): ...
+
+        async def bar(): ...
+
+        app.add_route("/foo/", foo)
+        app.add_route("/bar/", bar)
+
+        asgi_scope["path"] = "/foo/"
+        foo_route, _ = app.router.resolve_route(scope=asgi_scope)
+
+        asgi_scope["path"] = "/bar/"
+        bar_route, _ = app.router.resolve_route(scope=asgi_scope)
+
+        assert foo_route.endpoint == foo
+        assert bar_route.endpoint == bar
+
+    def test_resolve_route_nested_app_resolution(self, app, asgi_scope):
+        async def foo(): ...
+
+        nested = Flama(schema=None, docs=None)
+        route = nested.add_route("/foo/{id:int}/", foo)
+        mount = app.mount("/nested", app=nested)
+
+        asgi_scope["path"] = "/nested/foo/1/"
+
+        _, route_scope = app.router.resolve_route(scope=asgi_scope)
+
+        resolved = asgi_scope["resolved_route"]
+        assert resolved.router is app.router
+        assert resolved.route is route
+        assert resolved.mounts == (mount,)
+        assert resolved.path_params == {"id": 1}
+        assert resolved.matched == "/nested"
+        assert resolved.unmatched == "/foo/1/"
+
+        nested_resolved = route_scope["resolved_route"]
+        assert nested_resolved.router is nested.router
+        assert nested_resolved.route is route
+
+        with patch.object(nested.router, "_route_table") as route_table:
+            assert nested.router.resolve_route(scope=route_scope) == (route, route_scope)
+
+        assert route_table.resolve.call_count == 0
+
+    async def test_request_resolves_route_once(self, app):
+        def foo(id: int):
+            return {"id": id}
+
+        app.add_route("/foo/{id:int}/", foo, ["GET"])
+
+        with patch.object(app.router, "_route_table", wraps=app.router._route_table) as route_table:
+            async with Client(app=app) as client:
+                response = await client.get("/foo/1/")
+
+        assert response.status_code == 200
+        assert response.json() == {"id": 1}
+        assert route_table.resolve.call_count == 1
+
+    @pytest.fixture(scope="function")
+    def nested_apps(self):
+        def build(compiled_mounts: bool) -> Flama:
+            async def root(): ...
+
+            async def foo(id: int): ...
+
+            async def bar(): ...
+
+            async def sub_app(scope, receive, send): ...
+
+            leaf = Flama(routes=[Route("/bar/", bar)], schema=None, docs=None)
+            nested = Flama(
+                routes=[
+                    Route("/", root),
+                    Route("/foo/{id:int}/", foo, methods=["POST"]),
+                    Mount("/leaf/{x:str}", app=leaf),
+                    Mount("/asgi", app=sub_app),
+                ],
+                schema=None,
+                docs=None,
+            )
+            app = Flama(
+                routes=[Route("/", root), Mount("/nested", app=nested)],
+                schema=None,
+                docs=None,
+                compiled_mounts=compiled_mounts,
+            )
+            for x in (app, nested, leaf):
+                x.status = types.AppStatus.READY
+
+            return app
+
+        return build
+
+    @pytest.mark.parametrize(
+        ["path", "method", "exception"],
+        [
+            pytest.param("/", "GET", None, id="root"),
+            pytest.param("/nested", "GET", None, id="nested_root_no_slash"),
+            pytest.param("/nested/", "GET", None, id="nested_root"),
+            pytest.param("/nested/foo/1/", "POST", None, id="nested_route"),
+            pytest.param("/nested/leaf/x/bar/", "GET", None, id="deep_route"),
+            pytest.param("/nested/asgi/sub", "GET", None, id="nested_asgi"),
+            pytest.param("/nested/foo/1/", "GET", exceptions.MethodNotAllowedException, id="method_not_allowed"),
+            pytest.param("/nested/wrong/", "GET", exceptions.NotFoundException, id="not_found"),
+        ],
+        indirect=["exception"],
+    )
+    def test_resolve_route_compiled_mounts(self, nested_apps, path, method, asgi_scope, exception):
+        compiled_app, app = nested_apps(compiled_mounts=True), nested_apps(compiled_mounts=False)
+
+        with exception:
+            expected = app.router.resolve(types.Scope({**asgi_scope, "app": app, "path": path, "method": method}))
+            resolved = compiled_app.router.resolve(
+                types.Scope({**asgi_scope, "app": compiled_app, "path": path, "method": method})
+            )
+
+            assert resolved.router is compiled_app.router
+            assert resolved.route.path == expected.route.path
+            assert resolved.path_params == expected.path_params
+            assert [m.path for m in resolved.mounts] == [m.path for m in expected.mounts]
+            assert resolved.scope["path"] == expected.scope["path"]
+            assert resolved.scope["root_path"] == expected.scope["root_path"]
+            assert [r.path for r in resolved.scope["app"].routes] == [r.path for r in expected.scope["app"].routes]
+
+    def test_resolve_route_compiled_mounts_single_match(self, nested_apps, asgi_scope):
+        app = nested_apps(compiled_mounts=True)
+        nested = app.routes[1].app
+        leaf = nested.routes[2].app
+
+        asgi_scope["path"] = "/nested/leaf/x/bar/"
+
+        with (
+            patch.object(app.router, "_route_table") as route_table,
+            patch.object(nested.router, "_route_table") as nested_route_table,
+            patch.object(leaf.router, "_route_table") as leaf_route_table,
+        ):
+            route, route_scope = app.router.resolve_route(scope=asgi_scope)
+
+        assert route is leaf.routes[0]
+        assert route_scope["app"] is leaf
+        assert route_table.resolve.call_count == nested_route_table.resolve.call_count == 0
+        assert leaf_route_table.resolve.call_count == 0
+
+        nested_resolved = route_scope["resolved_route"]
+        assert nested_resolved.router is leaf.router
+        assert leaf.router.resolve_route(scope=route_scope) == (route, route_scope)
+
+    def test_resolve_route_compiled_mounts_not_ready(self, nested_apps, asgi_scope):
+        app = nested_apps(compiled_mounts=True)
+        app.status = types.AppStatus.STARTING
+
+        asgi_scope["path"] = "/nested/"
+
+        with patch.object(app.router, "_route_table", wraps=app.router._route_table) as route_table:
+            route, _ = app.router.resolve_route(scope=asgi_scope)
+
+        assert route is app.routes[1].app.routes[0]
+        assert route_table.resolve.call_count == 1
+        assert app.router._compiled is None
+
+    def test_resolve_route_compiled_mounts_invalidated(self, nested_apps, asgi_scope):
+        async def baz(): ...
+
+        app = nested_apps(compiled_mounts=True)
+        nested = app.routes[1].app
+
+        asgi_scope["path"] = "/nested/baz/"
+
+        with pytest.raises(exceptions.NotFoundException):
+            app.router.resolve_route(scope=types.Scope({**asgi_scope}))
+
+        route = nested.add_route("/baz/", baz)
+
+        assert app.router.resolve_route(scope=types.Scope({**asgi_scope}))[0] is route
+
+    def test_resolve_route_compiled_mounts_repeated_parameters(self, asgi_scope):
+        async def foo(id: int): ...
+
+        nested = Flama(routes=[Route("/foo/{id:int}/", foo)], schema=None, docs=None)
+        mount = Mount("/{id:int}", app=nested)
+        app = Flama(routes=[mount], schema=None, docs=None, compiled_mounts=True)
+        app.status = nested.status = types.AppStatus.READY
+
+        asgi_scope["path"] = "/1/foo/2/"
+
+        resolved = app.router.resolve(asgi_scope)
+
+        assert resolved.route is nested.routes[0]
+        assert resolved.path_params == {"id": 2}
+        assert resolved.mounts == (mount,)
+
+    async def test_request_compiled_mounts(self):
+        def foo(id: int):
+            return {"id": id}
+
+        nested = Flama(routes=[Route("/foo/{id:int}/", foo, methods=["GET"])], schema=None, docs=None)
+        app = Flama(routes=[Mount("/nested", app=nested)], schema=None, docs=None, compiled_mounts=True)
+
+        async with Client(app=app) as client:
+            response = await client.get("/nested/foo/1/")
+
+        assert response.status_code == 200
+        assert response.json() == {"id": 1}
+        assert app.router._compiled is not None
+
     @pytest.mark.parametrize(
         ["routes", "result", "exception"],
         (
@@ -513,6 +783,71 @@ class TestCaseRouter:
         with exception:
             assert router.resolve_url("foo") == result
 
+    @pytest.mark.parametrize(
+        ["name", "params", "result", "exception"],
+        (
+            pytest.param("foo", {}, url.URL(path="/foo/", scheme="http"), None, id="route"),
+            pytest.param("item", {"id": 1}, url.URL(path="/item/1/", scheme="http"), None, id="route_params"),
+            pytest.param("item", {}, None, exceptions.NotFoundException, id="route_missing_params"),
+            pytest.param("item", {"id": 1, "x": 2}, None, exceptions.NotFoundException, id="route_unused_params"),
+            pytest.param("nested", {"tenant": "a"}, url.URL(path="/a/nested", scheme="http"), None, id="mount"),
+            pytest.param(
+                "nested",
+                {"tenant": "a", "x": 2},
+                url.URL(path="/a/nested", scheme="http"),
+                None,
+                id="mount_unused_params",
+            ),
+            pytest.param(
+                "nested:bar",
+                {"tenant": "a", "id": 1},
+                url.URL(path="/a/nested/bar/1/", scheme="http"),
+                None,
+                id="nested",
+            ),
+            pytest.param("nested:bar", {"tenant": "a"}, None, exceptions.NotFoundException, id="nested_missing"),
+            pytest.param(
+                "nested:inner:baz",
+                {"tenant": "a"},
+                url.URL(path="/a/nested/inner/baz/", scheme="http"),
+                None,
+                id="deep",
+            ),
+            pytest.param("nested:unknown", {"tenant": "a"}, None, exceptions.NotFoundException, id="not_found"),
+        ),
+        indirect=["exception"],
+    )
+    def test_resolve_url_index(self, app, name, params, result, exception):
+        inner = Flama(schema=None, docs=None)
+        inner.add_route("/baz/", lambda: None, name="baz")
+        nested = Flama(schema=None, docs=None)
+        nested.add_route("/bar/{id:int}/", lambda id: None, name="bar")
+        nested.mount("/inner", inner, name="inner")
+        app.add_route("/foo/", lambda: None, name="foo")
+        app.add_route("/item/{id:int}/", lambda id: None, name="item")
+        app.mount("/{tenant}/nested", nested, name="nested")
+
+        with exception:
+            assert app.router.resolve_url(name, **params) == result
+
+    def test_resolve_url_index_first_match(self, app):
+        app.add_route("/first/{id:int}/", lambda id: None, name="foo")
+        app.add_route("/second/", lambda: None, name="foo")
+
+        assert app.router.resolve_url("foo", id=1) == url.URL(path="/first/1/", scheme="http")
+        assert app.router.resolve_url("foo") == url.URL(path="/second/", scheme="http")
+
+    def test_resolve_url_index_invalidated(self, app):
+        nested = Flama(schema=None, docs=None)
+        app.mount("/nested", nested, name="nested")
+
+        with pytest.raises(exceptions.NotFoundException):
+            app.router.resolve_url("nested:foo")
+
+        nested.add_route("/foo/", lambda: None, name="foo")
+
+        assert app.router.resolve_url("nested:foo") == url.URL(path="/nested/foo/", scheme="http")
+
     async def test_request_nested_app(self, app):
         sub_app = Flama(docs=None, schema=None)
         sub_app.add_route("/bar/", lambda: {"foo": "bar"}, ["GET"])
@@ -2,13 +2,18 @@ import marshmallow
 import pytest
 
 from flama.schemas._libs.marshmallow.adapter import MarshmallowAdapter
-from flama.schemas.exceptions import SchemaGenerationError
+from flama.schemas.exceptions import SchemaGenerationError, SchemaValidationError
 
 
 class FooSchema(marshmallow.Schema):
     name = marshmallow.fields.String()
 
 
+class PuppySchema(marshmallow.Schema):
+    name = marshmallow.fields.String(required=True)
+    age = marshmallow.fields.Integer(required=True)
+
+
 class TestCaseMarshmallowAdapter:
     @pytest.fixture(scope="function")
     def adapter(self):
@@ -51,3 +56,56 @@ class TestCaseMarshmallowAdapter:
     def test_schema_instance(self, adapter, schema, exception):
         with exception:
             assert adapter._schema_instance(schema) is schema
+
+    def test_schema_instance_cached(self, adapter):
+        instance = adapter._schema_instance(FooSchema)
+
+        assert isinstance(instance, FooSchema)
+        assert adapter._schema_instance(FooSchema) is instance
+
+    def test_schema_fields(self, adapter):
+        fields = adapter.schema_fields(PuppySchema)
+
+        assert {k: v[0] for k, v in fields.items()} == {"name": str, "age": int}
+        assert adapter.schema_fields(PuppySchema) == fields
+        assert adapter.schema_fields(PuppySchema) is not fields
+        assert adapter.schema_fields(PuppySchema())["name"][0] is str
+
+    @pytest.mark.parametrize(
+        ["values", "exception", "expected"],
+        (
+            pytest.param(
+                [{"name": "Canna", "age": "6", "breed": "mixed"}, {"name": "Sandy", "age": 4}],
+                None,
+                [{"name": "Canna", "age": 6}, {"name": "Sandy", "age": 4}],
+                id="list",
+            ),
+            pytest.param(({"name": "Canna", "age": 6},), None, [{"name": "Canna", "age": 6}], id="tuple"),
+            pytest.param([{"name": "Canna", "age": 6}, {"name": "Sandy"}], SchemaValidationError, None, id="error"),
+        ),
+        indirect=["exception"],
+    )
+    def test_validate_many(self, adapter, values, exception, expected):
+        with exception as exc_info:
+            assert adapter.validate_many(PuppySchema, values) == expected
+
+        if exception:
+            # Errors are reported per item, as a single value validation does.
+            assert exc_info.value.errors == {"age": ["Missing data for required field."]}
+
+    @pytest.mark.parametrize(
+        ["values", "exception", "expected"],
+        (
+            pytest.param(
+                [{"name": "Canna", "age": 6}, {"name": "Sandy", "age": 4}],
+                None,
+                [{"name": "Canna", "age": 6}, {"name": "Sandy", "age": 4}],
+                id="list",
+            ),
+            pytest.param([{"name": "Canna", "age": 6}, {"name": "Sandy"}], SchemaValidationError, None, id="error"),
+        ),
+        indirect=["exception"],
+    )
+    def test_dump_many(self, adapter, values, exception, expected):
+        with exception:
+            assert adapter.dump_many(PuppySchema, values) == expected
@@ -1,10 +1,13 @@
+import datetime
+import decimal
 import typing as t
 
 import pydantic
 import pytest
 
+from flama._core.json_encoder import encode_json
 from flama.schemas._libs.pydantic.adapter import PydanticAdapter
-from flama.schemas.exceptions import SchemaGenerationError
+from flama.schemas.exceptions import SchemaGenerationError, SchemaValidationError
 
 
 class Puppy(pydantic.BaseModel):
@@ -74,3 +77,97 @@ class TestCasePydanticAdapter:
         # model's own ``FieldInfo`` objects, so mutating them would make its fields optional for every
         # other user, including the OpenAPI output of the non-PATCH routes that share it.
         assert all(field.is_required() for field in Puppy.model_fields.values())
+
+    @pytest.mark.parametrize(
+        ["values", "partial", "exception", "expected"],
+        (
+            pytest.param(
+                [{"name": "Canna", "age": "6"}, {"name": "Sandy", "age": 4}],
+                False,
+                None,
+                [{"name": "Canna", "age": 6}, {"name": "Sandy", "age": 4}],
+                id="list",
+            ),
+            pytest.param(({"name": "Canna", "age": 6},), False, None, [{"name": "Canna", "age": 6}], id="tuple"),
+            pytest.param([], False, None, [], id="empty"),
+            pytest.param(
+                [{"name": "Canna", "age": 6}, {"name": "Sandy"}], False, SchemaValidationError, None, id="error"
+            ),
+        ),
+        indirect=["exception"],
+    )
+    def test_validate_many(self, adapter, values, partial, exception, expected):
+        with exception as exc_info:
+            assert adapter.validate_many(Puppy, values, partial=partial) == expected
+            assert adapter.dump_many(Puppy, values) == expected
+
+        if exception:
+            # Errors are reported per item, as a single value validation does.
+            assert list(exc_info.value.errors) == ["age"]
+
+    def test_validate_many_partial(self, adapter):
+        partial_schema = adapter.build_schema(schema=Puppy, partial=True)
+
+        assert adapter.validate_many(partial_schema, [{"name": "Canna"}, {"age": 4}], partial=True) == [
+            {"name": "Canna"},
+            {"age": 4},
+        ]
+
+    @pytest.mark.parametrize(
+        ["value", "exception", "expected"],
+        (
+            pytest.param(b'{"name": "Canna", "age": "6"}', None, {"name": "Canna", "age": 6}, id="object"),
+            pytest.param(
+                b' [{"name": "Canna", "age": 6}, {"name": "Sandy", "age": 4}]',
+                None,
+                [{"name": "Canna", "age": 6}, {"name": "Sandy", "age": 4}],
+                id="array",
+            ),
+            pytest.param(b'{"name": "Canna"}', SchemaValidationError, None, id="validation_error"),
+            pytest.param(b'{"name": "Canna",', ValueError, None, id="malformed"),
+        ),
+        indirect=["exception"],
+    )
+    def test_validate_json(self, adapter, value, exception, expected):
+        with exception as exc_info:
+            assert adapter.validate_json(Puppy, value) == expected
+
+        if exception and isinstance(exc_info.value, SchemaValidationError):
+            # Errors are reported as a decoded value validation does.
+            assert list(exc_info.value.errors) == ["age"]
+
+    @pytest.mark.parametrize(
+        ["value", "exception", "expected"],
+        (
+            pytest.param({"name": "Canna", "age": "6"}, None, b'{"name":"Canna","age":6}', id="single"),
+            pytest.param(
+                [{"name": "Canna", "age": 6}, {"name": "Sandy", "age": 4}],
+                None,
+                b'[{"name":"Canna","age":6},{"name":"Sandy","age":4}]',
+                id="list",
+            ),
+            pytest.param(
+                [{"name": "Canna", "age": 6}, {"name": "Sandy"}],
+                SchemaValidationError,
+                None,
+                id="list_validation_error",
+            ),
+        ),
+        indirect=["exception"],
+    )
+    def test_dump_json(self, adapter, value, exception, expected):
+        with exception as exc_info:
+            assert adapter.dump_json(Puppy, value) == expected
+
+        if exception:
+            # Errors are reported per item, as the non-JSON dump does.
+            assert list(exc_info.value.errors) == ["age"]
+
+    def test_dump_json_encoding(self, adapter):
+        class Price(pydantic.BaseModel):
+            amount: decimal.Decimal
+            created: datetime.datetime
+
+        value = {"amount": "1.10", "created": datetime.datetime(2018, 1, 1, tzinfo=datetime.timezone.utc)}
+
+        assert adapter.dump_json(Price, value) == encode_json(adapter.dump(Price, value), compact=True)
@@ -5,7 +5,7 @@ import typesystem
 import typesystem.fields
 
 from flama.schemas._libs.typesystem.adapter import TypesystemAdapter
-from flama.schemas.exceptions import SchemaGenerationError
+from flama.schemas.exceptions import SchemaGenerationError, SchemaValidationError
 
 
 class TestCaseTypesystemAdapter:
@@ -23,6 +23,44 @@ class TestCaseTypesystemAdapter:
 
         assert result == {"name": "x"}
 
+    @pytest.mark.parametrize(
+        ["values", "exception", "expected"],
+        (
+            pytest.param([{"name": "x"}, {"name": "y"}], None, [{"name": "x"}, {"name": "y"}], id="list"),
+            pytest.param(({"name": "x"},), None, [{"name": "x"}], id="tuple"),
+            pytest.param([{"name": "x"}, {}], SchemaValidationError, None, id="error"),
+        ),
+        indirect=["exception"],
+    )
+    def test_validate_many(self, adapter, schema, values, exception, expected):
+        with exception as exc_info:
+            assert adapter.validate_many(schema, values) == expected
+            assert adapter.dump_many(schema, values) == expected
+
+        if exception:
+            # Errors are reported per item, as a single value validation does.
+            assert list(exc_info.value.errors) == ["name"]
+
+    def test_validate_many_cached(self, adapter, schema):
+        with patch("flama.schemas._libs.typesystem.adapter.typesystem.Array", wraps=typesystem.Array) as array:
+            adapter.validate_many(schema, [{"name": "x"}])
+            adapter.validate_many(schema, [{"name": "y"}])
+
+        assert array.call_count == 1
+
+    def test_schema_fields(self, adapter, schema):
+        fields = adapter.schema_fields(schema)
+
+        assert fields == {"name": (adapter._get_field_type(schema.fields["name"]), schema.fields["name"])}
+        assert adapter.schema_fields(schema) == fields
+        assert adapter.schema_fields(schema) is not fields
+
+    def test_validate_many_partial(self, adapter, schema):
+        with pytest.warns(UserWarning, match="Typesystem does not support partial validation"):
+            result = adapter.validate_many(schema, [{"name": "x"}], partial=True)
+
+        assert result == [{"name": "x"}]
+
     def test_load(self, adapter, schema):
         assert adapter.load(schema, {"name": "x"}) == {"name": "x"}
 
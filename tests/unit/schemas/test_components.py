@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call
 
 import pytest
 
@@ -42,8 +42,6 @@ class TestCaseValidatePathParamsComponent:
         request = MagicMock()
         request.method = "GET"
         route = MagicMock()
-        field = MagicMock()
-        route.parameters.path.__getitem__ = MagicMock(return_value={"id": MagicMock(field=field)})
 
         mock_schema = MagicMock()
         if validate_return is not None:
@@ -52,15 +50,15 @@ class TestCaseValidatePathParamsComponent:
             from flama.schemas import SchemaValidationError
 
             mock_schema.validate.side_effect = SchemaValidationError(errors=[{"error": "invalid"}])
+        route.parameters.validator.return_value = mock_schema
 
         with exception:
-            from unittest.mock import patch
-
-            with patch("flama.schemas.components.Schema.build", return_value=mock_schema):
-                result = await component.resolve(request, route, path_params)
+            result = await component.resolve(request, route, path_params)
 
             assert result == expected
 
+        assert route.parameters.validator.call_args_list == [call("path", "GET")]
+
 
 class TestCaseValidateRequestDataComponent:
     @pytest.mark.parametrize(
@@ -146,6 +144,20 @@ class TestCasePrimitiveParamComponent:
 
         assert result == "fallback"
 
+    def test_validator(self):
+        component = PrimitiveParamComponent()
+        parameter = Parameter(name="q", annotation=str, default="default")
+
+        from unittest.mock import patch
+
+        with patch("flama.schemas.components.Schema.build", side_effect=lambda **kwargs: MagicMock()) as build:
+            validator = component.validator(parameter)
+
+            assert component.validator(Parameter(name="q", annotation=str, default="default")) is validator
+            assert component.validator(Parameter(name="q", annotation=int)) is not validator
+
+        assert build.call_count == 2
+
 
 class TestCaseCompositeParamComponent:
     def test_resolve_body_param_none(self):
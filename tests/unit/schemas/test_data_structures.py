@@ -12,6 +12,7 @@ import pytest
 from flama import types
 from flama.injection import Parameter as InjectionParameter
 from flama.schemas.data_structures import Field, Parameter, ParameterLocation, Schema
+from flama.schemas.exceptions import SchemaValidationError
 from tests._utils import assert_recursive_contains
 
 Unknown = t.NewType("Unknown", None)
@@ -199,6 +200,29 @@ class TestCaseSchema:
         with exception:
             Schema.from_type(schema_type)
 
+    def test_from_type_cache(self, app, foo_schema):
+        if app.schema.schema_library.name in ("typesystem",):
+            pytest.skip("Library does not support optional partial schemas")
+
+        partial = t.Annotated[types.Schema, types.SchemaMetadata(foo_schema.schema, partial=True)]
+        info = Schema.cache_info()
+
+        schema = Schema.from_type(partial)
+
+        assert Schema.from_type(partial).schema is schema.schema
+        assert Schema.from_type(list[partial]).schema is schema.schema
+        assert schema.schema is not foo_schema.schema
+        assert Schema.cache_info().misses - info.misses == 2
+        assert Schema.cache_info().hits - info.hits == 2
+
+    def test_from_type_unhashable(self):
+        with patch(
+            "flama.schemas.data_structures._schema_from_type", Mock(side_effect=TypeError, __wrapped__=Mock())
+        ) as schema_from_type:
+            schema = Schema.from_type(dict)
+
+        assert schema.schema is schema_from_type.__wrapped__.return_value
+
     def test_build(self, foo_schema):
         n = Mock()
         m = Mock()
@@ -348,23 +372,78 @@ class TestCaseSchema:
 
         assert result == [schemas["Foo"].schema, schemas["Bar"].schema]
 
+    def test_validate(self):
+        schema_mock = Mock()
+        value = Mock()
+        with patch("flama.schemas.data_structures.schemas") as schemas_mock:
+            schemas_mock.adapter.validate.return_value = True
+
+            result = Schema(schema_mock).validate(value)
+
+            assert result is True
+            assert schemas_mock.adapter.validate.call_args_list == [call(schema_mock, value, partial=False)]
+            assert schemas_mock.adapter.validate_many.call_args_list == []
+
     @pytest.mark.parametrize(
-        ["values", "expected_result"],
+        ["values"],
         (
-            pytest.param(Mock(partial=False), True, id="single"),
-            pytest.param([Mock(), Mock()], [True, True], id="multiple"),
+            pytest.param([Mock(), Mock()], id="list"),
+            pytest.param((Mock(), Mock()), id="tuple"),
         ),
     )
-    def test_validate(self, values, expected_result):
+    def test_validate_many(self, values):
+        schema_mock = Mock()
+        with patch("flama.schemas.data_structures.schemas") as schemas_mock:
+            schemas_mock.adapter.validate_many.return_value = [True, True]
+
+            result = Schema(schema_mock).validate(values, partial=True)
+
+            assert result == [True, True]
+            assert schemas_mock.adapter.validate_many.call_args_list == [call(schema_mock, values, partial=True)]
+            assert schemas_mock.adapter.validate.call_args_list == []
+
+    def test_validate_json(self):
+        schema_mock = Mock()
+        with patch("flama.schemas.data_structures.schemas") as schemas_mock:
+            schemas_mock.adapter.validate_json.return_value = True
+
+            result = Schema(schema_mock).validate_json(b'{"foo": "bar"}', partial=True)
+
+            assert result is True
+            assert schemas_mock.adapter.validate_json.call_args_list == [
+                call(schema_mock, b'{"foo": "bar"}', partial=True)
+            ]
+
+    def test_validate_json_empty(self):
         schema_mock = Mock()
         with patch("flama.schemas.data_structures.schemas") as schemas_mock:
             schemas_mock.adapter.validate.return_value = True
 
-            result = Schema(schema_mock).validate(values)
+            result = Schema(schema_mock).validate_json(b"")
 
-            assert result == expected_result
+            assert result is True
+            assert schemas_mock.adapter.validate.call_args_list == [call(schema_mock, {}, partial=False)]
+            assert schemas_mock.adapter.validate_json.call_args_list == []
+
+    async def test_validate_stream(self):
+        schema_mock = Mock()
+        values = [Mock(), Mock()]
+
+        async def stream():
+            for value in values:
+                yield value
+
+        with patch("flama.schemas.data_structures.schemas") as schemas_mock:
+            schemas_mock.adapter.validate.side_effect = [True, SchemaValidationError(errors={"foo": "error"})]
+
+            result = Schema(schema_mock).validate_stream(stream(), partial=True)
+
+            assert await anext(result) is True
+            with pytest.raises(SchemaValidationError):
+                await anext(result)
             assert schemas_mock.adapter.validate.call_args_list == [
-                call(schema_mock, x, partial=False) for x in (values if isinstance(values, list) else [values])
+                call(schema_mock, values[0], partial=True),
+                call(schema_mock, values[1], partial=True),
             ]
 
     @pytest.mark.parametrize(
@@ -386,24 +465,52 @@ class TestCaseSchema:
                 call(schema_mock, x) for x in (values if isinstance(values, list) else [values])
             ]
 
+    def test_dump(self):
+        schema_mock = Mock()
+        value = Mock()
+        with patch("flama.schemas.data_structures.schemas") as schemas_mock:
+            schemas_mock.adapter.dump.return_value = True
+
+            result = Schema(schema_mock).dump(value)
+
+            assert result is True
+            assert schemas_mock.adapter.dump.call_args_list == [call(schema_mock, value)]
+            assert schemas_mock.adapter.dump_many.call_args_list == []
+
     @pytest.mark.parametrize(
-        ["values", "expected_result"],
+        ["values"],
         (
-            pytest.param(Mock(), True, id="single"),
-            pytest.param([Mock(), Mock()], [True, True], id="multiple"),
+            pytest.param([Mock(), Mock()], id="list"),
+            pytest.param((Mock(), Mock()), id="tuple"),
         ),
     )
-    def test_dump(self, values, expected_result):
+    def test_dump_many(self, values):
         schema_mock = Mock()
         with patch("flama.schemas.data_structures.schemas") as schemas_mock:
-            schemas_mock.adapter.dump.return_value = True
+            schemas_mock.adapter.dump_many.return_value = [True, True]
 
             result = Schema(schema_mock).dump(values)
 
-            assert result == expected_result
-            assert schemas_mock.adapter.dump.call_args_list == [
-                call(schema_mock, x) for x in (values if isinstance(values, list) else [values])
-            ]
+            assert result == [True, True]
+            assert schemas_mock.adapter.dump_many.call_args_list == [call(schema_mock, values)]
+            assert schemas_mock.adapter.dump.call_args_list == []
+
+    @pytest.mark.parametrize(
+        ["values"],
+        (
+            pytest.param(Mock(), id="single"),
+            pytest.param([Mock(), Mock()], id="multiple"),
+        ),
+    )
+    def test_dump_json(self, values):
+        schema_mock = Mock()
+        with patch("flama.schemas.data_structures.schemas") as schemas_mock:
+            schemas_mock.adapter.dump_json.return_value = b"{}"
+
+            result = Schema(schema_mock).dump_json(values)
+
+            assert result == b"{}"
+            assert schemas_mock.adapter.dump_json.call_args_list == [call(schema_mock, values, validate=True)]
 
 
 class TestCaseParameter:
@@ -1,8 +1,11 @@
+import json
+import threading
 from unittest.mock import Mock, call, patch
 
 import pytest
 
-from flama import Flama, exceptions, pagination, schemas
+from flama import Flama, codecs, exceptions, pagination, schemas
+from flama.http.cache import generate_etag
 from flama.schemas.modules import SchemaModule
 from tests._utils import requires_templates
 
@@ -55,6 +58,27 @@ class TestCaseSchemaModule:
             },
         }
 
+    def test_schema_copy(self, module):
+        module.schema["paths"]["/foo/"] = {}
+
+        assert module.schema["paths"] == {}
+        assert module.document.schema["paths"] == {}
+
+    def test_document(self, module, foo_schema):
+        document = module.document
+
+        assert module.document is document
+        assert document.openapi.body == json.dumps(document.schema, separators=(",", ":")).encode()
+        assert document.openapi.etag == generate_etag(document.openapi.body)
+
+        module.register_schema(foo_schema.name, foo_schema.schema)
+        assert module.document is not document
+
+        document = module.document
+        module.app.add_route("/foo/", lambda: {}, methods=["GET"])
+        assert module.document is not document
+        assert "/foo/" in module.document.schema["paths"]
+
     @pytest.mark.parametrize(
         ["schema", "docs", "exception"],
         (
@@ -99,12 +123,63 @@ class TestCaseSchemaModule:
 
             assert module.app.add_route.call_args_list == expected_calls
 
-    async def test_view_schema(self, client):
-        response = await client.request("get", "/schema/")
+    @pytest.mark.parametrize(
+        ["accept_encoding", "content_encoding"],
+        (
+            pytest.param("identity", None, id="identity"),
+            pytest.param("gzip", "gzip", id="gzip"),
+            pytest.param("gzip, br", "br", id="brotli"),
+        ),
+    )
+    async def test_view_schema(self, app, client, accept_encoding, content_encoding):
+        threads = []
+
+        def compress(compress_):
+            def _compress(self, *args):
+                threads.append(threading.get_ident())
+                return compress_(self, *args)
+
+            return _compress
+
+        with (
+            patch.object(codecs.GzipCodec, "compress", compress(codecs.GzipCodec.compress)),
+            patch.object(codecs.BrotliCodec, "compress", compress(codecs.BrotliCodec.compress)),
+        ):
+            response = await client.request("get", "/schema/", headers={"accept-encoding": accept_encoding})
+
         assert response.status_code == 200
+        assert len(threads) == (1 if content_encoding else 0)
+        assert threading.get_ident() not in threads
         assert response.headers.get("content-type") == "application/vnd.oai.openapi+json"
+        assert response.headers.get("content-encoding") == content_encoding
+        assert response.headers["etag"] == app.schema.document.openapi.etag
+        assert response.headers["vary"] == "Accept-Encoding"
+        if content_encoding:
+            assert list(app.schema.document.openapi.encoded) == [content_encoding]
+        if content_encoding != "br":
+            assert response.json() == app.schema.schema
+
+    async def test_view_schema_not_modified(self, app, client):
+        etag = (await client.request("get", "/schema/")).headers["etag"]
+
+        response = await client.request("get", "/schema/", headers={"if-none-match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        app.add_route("/foo/", lambda: {}, methods=["GET"])
+        response = await client.request("get", "/schema/", headers={"if-none-match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
 
     @requires_templates
-    async def test_view_docs(self, client):
+    async def test_view_docs(self, app, client):
         response = await client.request("get", "/docs/")
         assert response.status_code == 200
+        assert response.headers["content-type"] == "text/html; charset=utf-8"
+        assert response.headers["etag"] == app.schema.document.docs.etag
+
+        response = await client.request("get", "/docs/", headers={"if-none-match": response.headers["etag"]})
+        assert response.status_code == 304
@@ -2222,6 +2222,28 @@ class TestCaseSchemaGenerator:
         assert api_schema["paths"] == {}
         assert any("Cannot generate schema for endpoint" in record.message for record in caplog_flama.records)
 
+    def test_get_api_schema_incremental(self, app):
+        generator = app.schema.schema_generator
+        schema = generator.get_api_schema(app.routes)
+
+        with patch.object(generator, "get_operation_schema", wraps=generator.get_operation_schema) as operation:
+            assert generator.get_api_schema(app.routes) == schema
+            assert operation.call_count == 0
+
+            @app.route("/incremental/", methods=["GET", "POST"])
+            def incremental(): ...  # pragma: no cover
+
+            result = generator.get_api_schema(app.routes)
+
+            assert operation.call_count == 2
+            assert {k: v for k, v in result["paths"].items() if k != "/incremental/"} == schema["paths"]
+            assert set(result["paths"]["/incremental/"]) == {"get", "post"}
+
+        app.router.routes.pop()
+
+        assert generator.get_api_schema(app.routes) == schema
+        assert app.schema.schema_generator is generator
+
     def test_get_api_schema_recursive_schema_terminates(self, app):
         """A self-referencing (recursive) schema must not loop forever while collecting used schemas."""
         if app.schema.schema_library.name != "pydantic":
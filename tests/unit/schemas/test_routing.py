@@ -1,5 +1,5 @@
 import typing as t
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import marshmallow
 import pydantic
@@ -404,6 +404,46 @@ class TestCaseParametersDescriptor:
         }
         assert route.parameters.response == expected_params
 
+    @pytest.mark.parametrize(
+        ["route", "location", "values", "expected"],
+        (
+            pytest.param("http_function", "path", {"w": "1"}, {"w": 1}, id="path"),
+            pytest.param(
+                "http_function", "query", {"ax": "3", "x": "2", "y": "foo"}, {"ax": 3, "x": 2, "y": "foo"}, id="query"
+            ),
+        ),
+        indirect=["route"],
+    )
+    def test_validator(self, app, route, location, values, expected):
+        validator = route.parameters.validator(location, "GET")
+
+        assert route.parameters.validator(location, "GET") is validator
+        assert {k: v for k, v in validator.validate(values).items() if k in values} == expected
+
+        route._build(app)
+        assert route.parameters.validator(location, "GET") is not validator
+
+    @pytest.mark.parametrize(["route"], (pytest.param("http_function", id="http_function"),), indirect=["route"])
+    def test_memoized(self, app, route):
+        class Bar: ...
+
+        class BarComponent(Component):
+            def resolve(self) -> Bar:
+                return Bar()
+
+        query = route.parameters.query
+
+        with patch.object(app.injector, "resolve_function", wraps=app.injector.resolve_function) as resolve_function:
+            assert route.parameters.query is query
+            assert route.parameters.path is route.parameters.path
+            assert resolve_function.call_count == 0
+
+            app.add_component(BarComponent())
+
+            assert route.parameters.query is not query
+            assert route.parameters.query == query
+            assert resolve_function.call_count > 0
+
     @pytest.mark.parametrize(
         ["exception"],
         (pytest.param(exceptions.ApplicationError("ParametersResolver not initialised"), id="not_initialised"),),
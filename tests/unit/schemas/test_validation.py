@@ -1,4 +1,6 @@
 import datetime
+import logging
+import typing as t
 from unittest.mock import patch
 
 import marshmallow
@@ -6,8 +8,8 @@ import pydantic
 import pytest
 import typesystem
 
-from flama import exceptions
-from flama.schemas.validation import output_validation
+from flama import exceptions, types
+from flama.schemas.validation import OutputValidation, output_validation
 
 
 class TestCaseSchemaValidateOutput:
@@ -142,17 +144,7 @@ class TestCaseSchemaValidateOutput:
             assert response.json() == expected_response
 
     async def test_validation_uncontrolled_error(self, client):
-        with patch(
-            "flama.schemas.data_structures.schemas.adapter.dump",
-            side_effect=[
-                Exception,
-                {
-                    "detail": "Error serializing response before validation: Exception",
-                    "error": "ValidationError",
-                    "status_code": 500,
-                },
-            ],
-        ):
+        with patch("flama.schemas.data_structures.Schema.dump", side_effect=Exception("Exception")):
             response = await client.get("/product")
             assert response.status_code == 500
             assert response.json() == {
@@ -166,3 +158,110 @@ class TestCaseSchemaValidateOutput:
 
             @output_validation()
             def foo(): ...
+
+
+class TestCaseOutputValidation:
+    @pytest.fixture(scope="function")
+    def product_schema(self, app):
+        from flama import schemas
+
+        if schemas.lib == pydantic:
+            schema = pydantic.create_model("Product", name=(str, ...), rating=(pydantic.NonNegativeInt, ...))
+        elif schemas.lib == typesystem:
+            schema = typesystem.Schema(
+                title="Product",
+                fields={"name": typesystem.fields.String(), "rating": typesystem.fields.Integer(minimum=0)},
+            )
+        elif schemas.lib == marshmallow:
+            schema = type(
+                "Product",
+                (marshmallow.Schema,),
+                {
+                    "name": marshmallow.fields.String(),
+                    "rating": marshmallow.fields.Integer(validate=marshmallow.validate.Range(min=0)),
+                },
+            )
+        else:
+            raise ValueError("Wrong schema lib")
+
+        return schema
+
+    @pytest.mark.parametrize(
+        ["mode", "sample_rate", "exception"],
+        [
+            pytest.param("strict", 0.1, None, id="strict"),
+            pytest.param("sampled", 0.5, None, id="sampled"),
+            pytest.param("off", 0.1, None, id="off"),
+            pytest.param("wrong", 0.1, ValueError("Wrong output validation mode 'wrong'"), id="wrong_mode"),
+            pytest.param("sampled", 2.0, ValueError("Wrong output validation sample rate '2.0'"), id="wrong_rate"),
+        ],
+        indirect=["exception"],
+    )
+    def test_init(self, mode, sample_rate, exception):
+        with exception:
+            policy = OutputValidation(mode, sample_rate=sample_rate)
+
+            assert policy.mode == mode
+            assert policy.sample_rate == sample_rate
+            assert policy.validated == 0
+            assert policy.failed == 0
+
+    @pytest.mark.parametrize(
+        ["mode", "random", "result"],
+        [
+            pytest.param("strict", 0.9, True, id="strict"),
+            pytest.param("sampled", 0.05, True, id="sampled_in"),
+            pytest.param("sampled", 0.5, False, id="sampled_out"),
+            pytest.param("off", 0.0, False, id="off"),
+        ],
+    )
+    def test_should_validate(self, mode, random, result):
+        with patch("flama.schemas.validation.random.random", return_value=random):
+            assert OutputValidation(mode, sample_rate=0.1).should_validate() is result
+
+    @pytest.mark.parametrize(
+        ["app_policy", "route_policy", "status_code", "validated", "failed", "logged"],
+        [
+            pytest.param(None, None, 500, None, None, False, id="default"),
+            pytest.param(None, ("strict", 0.1), 500, 1, 1, False, id="route_strict"),
+            pytest.param(None, ("sampled", 1.0), 200, 1, 1, True, id="route_sampled"),
+            pytest.param(None, ("sampled", 0.0), 200, 0, 0, False, id="route_not_sampled"),
+            pytest.param(None, ("off", 0.1), 200, 0, 0, False, id="route_off"),
+            pytest.param(("off", 0.1), None, 200, 0, 0, False, id="app_off"),
+            pytest.param(("off", 0.1), ("strict", 0.1), 500, 1, 1, False, id="route_overrides_app"),
+        ],
+    )
+    async def test_policy(
+        self, app, client, product_schema, caplog, app_policy, route_policy, status_code, validated, failed, logged
+    ):
+        app.output_validation = OutputValidation(app_policy[0], sample_rate=app_policy[1]) if app_policy else None
+        policy = OutputValidation(route_policy[0], sample_rate=route_policy[1]) if route_policy else None
+
+        @app.route("/product/", output_validation=policy)
+        def product() -> t.Annotated[types.Schema, types.SchemaMetadata(product_schema)]:
+            return {"name": "foo", "rating": -1}
+
+        with caplog.at_level(logging.WARNING, logger="flama.schemas.validation"):
+            response = await client.get("/product/")
+
+        assert response.status_code == status_code
+        if status_code == 200:
+            assert response.json() == {"name": "foo", "rating": -1}
+        if (policy := policy or app.output_validation) is not None:
+            assert policy.validated == validated
+            assert policy.failed == failed
+        assert ("Output not valid for schema" in caplog.text) is logged
+
+    async def test_policy_valid_output(self, app, client, product_schema):
+        policy = OutputValidation("strict")
+
+        @app.route("/product/", output_validation=policy)
+        def product() -> t.Annotated[types.Schema, types.SchemaMetadata(product_schema)]:
+            return {"name": "foo", "rating": 1}
+
+        response = await client.get("/product/")
+
+        assert response.status_code == 200
+        assert response.json() == {"name": "foo", "rating": 1}
+        assert policy.validated == 1
+        assert policy.failed == 0
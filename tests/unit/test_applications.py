@@ -1,6 +1,6 @@
 import asyncio
 import uuid
-from unittest.mock import AsyncMock, MagicMock, call, patch
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, call, patch
 
 import pytest
 
@@ -45,6 +45,12 @@ class TestCaseFlama:
     def tags(self):
         return {"tag": "foo", "list_tag": ["foo", "bar"], "dict_tag": {"foo": "bar"}}
 
+    def test_init_route_cache_size(self):
+        with patch("flama.applications.routing.Router") as router_mock:
+            Flama(schema=None, docs=None, route_cache_size=1024)
+
+        assert router_mock.call_args.kwargs["route_cache_size"] == 1024
+
     def test_init(self, module, component):
         component_obj = component()
 
@@ -56,6 +62,7 @@ class TestCaseFlama:
         # Check injector
         assert isinstance(app._injector, Injector)
         assert app._injector._context_cls == Context
+        assert app._injector.concurrent is False
         assert app._injector._context_cls.types() == {
             "scope": types.Scope,
             "receive": types.Receive,
@@ -84,6 +91,11 @@ class TestCaseFlama:
         # it is orchestrated by the Lifespan as a barrier around user handlers (see flama/lifespan.py).
         assert app.events == Events(startup=[], shutdown=[])
 
+    def test_init_concurrent_injection(self):
+        app = Flama(schema=None, docs=None, concurrent_injection=True)
+
+        assert app._injector.concurrent is True
+
     def test_getattr(self, app):
         for name, module in app.modules.items():
             assert getattr(app, name) == module
@@ -170,7 +182,19 @@ class TestCaseFlama:
             route = app.add_route("/", foo, tags=tags)
 
         assert router_mock.add_route.call_args_list == [
-            call("/", foo, methods=None, name=None, include_in_schema=True, route=None, pagination=None, tags=tags)
+            call(
+                "/",
+                foo,
+                methods=None,
+                name=None,
+                include_in_schema=True,
+                route=None,
+                pagination=None,
+                tags=tags,
+                cache=None,
+                output_validation=None,
+                etag=None,
+            )
         ]
         assert route == foo
 
@@ -181,7 +205,17 @@ class TestCaseFlama:
             def foo(): ...
 
         assert router_mock.route.call_args_list == [
-            call("/", methods=None, name=None, include_in_schema=True, pagination=None, tags=tags)
+            call(
+                "/",
+                methods=None,
+                name=None,
+                include_in_schema=True,
+                pagination=None,
+                tags=tags,
+                cache=None,
+                output_validation=None,
+                etag=None,
+            )
         ]
 
     @pytest.mark.parametrize(
@@ -198,10 +232,32 @@ class TestCaseFlama:
             getattr(app, f"add_{method.lower()}")("/", foo)
 
         assert router_mock.route.call_args_list == [
-            call("/", methods=[method], name=None, include_in_schema=True, pagination=None, tags=None)
+            call(
+                "/",
+                methods=[method],
+                name=None,
+                include_in_schema=True,
+                pagination=None,
+                tags=None,
+                cache=None,
+                output_validation=None,
+                etag=None,
+            )
         ]
         assert router_mock.add_route.call_args_list == [
-            call("/", foo, methods=[method], name=None, include_in_schema=True, route=None, pagination=None, tags=None)
+            call(
+                "/",
+                foo,
+                methods=[method],
+                name=None,
+                include_in_schema=True,
+                route=None,
+                pagination=None,
+                tags=None,
+                cache=None,
+                output_validation=None,
+                etag=None,
+            )
         ]
 
     def test_add_websocket_route(self, app, tags):
@@ -241,6 +297,23 @@ class TestCaseFlama:
     def test_injector(self, app):
         assert isinstance(app.injector, Injector)
 
+    def test_injector_components(self, app, component):
+        parent = Flama(schema=None, docs=None)
+        parent_component = MagicMock(spec=Component)
+        parent.add_component(parent_component)
+        injector = app.injector
+
+        with patch.object(Flama, "components", new_callable=PropertyMock) as components_mock:
+            assert app.injector is injector
+
+        assert components_mock.call_count == 0
+
+        app.add_component(component)
+        assert component in app.injector.components
+
+        app.parent = parent
+        assert parent_component in app.injector.components
+
     def test_add_event_handler(self, app):
         handlers_before = app.events.startup.copy()
 
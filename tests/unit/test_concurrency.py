@@ -1,10 +1,12 @@
 import asyncio
 import concurrent.futures
+import contextlib
 import contextvars
 import functools
 import pathlib
 import threading
 import typing as t
+from unittest.mock import patch
 
 import pytest
 
@@ -45,6 +47,79 @@ class TestCaseFileReader:
 
         assert collected == expected
 
+    @pytest.mark.parametrize(
+        ["chunk_size", "max_chunk_size", "start", "end", "expected"],
+        [
+            pytest.param(
+                2, 8, None, None, [b"ab", b"cdef", b"ghijklmn", b"opqrstuv", b"wxyz"], id="full_file_growing_chunks"
+            ),
+            pytest.param(2, 4, 2, 14, [b"cd", b"efgh", b"ijkl", b"mn"], id="range_growing_chunks"),
+            pytest.param(8, 2, None, 16, [b"abcdefgh", b"ijklmnop"], id="max_below_chunk_size"),
+        ],
+    )
+    async def test_iteration_growing_chunks(
+        self,
+        file_path: pathlib.Path,
+        chunk_size: int,
+        max_chunk_size: int,
+        start: int | None,
+        end: int | None,
+        expected: list[bytes],
+    ) -> None:
+        reader = concurrency.FileReader(
+            file_path, chunk_size=chunk_size, start=start, end=end, max_chunk_size=max_chunk_size
+        )
+
+        async with reader as it:
+            collected = [chunk async for chunk in it]
+
+        assert collected == expected
+
+    async def test_iteration_io_executor(self, file_path: pathlib.Path) -> None:
+        threads = set()
+        open_file_ = concurrency._open_file
+
+        def open_file(*args):
+            threads.add(threading.current_thread().name)
+            return open_file_(*args)
+
+        with patch("flama.concurrency._open_file", side_effect=open_file):
+            async with concurrency.FileReader(file_path, chunk_size=8) as reader:
+                collected = [chunk async for chunk in reader]
+
+        assert b"".join(collected) == file_path.read_bytes()
+        assert len(threads) == 1
+        assert threads.pop().startswith("flama-io")
+        assert concurrency._io_executor() is concurrency._io_executor()
+
+    @pytest.mark.parametrize(
+        ["read_ahead", "expected"],
+        [
+            pytest.param(8, [b"cdef"], id="bytes_budget"),
+            pytest.param(1, [b"cdef"], id="single_chunk_over_budget"),
+            pytest.param(16, [b"cdef", b"ghijklmn"], id="several_chunks"),
+        ],
+    )
+    async def test_read_ahead(self, file_path: pathlib.Path, read_ahead: int, expected: list[bytes]) -> None:
+        reader = concurrency.FileReader(file_path, chunk_size=2, max_chunk_size=16)
+        reader.read_ahead = read_ahead
+
+        async with reader:
+            it = reader.__aiter__()
+            assert await it.__anext__() == b"ab"
+            for _ in range(10):
+                await asyncio.sleep(0.01)
+
+            assert list(reader._queue._queue) == expected  # type: ignore[attr-defined]
+            assert reader._queued == sum(len(x) for x in expected)
+
+            collected = []
+            with contextlib.suppress(StopAsyncIteration):
+                while True:
+                    collected.append(await it.__anext__())
+
+        assert b"".join(collected) == file_path.read_bytes()[2:]
+
     async def test_aclose_cancels_producer_and_drains_queue(self, file_path: pathlib.Path) -> None:
         reader = concurrency.FileReader(file_path, chunk_size=2)
 
@@ -147,6 +222,19 @@ class TestCaseRun:
         assert await concurrency.run(_f, 3) == 6
 
 
+class TestCaseRunIO:
+    """Cover :func:`concurrency.run_io` dispatch to the file I/O pool."""
+
+    async def test_sync_target(self) -> None:
+        def _f(x: int) -> tuple[int, str]:
+            return x * 2, threading.current_thread().name
+
+        result, thread = await concurrency.run_io(_f, 3)
+
+        assert result == 6
+        assert thread.startswith("flama-io")
+
+
 class TestCaseRunInExecutor:
     """Cover :func:`concurrency.run_in_executor` — explicit executor pinning + contextvars."""
 
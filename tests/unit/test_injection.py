@@ -1,6 +1,6 @@
 import pytest
 
-from flama import endpoints, http, injection
+from flama import endpoints, exceptions, http, injection
 from flama.applications import Flama
 from flama.client import Client
 from flama.routing.routes.mount import Mount
@@ -79,14 +79,6 @@ class TestCaseComponentsInjection:
         async def nested_component_view(owner: Owner):
             return {"name": owner.name, "puppy": {"name": owner.puppy.name}}
 
-        @app.route("/unknown-component/")
-        def unknown_component_view(unknown: Unknown):
-            return http.JSONResponse({"foo": "bar"})
-
-        @app.route("/unknown-param-in-component/")
-        def unknown_param_in_component_view(foo: Foo):
-            return http.JSONResponse({"foo": "bar"})
-
     @pytest.mark.parametrize(
         ["url", "method", "params", "status_code", "result", "exception"],
         (
@@ -113,31 +105,6 @@ class TestCaseComponentsInjection:
                 None,
                 id="nested_component",
             ),
-            pytest.param(
-                "/unknown-component/",
-                "get",
-                None,
-                None,
-                None,
-                (
-                    injection.ComponentNotFound,
-                    "No component able to handle parameter 'unknown' for function 'unknown_component_view'",
-                ),
-                id="unknown_component",
-            ),
-            pytest.param(
-                "/unknown-param-in-component/",
-                "get",
-                None,
-                None,
-                None,
-                (
-                    injection.ComponentNotFound,
-                    "No component able to handle parameter 'foo' in component 'UnknownParamComponent' for function "
-                    "'unknown_param_in_component_view'",
-                ),
-                id="unknown_param_in_component",
-            ),
         ),
         indirect=["exception"],
     )
@@ -163,13 +130,47 @@ class TestCaseComponentsInjection:
         def foo(unknown: Unknown):
             return http.JSONResponse({"foo": "bar"})
 
-        with pytest.raises(
-            injection.ComponentError,
-            match="Component 'UnhandledComponent' must include a return annotation on the 'resolve' method, "
-            "or override 'can_handle_parameter'",
-        ):
-            async with Client(app=app) as client:
-                await client.request("get", "/")
+        with pytest.raises(exceptions.ApplicationError, match="Lifespan startup failed") as exc_info:
+            async with Client(app=app):
+                ...
+
+        assert isinstance(exc_info.value.__cause__, injection.ComponentError)
+        assert str(exc_info.value.__cause__) == (
+            "Component 'UnhandledComponent' must include a return annotation on the 'resolve' method, "
+            "or override 'can_handle_parameter'"
+        )
+
+    @pytest.mark.parametrize(
+        ["view", "message"],
+        (
+            pytest.param(
+                "unknown_component_view",
+                "No component able to handle parameter 'unknown' for function 'unknown_component_view'",
+                id="unknown_component",
+            ),
+            pytest.param(
+                "unknown_param_in_component_view",
+                "No component able to handle parameter 'foo' in component 'UnknownParamComponent' for function "
+                "'unknown_param_in_component_view'",
+                id="unknown_param_in_component",
+            ),
+        ),
+    )
+    async def test_unresolvable_handler(self, app, view, message):
+        def unknown_component_view(unknown: Unknown):
+            return http.JSONResponse({"foo": "bar"})
+
+        def unknown_param_in_component_view(foo: Foo):
+            return http.JSONResponse({"foo": "bar"})
+
+        app.add_route("/unresolvable/", locals()[view])
+
+        with pytest.raises(exceptions.ApplicationError, match="Lifespan startup failed") as exc_info:
+            async with Client(app=app):
+                ...
+
+        assert isinstance(exc_info.value.__cause__, injection.ComponentNotFound)
+        assert str(exc_info.value.__cause__) == message
 
     async def test_injection_mount(self, puppy_component):
         foo_app = Flama(schema=None, docs=None, components=[puppy_component])
@@ -6,6 +6,7 @@ import pytest
 
 from flama import Flama, Module, exceptions, types
 from flama.client import LifespanContextManager
+from flama.endpoints import HTTPEndpoint
 from flama.lifespan import Lifespan
 
 
@@ -345,12 +346,20 @@ class TestCaseLifespan:
         app.modules.on_startup = AsyncMock()
         app.middleware = MagicMock()
         app.middleware.on_startup = AsyncMock()
+        app.injector.warm_up = AsyncMock()
+        handler = MagicMock()
+        app.routes = [
+            MagicMock(endpoint_handlers=MagicMock(return_value={"GET": handler})),
+            MagicMock(endpoint_handlers=MagicMock(return_value={"POST": HTTPEndpoint})),
+        ]
 
         await lifespan._startup(app)
 
         # Framework lifecycle (modules then middleware) is initialised as a barrier before user handlers.
         assert app.modules.on_startup.await_args_list == [call()]
         assert app.middleware.on_startup.await_args_list == [call()]
+        # Injection plans are resolved for every handler, but not for endpoint classes.
+        assert app.injector.warm_up.await_args_list == [call(handler)]
         if has_events:
             assert foo.await_args_list == [call()]
         if child_lifespan:
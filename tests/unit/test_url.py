@@ -186,6 +186,17 @@ class TestCasePath:
     def test_match(self, path, value, result):
         assert path.match(value) == result
 
+    @pytest.mark.parametrize(
+        ["path", "values", "result"],
+        (
+            pytest.param(Path("/"), (), {}, id="no_params"),
+            pytest.param(Path("/{foo}/"), ("bar",), {"foo": "bar"}, id="no_type"),
+            pytest.param(Path("/{foo:int}/{bar:float}/"), ("1", "2.5"), {"foo": 1, "bar": 2.5}, id="typed"),
+        ),
+    )
+    def test_load_parameters(self, path, values, result):
+        assert path.load_parameters(values) == result
+
     @pytest.mark.parametrize(
         ["path", "result"],
         (
@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from flama import exceptions, types
+
+
+class TestCaseRequestData:
+    @pytest.fixture(scope="function")
+    def decode(self):
+        def decode(body: bytes):
+            try:
+                return json.loads(body)
+            except ValueError:
+                raise exceptions.HTTPException(status_code=400)
+
+        return decode
+
+    def test_data(self, decode):
+        request_data = types.RequestData(raw=b'{"foo": "bar"}', decode=decode)
+
+        assert not request_data.decoded
+        assert request_data.data == {"foo": "bar"}
+        assert request_data.decoded
+
+    @pytest.mark.parametrize(
+        ["data", "raw", "expected"],
+        [
+            pytest.param({"foo": "bar"}, None, "RequestData(data={'foo': 'bar'})", id="data"),
+            pytest.param(None, b"{", "RequestData(raw=b'{', decoded=False)", id="raw"),
+        ],
+    )
+    def test_repr(self, decode, data, raw, expected):
+        request_data = types.RequestData(data) if raw is None else types.RequestData(raw=raw, decode=decode)
+
+        assert repr(request_data) == expected
+
+    def test_eq(self, decode):
+        assert types.RequestData({"foo": "bar"}) == types.RequestData({"foo": "bar"})
+        assert types.RequestData({"foo": "bar"}) != types.RequestData({"foo": "baz"})
+        assert types.RequestData(raw=b"{", decode=decode) == types.RequestData(raw=b"{", decode=decode)
+        assert types.RequestData(raw=b"{", decode=decode) != types.RequestData(raw=b"[", decode=decode)
+
+    def test_hash(self, decode):
+        assert hash(types.RequestData(raw=b"{", decode=decode)) == hash(types.RequestData(raw=b"{", decode=decode))
+        assert hash(types.RequestData(None)) == hash(types.RequestData(None))
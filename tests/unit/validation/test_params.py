@@ -4,6 +4,8 @@ import enum
 
 import pytest
 
+from flama.client import Client
+from flama.exceptions import ApplicationError
 from flama.injection.exceptions import ComponentNotFound
 
 
@@ -181,12 +183,6 @@ class TestCaseParamsValidation:
             assert param is None
             return {"param": param}
 
-    @pytest.fixture(scope="function", autouse=True)
-    def add_other_endpoints(self, app):
-        @app.route("/empty/", methods=["POST"])
-        def empty(foo):
-            return {}
-
     @pytest.mark.parametrize(
         ["url", "value"],
         [
@@ -267,9 +263,17 @@ class TestCaseParamsValidation:
         response = await client.get("/int-path-param/foo/")
         assert response.status_code == 400
 
-    async def test_no_type_param(self, client):
-        with pytest.raises(ComponentNotFound, match="No component able to handle parameter 'foo' for function 'empty'"):
-            await client.post("/empty/")
+    async def test_no_type_param(self, app):
+        @app.route("/empty/", methods=["POST"])
+        def empty(foo):
+            return {}
+
+        with pytest.raises(ApplicationError, match="Lifespan startup failed") as exc_info:
+            async with Client(app=app):
+                ...
+
+        assert isinstance(exc_info.value.__cause__, ComponentNotFound)
+        assert str(exc_info.value.__cause__) == "No component able to handle parameter 'foo' for function 'empty'"
 
 
 class TestCaseListQueryParamsValidation:
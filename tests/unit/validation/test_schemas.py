@@ -8,7 +8,8 @@ import pytest
 import typesystem
 import typesystem.fields
 
-from flama import types
+from flama import http, types
+from flama.schemas.data_structures import Schema
 from tests._utils import assert_recursive_contains
 
 utc = datetime.timezone.utc
@@ -148,6 +149,11 @@ class TestCaseSchemaValidation:
         ) -> t.Annotated[types.SchemaList, types.SchemaMetadata(product_schema)]:
             return products
 
+        @app.route("/bulk-products", methods=["POST"])
+        async def bulk_products(request: http.Request):
+            products = Schema.from_type(product_schema).validate_stream(request.json_items())
+            return {"names": [product["name"] async for product in products]}
+
         @app.route("/partial-product", methods=["GET"])
         def partial_product(
             product: t.Annotated[types.Schema, types.SchemaMetadata(product_schema, partial=True)],
@@ -261,3 +267,50 @@ class TestCaseSchemaValidation:
         response = await client.request(method, path, json=json_data)
         assert response.status_code == status_code, response.json()
         assert_recursive_contains(expected_output, response.json())
+
+    @pytest.mark.parametrize(
+        ["content", "expected_output", "status_code", "detail"],
+        [
+            pytest.param(b'{"name": "foo", "rating": 0}', {"name": "foo", "rating": 0}, 200, None, id="valid"),
+            pytest.param(b'{"name": "foo", "rating": "bar"}', {"status_code": 400}, 400, None, id="invalid"),
+            pytest.param(b'{"name": "foo",', {"status_code": 400}, 400, "Malformed JSON.", id="malformed"),
+        ],
+    )
+    async def test_schemas_raw_body(self, client, content, expected_output, status_code, detail):
+        response = await client.post("/product", content=content, headers={"content-type": "application/json"})
+
+        assert response.status_code == status_code, response.json()
+        assert_recursive_contains(expected_output, response.json())
+        if detail:
+            assert response.json()["detail"].startswith(detail)
+
+    async def test_schemas_raw_body_null(self, client):
+        response = await client.post("/product", content=b"null", headers={"content-type": "application/json"})
+        expected_response = await client.post("/product", content=b"{}", headers={"content-type": "application/json"})
+
+        assert response.status_code == expected_response.status_code
+        assert response.json() == expected_response.json()
+
+    @pytest.mark.parametrize(
+        ["content", "content_type"],
+        [
+            pytest.param(b'[{"name": "foo", "rating": 0}, {"name": "bar"}]', "application/json", id="array"),
+            pytest.param(b'{"name": "foo", "rating": 0}\n{"name": "bar"}\n', "application/x-ndjson", id="ndjson"),
+        ],
+    )
+    async def test_schemas_streamed_body(self, client, content, content_type):
+        response = await client.post("/bulk-products", content=content, headers={"content-type": content_type})
+
+        assert response.status_code == 200, response.json()
+        assert response.json() == {"names": ["foo", "bar"]}
+
+    async def test_schemas_ndjson_body(self, client):
+        response = await client.request(
+            "get",
+            "/many-products",
+            content=b'{"name": "foo", "rating": 0}\n{"name": "bar"}\n',
+            headers={"content-type": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200, response.json()
+        assert_recursive_contains([{"name": "foo", "rating": 0}, {"name": "bar"}], response.json())